@@ -25,56 +25,284 @@
 # SOFTWARE.
 
 
-import pkgutil
+import asyncio
+import logging
+from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Callable, Coroutine, Iterable, Mapping
+from contextlib import AsyncExitStack
 from datetime import UTC, datetime, timedelta
 from email.utils import parsedate_to_datetime
-from importlib import import_module
-from typing import Any
+from functools import partial
+from types import TracebackType
+from typing import Any, ParamSpec, Self
 
-from pydantic import BaseModel, RootModel
-
-from pydantic_tfl_api import models
+from pydantic import BaseModel
 
 from .async_rest_client import AsyncRestClient
+from .batching import DEFAULT_BATCH_SIZE, chunk_ids, merge_responses
+from .bulk import DEFAULT_CONCURRENCY, acall_as_completed, acall_in_order, check_concurrency
+from .cache import CacheEntry, CachePolicy, CacheState, ResponseCache, build_cache_entry
+from .circuit_breaker import CircuitBreaker, CircuitBreakerRegistry, circuit_key, resolve_circuit_breakers
+from .deserializer import Deserializer, Validation, check_validation, compile_deserializer, resolve_validation
+from .hedging import HedgePolicy
 from .http_client import AsyncHTTPClientBase
+from .model_registry import get_model_registry
 from .package_models import ApiError, ResponseModel
+from .pagination import DEFAULT_PREFETCH, aiter_pages, response_model
+from .rate_limit import RateLimiter, resolve_rate_limiter
 from .response import UnifiedResponse
+from .retry import DEFAULT_RETRY_POLICY, RetryPolicy, categorize_status
+from .routes import Route, compile_route
+from .streaming import AsyncItemStream, aiter_array_items, compile_stream_plan, is_streaming, streaming
+from .timeouts import TimeoutTypes
+
+logger = logging.getLogger(__name__)
+
+P = ParamSpec("P")
 
 
 class AsyncClient:
     """Async base client for generated API clients.
 
     :param str api_token: API token to access TfL unified API
-    :param AsyncHTTPClientBase http_client: Async HTTP client implementation (defaults to AsyncHttpxClient)
+    :param AsyncHTTPClientBase http_client: Async HTTP client implementation (defaults to the shared AsyncHttpxClient,
+        which is left open when this client is closed because other clients may be using it)
+    :param ResponseCache cache: Optional response cache; fresh entries are returned without any I/O
+    :param CachePolicy cache_policy: Stale-while-revalidate / refresh-ahead behaviour for cached entries.
+        Background refreshes run as tasks on the running event loop.
+    :param bool coalesce_requests: Share one HTTP request and result between coroutines that request
+        the same URL at the same time (default True)
+    :param RateLimiter rate_limiter: Optional client-side rate limiter applied before every request. Pass True
+        to share the default limiter for ``api_token`` with every other client using the same key.
+    :param RetryPolicy retry_policy: Retries for transient failures (timeouts, connection errors, 502/503 and
+        429 with Retry-After) with exponential backoff. Pass None to disable retries.
+    :param CircuitBreakerRegistry circuit_breakers: Optional per-API circuit breakers. While the circuit for an
+        API is open, calls return an ApiError with ``error_category="circuit_open"`` without sending a request.
+        Pass True to share one set of circuit breakers with every other client that also passes True.
+    :param Timeout timeout: Timeout for every request made by this client, either in seconds or as a Timeout with
+        separate connect/read/write/pool phases. Replaces the default set with ``set_default_timeout``; the phases
+        that the endpoint config sets for slow operations still apply on top of it. ``override_timeout`` overrides
+        both for a single call.
+    :param str accept_encoding: Accept-Encoding header value. Defaults to gzip and deflate, plus brotli when the
+        ``brotli`` package is installed; pass "identity" to request uncompressed responses.
+    :param str validation: How responses are deserialized. "full" (the default) validates them; "construct" builds
+        the models without validating them; "raw" returns the parsed JSON. Only use "construct"
+        or "raw" for trusted data. ``override_validation`` overrides it for a single call.
+    :param HedgePolicy hedge_policy: Optional policy for latency-critical endpoints: a request still waiting for
+        its response after a high percentile of the endpoint's recent latencies is sent a second time, and the
+        first response is used. The policy caps the share of duplicated requests.
     """
 
-    def __init__(self, api_token: str | None = None, http_client: AsyncHTTPClientBase | None = None):
-        self.client = AsyncRestClient(api_token, http_client)
-        self.models = self._load_models()
+    def __init__(
+        self,
+        api_token: str | None = None,
+        http_client: AsyncHTTPClientBase | None = None,
+        cache: ResponseCache | None = None,
+        cache_policy: CachePolicy | None = None,
+        coalesce_requests: bool = True,
+        rate_limiter: RateLimiter | bool | None = None,
+        retry_policy: RetryPolicy | None = DEFAULT_RETRY_POLICY,
+        circuit_breakers: CircuitBreakerRegistry | bool | None = None,
+        timeout: TimeoutTypes | None = None,
+        accept_encoding: str | None = None,
+        validation: Validation = "full",
+        hedge_policy: HedgePolicy | None = None,
+    ):
+        self.client = AsyncRestClient(
+            api_token,
+            http_client,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            timeout=timeout,
+            accept_encoding=accept_encoding,
+            hedge_policy=hedge_policy,
+        )
+        self.circuit_breakers = resolve_circuit_breakers(circuit_breakers)
+        self.cache = cache
+        self.cache_policy = cache_policy or CachePolicy()
+        self.coalesce_requests = coalesce_requests
+        self._refresh_tasks: dict[str, asyncio.Task[object]] = {}
+        self._in_flight: dict[str, asyncio.Task[ResponseModel | ApiError]] = {}
+        self._waiters: dict[asyncio.Task[ResponseModel | ApiError], int] = {}
+        self.models: Mapping[str, type[BaseModel]] = get_model_registry()
+        self._deserializers: dict[str, Deserializer] = {}
+        self.validation = check_validation(validation)
+
+    async def aclose(self) -> None:
+        """Close the HTTP client passed in as ``http_client``; the shared default client is left open."""
+        await self.client.aclose()
+
+    async def __aenter__(self) -> Self:
+        await self.client.__aenter__()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.client.__aexit__(exc_type, exc_value, traceback)
+
+    async def stream_items(
+        self, operation: Callable[P, Awaitable[object]], *args: P.args, **kwargs: P.kwargs
+    ) -> AsyncItemStream[Any] | ApiError:
+        """Call an endpoint method, returning the items of its response as they are received.
+
+        The response body is parsed incrementally and each item of its array, e.g. every
+        StopPoint of a StopPointsResponse, is deserialized on its own with the client's
+        validation mode, so only one item is held in memory at a time. Streamed responses
+        are not cached or coalesced, and the other fields of the response are skipped.
+
+        :param Callable operation: An endpoint method of this client, e.g. ``client.GetByModeByPathModesQueryPage``
+        :return: An AsyncItemStream of the items, or an ApiError if the request failed
+        :raises ValueError: If the operation's response model does not hold exactly one array of models
+        """
+        with streaming():
+            return await operation(*args, **kwargs)  # type: ignore[return-value]
 
-    def _load_models(self) -> dict[str, type[BaseModel]]:
-        """Load all Pydantic models for deserialization."""
-        models_dict: dict[str, type[BaseModel]] = {}
+    async def call_batched(
+        self,
+        operation: Callable[..., Awaitable[ResponseModel | ApiError]],
+        ids: str | Iterable[str],
+        *args: Any,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_concurrency: int | None = None,
+        **kwargs: Any,
+    ) -> ResponseModel | ApiError:
+        """Call a multi-id endpoint method with any number of ids.
+
+        The ids are split into chunks of ``batch_size``, which the method is called with
+        concurrently in separate tasks; the array responses are merged into one response
+        that expires when the first chunk's response does. Overrides such as
+        ``override_timeout`` apply to every chunk. If a chunk's call raises, the calls still in
+        flight are cancelled and the exception propagates.
+
+        :param Callable operation: An endpoint method taking comma-separated ids as its first argument,
+            e.g. ``client.StatusByIdsByPathIdsQueryDetail``
+        :param ids: The ids, as an iterable or a comma-separated string; repeated ids are requested once
+        :param int batch_size: Maximum number of ids per request
+        :param int max_concurrency: Maximum number of requests in flight at once (default: all chunks)
+        :return: The merged response, or the first ApiError if any chunk failed
+        :raises ValueError: If there are no ids or max_concurrency is less than 1, or the operation's responses
+            do not hold an array
+        """
+        chunks = chunk_ids(ids, batch_size)
+        if not chunks:
+            raise ValueError("ids must contain at least one id")
+        concurrency = check_concurrency(len(chunks) if max_concurrency is None else max_concurrency)
+        results = acall_in_order(partial(operation, **kwargs), ((chunk, *args) for chunk in chunks), concurrency)
+        return merge_responses([result async for result in results])
+
+    async def aiter_all_pages(
+        self,
+        operation: Callable[..., Awaitable[ResponseModel | ApiError]],
+        *args: Any,
+        prefetch: int = DEFAULT_PREFETCH,
+        **kwargs: Any,
+    ) -> AsyncItemStream[Any] | ApiError:
+        """Call a paginated endpoint method for every page, returning the items of all pages in order.
+
+        Page 1 is requested first. Its ``total`` and ``pageSize`` give the number of pages; without them,
+        pages are requested until one is empty or not full. Later pages are fetched ahead in separate
+        tasks, up to ``prefetch`` at a time, while the items of earlier pages are read. Use the stream as
+        an async context manager, or close it, to stop fetching pages when stopping early.
+
+        :param Callable operation: An endpoint method taking a ``page`` argument, e.g.
+            ``client.GetByModeByPathModesQueryPage``
+        :param int prefetch: Maximum number of pages being fetched at a time
+        :return: An AsyncItemStream of the items, or an ApiError if page 1 could not be fetched. If a later
+            page cannot be fetched, iterating raises a PageError holding its ApiError.
+        :raises ValueError: If the operation's response does not hold an array of items
+        """
+        if prefetch < 1:
+            raise ValueError(f"prefetch must be at least 1, not {prefetch}")
+        first = await operation(*args, page=1, **kwargs)
+        if isinstance(first, ApiError):
+            return first
+        tasks: set[asyncio.Task[ResponseModel | ApiError]] = set()
+
+        def submit(page: int) -> asyncio.Task[ResponseModel | ApiError]:
+            task = asyncio.ensure_future(operation(*args, page=page, **kwargs))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+            return task
+
+        async def cancel() -> None:
+            for task in list(tasks):
+                task.cancel()
+
+        return AsyncItemStream(aiter_pages(first, submit, prefetch, response_model(operation)), cancel)
+
+    def map(
+        self,
+        operation: Callable[..., Awaitable[ResponseModel | ApiError]],
+        *iterables: Iterable[Any],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        rate_limiter: RateLimiter | bool | None = None,
+    ) -> AsyncIterator[ResponseModel | ApiError]:
+        """Call an endpoint method for each item of ``iterables``, yielding the results in order.
+
+        Like the builtin ``map``, the method is called with one item of each iterable, e.g.
+        ``client.map(client.ArrivalsByPathId, stop_ids)``; the iterables must have the same length.
+        At most ``concurrency`` calls are in flight at a time, and items are read from the iterables
+        only as calls are started. Results that finish early are held until the ones before them
+        have been yielded; use :meth:`as_completed` to receive each result as soon as it is ready.
+        If a call raises, the calls in flight are cancelled and the exception propagates. Close the
+        iterator, e.g. with ``contextlib.aclosing``, to cancel the calls in flight when stopping early.
+
+        :param Callable operation: An endpoint method of this client
+        :param int concurrency: Maximum number of calls in flight at a time
+        :param RateLimiter rate_limiter: Optional limiter pacing the calls, in addition to the client's own.
+            Pass True to share the default limiter for the client's app key.
+        :return: An async iterator of the results, each a response model or an ApiError
+        """
+        return acall_in_order(
+            operation,
+            zip(*iterables, strict=True),
+            check_concurrency(concurrency),
+            self._bulk_rate_limiter(rate_limiter),
+        )
 
-        # Load models from individual model files
-        for _importer, modname, _ispkg in pkgutil.iter_modules(models.__path__):
-            module = import_module(f"..models.{modname}", __package__)
-            for model_name in dir(module):
-                attr = getattr(module, model_name)
-                if isinstance(attr, type) and issubclass(attr, BaseModel):
-                    models_dict[model_name] = attr
+    def as_completed(
+        self,
+        operation: Callable[..., Awaitable[ResponseModel | ApiError]],
+        *iterables: Iterable[Any],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        rate_limiter: RateLimiter | bool | None = None,
+    ) -> AsyncIterator[tuple[tuple[Any, ...], ResponseModel | ApiError]]:
+        """Call an endpoint method for each item of ``iterables``, yielding the results as they finish.
+
+        Works like :meth:`map`, but each result is yielded as soon as its call finishes, together
+        with the arguments of the call so that it can be matched to its input, e.g.
+        ``async for (stop_id,), arrivals in client.as_completed(client.ArrivalsByPathId, stop_ids)``.
+
+        :param Callable operation: An endpoint method of this client
+        :param int concurrency: Maximum number of calls in flight at a time
+        :param RateLimiter rate_limiter: Optional limiter pacing the calls, in addition to the client's own.
+            Pass True to share the default limiter for the client's app key.
+        :return: An async iterator of (arguments, result) pairs
+        """
+        calls = acall_as_completed(
+            operation,
+            zip(*iterables, strict=True),
+            check_concurrency(concurrency),
+            self._bulk_rate_limiter(rate_limiter),
+        )
 
-        # Also load models imported in the main models module (like GenericResponseModel)
-        for model_name in dir(models):
-            if not model_name.startswith("_"):  # Skip private attributes
-                attr = getattr(models, model_name)
-                if isinstance(attr, type) and issubclass(attr, BaseModel):
-                    models_dict[model_name] = attr
+        async def results() -> AsyncGenerator[tuple[tuple[Any, ...], ResponseModel | ApiError]]:
+            try:
+                async for _, args, result in calls:
+                    yield args, result
+            finally:
+                await calls.aclose()
 
-        # Register core models used for error handling
-        models_dict["ApiError"] = ApiError
+        return results()
 
-        return models_dict
+    def _bulk_rate_limiter(self, rate_limiter: RateLimiter | bool | None) -> RateLimiter | None:
+        app_key = self.client.app_key["app_key"] if self.client.app_key else None
+        limiter = resolve_rate_limiter(rate_limiter, app_key)
+        # the client already takes a token from its own limiter for every request
+        return None if limiter is self.client.rate_limiter else limiter
 
     @staticmethod
     def _parse_int_or_none(value: str) -> int | None:
@@ -126,14 +354,20 @@ class AsyncClient:
         except (TypeError, ValueError):
             return None
 
-    def _deserialize(self, model_name: str, response: UnifiedResponse) -> Any:
+    def _deserialize(self, model_name: str, response: UnifiedResponse, validation: Validation | None = None) -> Any:
         """Deserialize response into a model instance."""
         shared_expiry, result_expiry = self._get_result_expiry(response)
         response_date_time = self._get_datetime_from_response_headers(response)
-        Model = self._get_model(model_name)
-        data = response.json()
-
-        result = self._create_model_instance(Model, data, result_expiry, shared_expiry, response_date_time)
+        deserializer = self._get_deserializer(model_name)
+
+        result = self._create_model_instance(
+            deserializer,
+            response.content,
+            result_expiry,
+            shared_expiry,
+            response_date_time,
+            validation or resolve_validation(self.validation),
+        )
 
         return result
 
@@ -144,33 +378,72 @@ class AsyncClient:
             raise ValueError(f"No model found with name {model_name}")
         return Model
 
+    def _get_deserializer(self, model_name: str) -> Deserializer:
+        """Get the compiled deserializer for a model, compiling it on first use."""
+        deserializer = self._deserializers.get(model_name)
+        if deserializer is None:
+            deserializer = self._deserializers[model_name] = compile_deserializer(self._get_model(model_name))
+        return deserializer
+
     def _create_model_instance(
         self,
-        model: BaseModel,
-        response_json: Any,
+        deserializer: Deserializer,
+        response_content: bytes,
         result_expiry: datetime | None,
         shared_expiry: datetime | None,
         response_date_time: datetime | None,
+        validation: Validation = "full",
     ) -> ResponseModel:
         """Create a ResponseModel instance containing the deserialized content."""
-        is_root_model = isinstance(model, type) and issubclass(model, RootModel)
-
-        # Adjust for root models: RootModel expects one positional argument
-        if is_root_model:
-            if not isinstance(response_json, (list)):
-                response_json = [response_json]
-            content = model(response_json)
-        else:
-            content = model(**response_json) if isinstance(response_json, dict) else model(response_json)
+        # with full validation, pydantic-core parses and validates the raw bytes in one pass,
+        # without building the intermediate dicts and lists that response.json() would
+        content = deserializer(response_content, validation)
 
-        return ResponseModel(
+        # trusted modes skip validating the wrapper too: raw content is not a model
+        build = ResponseModel if validation == "full" else ResponseModel.model_construct
+        return build(
             content_expires=result_expiry,
             shared_expires=shared_expiry,
             content=content,
             response_timestamp=response_date_time,
         )
 
-    def _deserialize_error(self, response: UnifiedResponse) -> ApiError:
+    def _store_in_cache(
+        self, key: str, response: UnifiedResponse, result: ResponseModel, previous: CacheEntry | None = None
+    ) -> None:
+        """Store a successful response in the cache if its headers allow it."""
+        if self.cache is None:
+            return
+        entry = build_cache_entry(result, response.headers, size=len(response.content), previous=previous)
+        if entry is not None:
+            self.cache.set(key, entry)
+
+    def _revalidate_cached(self, key: str, entry: CacheEntry, response: UnifiedResponse) -> ResponseModel:
+        """Reuse a cached response that the API confirmed is unchanged (304 Not Modified)."""
+        shared_expiry, result_expiry = self._get_result_expiry(response)
+        result = entry.response.model_copy(
+            update={
+                "content_expires": result_expiry,
+                "shared_expires": shared_expiry,
+                "response_timestamp": self._get_datetime_from_response_headers(response),
+            }
+        )
+        if self.cache is not None:
+            # a 304 may omit the validators, in which case the cached ones still apply
+            validators = {
+                "Cache-Control": response.headers.get("Cache-Control"),
+                "ETag": response.headers.get("ETag") or entry.etag,
+                "Last-Modified": response.headers.get("Last-Modified") or entry.last_modified,
+            }
+            headers = {name: value for name, value in validators.items() if value is not None}
+            revalidated = build_cache_entry(result, headers, size=entry.size, previous=entry)
+            if revalidated is not None:
+                self.cache.set(key, revalidated)
+            else:
+                self.cache.delete(key)
+        return result
+
+    def _deserialize_error(self, response: UnifiedResponse, retry_count: int = 0) -> ApiError:
         """Deserialize error response into ApiError model."""
         # Get timestamp from Date header, or use current time if not present
         date_header = response.headers.get("Date")
@@ -184,12 +457,28 @@ class AsyncClient:
             http_status=response.reason or "Unknown",
             relative_uri=response.url or "",
             message=response.text or "No response body",
+            retry_count=retry_count,
+            error_category=categorize_status(response.status_code),
+        )
+
+    @staticmethod
+    def _circuit_open_error(breaker: CircuitBreaker, endpoint: str) -> ApiError:
+        """Build the error returned instead of sending a request while a circuit is open."""
+        return ApiError(
+            timestamp_utc=datetime.now(UTC),
+            exception_type="CircuitOpen",
+            http_status_code=503,
+            http_status="Service Unavailable",
+            relative_uri=endpoint,
+            message=f"Circuit breaker is open after repeated failures, retry in {breaker.retry_after():.0f}s",
+            retry_count=0,
+            error_category="circuit_open",
         )
 
     async def _send_request_and_deserialize(
         self,
         base_url: str,
-        endpoint_and_model: dict[str, str],
+        endpoint_and_model: dict[str, Any],
         params: str | float | list[str | int | float] | None = None,
         endpoint_args: dict[str, Any] | None = None,
     ) -> ResponseModel | ApiError:
@@ -197,7 +486,7 @@ class AsyncClient:
 
         Args:
             base_url: The base URL for the API.
-            endpoint_and_model: Dict containing 'uri' and 'model' keys.
+            endpoint_and_model: Dict containing 'uri' and 'model' keys, and optionally a per-operation 'timeout'.
             params: Optional path parameters.
             endpoint_args: Optional query parameters.
 
@@ -209,11 +498,154 @@ class AsyncClient:
         if not isinstance(params, list):
             params = [params]
 
-        endpoint = endpoint_and_model["uri"].format(*params)
-        model_name = endpoint_and_model["model"]
+        route = compile_route(base_url, endpoint_and_model)
+        endpoint = route.path(params)
+        url = route.url(endpoint, endpoint_args)
+
+        validation = resolve_validation(self.validation)
+        if is_streaming():
+            return await self._stream(route, endpoint, url, validation)  # type: ignore[return-value]
+        if self.cache is None and not self.coalesce_requests:
+            return await self._fetch(route, endpoint, url, None, validation)
+
+        # results of different validation modes are different objects: never share them
+        key = url if validation == "full" else f"{url} validation={validation}"
+        cache_key = key if self.cache is not None else None
+
+        def fetch() -> Coroutine[Any, Any, ResponseModel | ApiError]:
+            return self._coalesce(key, lambda: self._fetch(route, endpoint, url, cache_key, validation))
 
-        response = await self.client.send_request(base_url, endpoint, endpoint_args)
+        if cache_key is not None:
+            cached = self._get_from_cache(cache_key, fetch)
+            if cached is not None:
+                return cached
+
+        return await fetch()
+
+    async def _fetch(
+        self,
+        route: Route,
+        endpoint: str,
+        url: str,
+        cache_key: str | None,
+        validation: Validation = "full",
+    ) -> ResponseModel | ApiError:
+        """Send the request, deserialize the response and store it in the cache."""
+        entry = self.cache.get(cache_key) if self.cache is not None and cache_key is not None else None
+        validators = entry.conditional_headers() if entry is not None else None
+        breaker = self._get_circuit_breaker(route, endpoint)
+        if breaker is not None and not breaker.allow_request():
+            return self._circuit_open_error(breaker, endpoint)
+        try:
+            response = await self.client.send(url, headers=validators, timeout=route.timeout, endpoint=route.uri)
+        except Exception as exc:
+            if breaker is not None:
+                breaker.record_exception(exc)
+            raise
+        if breaker is not None:
+            breaker.record_status(response.status_code)
+
+        if response.status_code == 304 and entry is not None and cache_key is not None:
+            return self._revalidate_cached(cache_key, entry, response)
+        if response.status_code != 200:
+            return self._deserialize_error(response, retry_count=response.retry_count)
+        result = self._deserialize(route.model, response, validation)
+        if cache_key is not None:
+            self._store_in_cache(cache_key, response, result, previous=entry)
+        return result
 
+    async def _stream(
+        self, route: Route, endpoint: str, url: str, validation: Validation
+    ) -> AsyncItemStream[Any] | ApiError:
+        """Send the request and return an async stream of the deserialized items of its response."""
+        plan = compile_stream_plan(self._get_model(route.model))
+        deserializer = compile_deserializer(plan.item_model)
+        breaker = self._get_circuit_breaker(route, endpoint)
+        if breaker is not None and not breaker.allow_request():
+            return self._circuit_open_error(breaker, endpoint)
+        stack = AsyncExitStack()
+        try:
+            response = await stack.enter_async_context(self.client.stream(url, timeout=route.timeout))
+        except Exception as exc:
+            if breaker is not None:
+                breaker.record_exception(exc)
+            raise
+        if breaker is not None:
+            breaker.record_status(response.status_code)
         if response.status_code != 200:
-            return self._deserialize_error(response)
-        return self._deserialize(model_name, response)
+            async with stack:
+                return self._deserialize_error(response, retry_count=response.retry_count)
+        items = (
+            deserializer.from_data(item, validation)
+            async for item in aiter_array_items(response.aiter_bytes(), plan.path)
+        )
+        return AsyncItemStream(items, stack.aclose)
+
+    def _get_circuit_breaker(self, route: Route, endpoint: str) -> CircuitBreaker | None:
+        if self.circuit_breakers is None:
+            return None
+        return self.circuit_breakers.get(circuit_key(route.base_url, endpoint))
+
+    async def _coalesce(
+        self, key: str, fetch: Callable[[], Coroutine[Any, Any, ResponseModel | ApiError]]
+    ) -> ResponseModel | ApiError:
+        """Await the in-flight request for ``key``, starting it with ``fetch`` if there is none.
+
+        The request is cancelled once every caller awaiting it has been cancelled.
+        """
+        if not self.coalesce_requests:
+            return await fetch()
+        loop = asyncio.get_running_loop()
+        task = self._in_flight.get(key)
+        if task is None or task.get_loop() is not loop:
+            task = self._in_flight[key] = loop.create_task(fetch())
+            task.add_done_callback(lambda done: self._request_done(key, done))
+        # shield the shared task so that one cancelled caller does not cancel it for the others
+        self._waiters[task] = self._waiters.get(task, 0) + 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            self._waiters[task] -= 1
+            if not self._waiters[task]:
+                del self._waiters[task]
+                # every caller has been cancelled: stop the request instead of leaving it running
+                task.cancel()
+
+    def _request_done(self, key: str, task: asyncio.Task[ResponseModel | ApiError]) -> None:
+        """Forget a finished in-flight request."""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            # mark the exception as retrieved in case every waiter was cancelled
+            task.exception()
+
+    def _get_from_cache(self, key: str, refresh: Callable[[], Coroutine[Any, Any, object]]) -> ResponseModel | None:
+        """Return a servable cached response, scheduling a background refresh if it is (nearly) expired."""
+        if self.cache is None:
+            return None
+        entry = self.cache.get(key)
+        if entry is None:
+            return None
+        entry.hits += 1
+        state = entry.state(self.cache_policy)
+        if state is CacheState.EXPIRED:
+            return None
+        if state is not CacheState.FRESH:
+            self._refresh_in_background(key, refresh)
+        return entry.response
+
+    def _refresh_in_background(self, key: str, refresh: Callable[[], Coroutine[Any, Any, object]]) -> None:
+        """Start a refresh task for ``key`` unless one is already running."""
+        if key in self._refresh_tasks:
+            return
+
+        async def run() -> None:
+            try:
+                await refresh()
+            except Exception:
+                # the cached entry keeps being served until it leaves the stale window
+                logger.warning("Background refresh of %s failed", key, exc_info=True)
+            finally:
+                self._refresh_tasks.pop(key, None)
+
+        self._refresh_tasks[key] = asyncio.get_running_loop().create_task(run())
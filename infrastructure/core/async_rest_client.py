@@ -24,26 +24,73 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from typing import Any
-from urllib.parse import urlencode, urljoin, urlsplit, urlunsplit
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator, Mapping
+from contextlib import AsyncExitStack, asynccontextmanager
+from types import TracebackType
+from typing import Any, Self
 
-from .http_client import AsyncHTTPClientBase, get_default_async_http_client
+from .hedging import HedgePolicy, hedge_endpoint
+from .http_client import (
+    AsyncHTTPClientBase,
+    HTTPResponse,
+    get_default_accept_encoding,
+    get_default_async_http_client,
+)
+from .rate_limit import RateLimiter, resolve_rate_limiter
 from .response import UnifiedResponse
+from .retry import DEFAULT_RETRY_POLICY, RetryPolicy, parse_retry_after
+from .routes import build_url, encode_query
+from .timeouts import Timeout, TimeoutTypes, resolve_timeout
+
+logger = logging.getLogger(__name__)
 
 
 class AsyncRestClient:
     """Async REST client for making asynchronous HTTP requests.
 
     :param str app_key: App key to access TfL unified API
-    :param AsyncHTTPClientBase http_client: Async HTTP client implementation (defaults to AsyncHttpxClient)
+    :param AsyncHTTPClientBase http_client: Async HTTP client implementation (defaults to the shared AsyncHttpxClient,
+        which is left open when this client is closed because other clients may be using it)
+    :param RateLimiter rate_limiter: Optional client-side rate limiter; True shares the default limiter for app_key
+    :param RetryPolicy retry_policy: Which failed requests to retry and how long to wait in between (None disables retries)
+    :param Timeout timeout: Timeout for every request made by this client; per-operation phases apply on top of it
+    :param str accept_encoding: Accept-Encoding header value (defaults to every compression format that can be
+        decoded, see ``get_default_accept_encoding``); pass "identity" to request uncompressed responses
+    :param HedgePolicy hedge_policy: Optional policy sending a duplicate of requests that are slower than usual and
+        using whichever response arrives first; the other request is cancelled
     """
 
-    def __init__(self, app_key: str | None = None, http_client: AsyncHTTPClientBase | None = None) -> None:
+    def __init__(
+        self,
+        app_key: str | None = None,
+        http_client: AsyncHTTPClientBase | None = None,
+        rate_limiter: RateLimiter | bool | None = None,
+        retry_policy: RetryPolicy | None = DEFAULT_RETRY_POLICY,
+        timeout: TimeoutTypes | None = None,
+        accept_encoding: str | None = None,
+        hedge_policy: HedgePolicy | None = None,
+    ) -> None:
         self.app_key = {"app_key": app_key} if app_key else None
+        self.accept_encoding = accept_encoding if accept_encoding is not None else get_default_accept_encoding()
+        self._request_headers = self._get_request_headers()
+        self.rate_limiter = resolve_rate_limiter(rate_limiter, app_key)
+        self.retry_policy = retry_policy
+        self.timeout = Timeout.of(timeout)
         self.http_client = http_client if http_client is not None else get_default_async_http_client()
+        # only a pool passed in by the caller is closed here; the shared default serves every other client too
+        self._closes_http_client = http_client is not None
+        self.hedge_policy = hedge_policy
 
     async def send_request(
-        self, base_url: str, location: str, params: dict[str, Any] | None = None
+        self,
+        base_url: str,
+        location: str,
+        params: dict[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+        timeout: TimeoutTypes | None = None,
     ) -> UnifiedResponse:
         """Send an async HTTP GET request.
 
@@ -51,36 +98,213 @@ class AsyncRestClient:
             base_url: The base URL for the API.
             location: The API endpoint path.
             params: Optional query parameters.
+            headers: Optional extra request headers (e.g. conditional request validators).
+            timeout: Optional per-operation timeout, whose phases replace those of the client's timeout.
+
+        Returns:
+            A UnifiedResponse wrapping the HTTP response.
+        """
+        return await self.send(self.build_url(base_url, location, params), headers=headers, timeout=timeout)
+
+    async def send(
+        self,
+        url: str,
+        headers: Mapping[str, str] | None = None,
+        timeout: TimeoutTypes | None = None,
+        endpoint: str | None = None,
+    ) -> UnifiedResponse:
+        """Send a GET request to a prebuilt URL, retrying transient failures.
+
+        Args:
+            url: The full request URL, as returned by ``build_url``.
+            headers: Optional extra request headers (e.g. conditional request validators).
+            timeout: Optional per-operation timeout, whose phases replace those of the client's timeout.
+            endpoint: Optional URI template of the operation, e.g. ``/StopPoint/{0}/Arrivals``, which the
+                hedging policy selects endpoints and tracks latencies by.
 
         Returns:
             A UnifiedResponse wrapping the HTTP response.
         """
-        request_headers = self._get_request_headers()
-        request_path = urljoin(base_url, location)
-
-        # Build URL using urllib for reliability
-        query_string = self._get_query_strings(params)
-        url_parts = urlsplit(request_path)
-        url = urlunsplit((
-            url_parts.scheme,
-            url_parts.netloc,
-            url_parts.path,
-            query_string,
-            url_parts.fragment,
-        ))
-
-        response = await self.http_client.get(
-            url,
-            headers=request_headers,
-            timeout=30,
-        )
-        return UnifiedResponse(response)
+        request_headers = self._request_headers | headers if headers else self._request_headers.copy()
+        request_timeout = resolve_timeout(self.timeout, timeout)
+
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async()
+            try:
+                response = UnifiedResponse(await self._get(url, request_headers, request_timeout, endpoint))
+            except Exception as exc:
+                delay = self._retry_delay(url, attempt, exc=exc)
+                if delay is None:
+                    raise
+            else:
+                delay = self._retry_delay(url, attempt, response=response)
+                if delay is None:
+                    response.retry_count = attempt
+                    return response
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    @asynccontextmanager
+    async def stream(
+        self,
+        url: str,
+        headers: Mapping[str, str] | None = None,
+        timeout: TimeoutTypes | None = None,
+    ) -> AsyncIterator[UnifiedResponse]:
+        """Send a GET request to a prebuilt URL, reading the response body as it arrives.
+
+        Failed requests are retried like in :meth:`send`. The body of a successful response
+        is left unread for the caller to stream; the body of an error response is read.
+
+        Args:
+            url: The full request URL, as returned by ``build_url``.
+            headers: Optional extra request headers.
+            timeout: Optional per-operation timeout, whose phases replace those of the client's timeout.
+
+        Yields:
+            A UnifiedResponse wrapping the HTTP response, which is closed when the block exits.
+        """
+        request_headers = self._request_headers | headers if headers else self._request_headers.copy()
+        request_timeout = resolve_timeout(self.timeout, timeout)
+
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async()
+            async with AsyncExitStack() as stack:
+                try:
+                    request = self.http_client.stream(url, headers=request_headers, timeout=request_timeout)
+                    response = UnifiedResponse(await stack.enter_async_context(request))
+                except Exception as exc:
+                    delay = self._retry_delay(url, attempt, exc=exc)
+                    if delay is None:
+                        raise
+                else:
+                    if response.status_code != 200:
+                        await response.aread()
+                    delay = self._retry_delay(url, attempt, response=response)
+                    if delay is None:
+                        response.retry_count = attempt
+                        yield response
+                        return
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def _get(
+        self, url: str, headers: Mapping[str, str], timeout: Timeout | None, endpoint: str | None
+    ) -> HTTPResponse:
+        """Send one attempt of a request, hedging it if the hedging policy applies to its endpoint."""
+        policy = self.hedge_policy
+        key = hedge_endpoint(url, endpoint)
+        if policy is None or not policy.applies_to(key):
+            return await self.http_client.get(url, headers=headers, timeout=timeout)
+        started = time.monotonic()
+        delay = policy.delay(key)
+        requests = [asyncio.ensure_future(self.http_client.get(url, headers=headers, timeout=timeout))]
+        try:
+            done, _ = await asyncio.wait(requests, timeout=delay)
+            if not done and policy.try_hedge():
+                logger.debug("Hedging %s after %.3fs", url, delay)
+                requests.append(asyncio.ensure_future(self._send_hedge(url, headers, timeout)))
+            response = await self._first_response(requests)
+        finally:
+            for request in requests:
+                request.cancel()
+        policy.record(key, time.monotonic() - started)
+        return response
+
+    async def _send_hedge(self, url: str, headers: Mapping[str, str], timeout: Timeout | None) -> HTTPResponse:
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async()
+        return await self.http_client.get(url, headers=headers, timeout=timeout)
+
+    @staticmethod
+    async def _first_response(requests: list[asyncio.Future[HTTPResponse]]) -> HTTPResponse:
+        """Return the first response received; the caller cancels the other request.
+
+        A request that fails is ignored while the other one may still succeed; if both fail,
+        the original request's exception is raised.
+        """
+        pending = set(requests)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for request in requests:
+                if request in done and request.exception() is None:
+                    return request.result()
+        return requests[0].result()
+
+    def _retry_delay(
+        self,
+        url: str,
+        attempt: int,
+        response: UnifiedResponse | None = None,
+        exc: Exception | None = None,
+    ) -> float | None:
+        """Return how long to wait before retrying a failed attempt, or None if it is not retried.
+
+        Args:
+            url: The request URL, for logging.
+            attempt: Number of attempts already retried.
+            response: The response of the attempt, if one was received.
+            exc: The exception raised by the attempt, if no response was received.
+        """
+        if self.retry_policy is None:
+            return None
+        if exc is not None:
+            if not self.retry_policy.should_retry_exception(exc, attempt):
+                return None
+            logger.debug("Retrying %s after %s (attempt %d)", url, type(exc).__name__, attempt + 1)
+            return self.retry_policy.backoff(attempt)
+        if response is None or not response.is_error:
+            return None
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if not self.retry_policy.should_retry_status(response.status_code, attempt, retry_after):
+            return None
+        logger.debug("Retrying %s after HTTP %d (attempt %d)", url, response.status_code, attempt + 1)
+        return self.retry_policy.backoff(attempt, retry_after)
+
+    def build_url(self, base_url: str, location: str, params: dict[str, Any] | None = None) -> str:
+        """Build the canonical request URL for an endpoint.
+
+        The same URL is used to send the request and as the response cache key.
+
+        Args:
+            base_url: The base URL for the API.
+            location: The API endpoint path.
+            params: Optional query parameters (None values are dropped).
+
+        Returns:
+            The full request URL including the query string.
+        """
+        return build_url(base_url, location, params)
+
+    async def aclose(self) -> None:
+        """Close the HTTP client passed in as ``http_client``; the shared default client is left open."""
+        if self._closes_http_client:
+            await self.http_client.aclose()
+
+    async def __aenter__(self) -> Self:
+        if self._closes_http_client:
+            await self.http_client.__aenter__()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if self._closes_http_client:
+            await self.http_client.__aexit__(exc_type, exc_value, traceback)
 
     def _get_request_headers(self) -> dict[str, str]:
         """Build request headers including app key if present."""
         request_headers = {
             "Content-Type": "application/json",
             "Accept": "application/json",
+            "Accept-Encoding": self.accept_encoding,
         }
         if self.app_key is not None:
             request_headers |= self.app_key
@@ -88,7 +312,4 @@ class AsyncRestClient:
 
     def _get_query_strings(self, params: dict[str, Any] | None) -> str:
         """Build query string from parameters, excluding None values."""
-        if params is None:
-            params = {}
-        # drop params that are None
-        return urlencode({k: v for k, v in params.items() if v is not None})
+        return encode_query(params)
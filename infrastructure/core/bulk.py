@@ -0,0 +1,173 @@
+# Bulk calls
+# This module runs one endpoint method over many arguments, e.g. the arrivals of every
+# stop of a list, with a bounded number of calls in flight: as asyncio tasks, or on the
+# threads of an executor. Arguments are read lazily and a call starts only when an
+# earlier one finishes, so a long argument list never turns into thousands of pending
+# tasks at once.
+
+import asyncio
+from collections.abc import AsyncGenerator, Awaitable, Callable, Generator, Iterable
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from contextvars import ContextVar, copy_context
+from typing import Any, TypeVar
+
+from .rate_limit import RateLimiter
+
+R = TypeVar("R")
+
+DEFAULT_CONCURRENCY = 10
+"""Calls in flight at a time."""
+
+DEFAULT_MAX_WORKERS = 32
+"""Threads of the pool a sync client creates for its concurrent calls."""
+
+_in_worker: ContextVar[bool] = ContextVar("tfl_bulk_worker", default=False)
+
+
+def check_concurrency(concurrency: int) -> int:
+    """Return ``concurrency`` if it is at least 1, raising ValueError otherwise."""
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be at least 1, not {concurrency}")
+    return concurrency
+
+
+async def acall_as_completed(
+    operation: Callable[..., Awaitable[R]],
+    arguments: Iterable[tuple[Any, ...]],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    rate_limiter: RateLimiter | None = None,
+) -> AsyncGenerator[tuple[int, tuple[Any, ...], R]]:
+    """Call ``operation`` with each tuple of arguments, yielding the results as the calls finish.
+
+    Each result is yielded with the position and the arguments of its call. If a call raises,
+    the calls still in flight are cancelled and the exception propagates.
+
+    :param Callable operation: The coroutine function to call
+    :param Iterable arguments: The positional arguments of each call, read as calls are started
+    :param int concurrency: Maximum number of calls in flight at a time
+    :param RateLimiter rate_limiter: Optional limiter pacing the start of each call
+    """
+
+    async def call(args: tuple[Any, ...]) -> R:
+        if rate_limiter is not None:
+            await rate_limiter.acquire_async()
+        return await operation(*args)
+
+    pending = iter(enumerate(arguments))
+    running: dict[asyncio.Task[R], tuple[int, tuple[Any, ...]]] = {}
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(running) < concurrency:
+                next_call = next(pending, None)
+                if next_call is None:
+                    exhausted = True
+                else:
+                    index, args = next_call
+                    running[asyncio.ensure_future(call(args))] = (index, args)
+            if not running:
+                return
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for index, args, task in sorted((*running.pop(task), task) for task in done):
+                yield index, args, task.result()
+    finally:
+        for task in running:
+            task.cancel()
+
+
+async def acall_in_order(
+    operation: Callable[..., Awaitable[R]],
+    arguments: Iterable[tuple[Any, ...]],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    rate_limiter: RateLimiter | None = None,
+) -> AsyncGenerator[R]:
+    """Like :func:`acall_as_completed`, but yield the results in the order of the arguments.
+
+    Results that finish early are held until the results before them have been yielded.
+    """
+    finished: dict[int, R] = {}
+    next_index = 0
+    async for index, _, result in acall_as_completed(operation, arguments, concurrency, rate_limiter):
+        finished[index] = result
+        while next_index in finished:
+            yield finished.pop(next_index)
+            next_index += 1
+
+
+def _run_in_worker(operation: Callable[..., R], *args: Any, **kwargs: Any) -> R:
+    _in_worker.set(True)  # set in the copied context of this call only
+    return operation(*args, **kwargs)
+
+
+def submit_call(executor: Executor, operation: Callable[..., R], *args: Any, **kwargs: Any) -> Future[R]:
+    """Start calling ``operation`` on ``executor`` in a copy of the caller's context.
+
+    Overrides such as ``override_timeout`` therefore apply to the call. A call made from
+    a thread of the executor, e.g. a batched call inside :func:`call_as_completed`, runs
+    in the calling thread instead: waiting for the pool from one of its own threads could
+    deadlock once every thread is waiting.
+    """
+    if _in_worker.get():
+        future: Future[R] = Future()
+        try:
+            future.set_result(operation(*args, **kwargs))
+        except Exception as exc:
+            future.set_exception(exc)
+        return future
+    return executor.submit(copy_context().run, _run_in_worker, operation, *args, **kwargs)
+
+
+def call_as_completed(
+    executor: Executor,
+    operation: Callable[..., R],
+    arguments: Iterable[tuple[Any, ...]],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    rate_limiter: RateLimiter | None = None,
+) -> Generator[tuple[int, tuple[Any, ...], R]]:
+    """Thread-based variant of :func:`acall_as_completed`, running the calls on ``executor``.
+
+    Calls that have not started when the generator is closed, or when a call raises, are cancelled.
+    """
+
+    def call(*args: Any) -> R:
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+        return operation(*args)
+
+    pending = iter(enumerate(arguments))
+    running: dict[Future[R], tuple[int, tuple[Any, ...]]] = {}
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(running) < concurrency:
+                next_call = next(pending, None)
+                if next_call is None:
+                    exhausted = True
+                else:
+                    index, args = next_call
+                    running[submit_call(executor, call, *args)] = (index, args)
+            if not running:
+                return
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for index, args, future in sorted((*running.pop(future), future) for future in done):
+                yield index, args, future.result()
+    finally:
+        for future in running:
+            future.cancel()
+
+
+def call_in_order(
+    executor: Executor,
+    operation: Callable[..., R],
+    arguments: Iterable[tuple[Any, ...]],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    rate_limiter: RateLimiter | None = None,
+) -> Generator[R]:
+    """Like :func:`call_as_completed`, but yield the results in the order of the arguments."""
+    finished: dict[int, R] = {}
+    next_index = 0
+    for index, _, result in call_as_completed(executor, operation, arguments, concurrency, rate_limiter):
+        finished[index] = result
+        while next_index in finished:
+            yield finished.pop(next_index)
+            next_index += 1
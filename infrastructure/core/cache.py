@@ -0,0 +1,244 @@
+# Response Cache
+# This module provides a pluggable, in-memory cache for deserialized API responses,
+# honouring the expiry times that TfL publishes in its Cache-Control headers.
+
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from enum import Enum
+
+from .package_models import ResponseModel
+
+
+class CacheState(Enum):
+    """How a cached entry may be used, see :meth:`CacheEntry.state`."""
+
+    FRESH = "fresh"
+    """Serve from the cache."""
+    REFRESH_AHEAD = "refresh_ahead"
+    """Serve from the cache and refresh in the background because the entry is about to expire."""
+    STALE = "stale"
+    """Expired but within the stale-while-revalidate window: serve and refresh in the background."""
+    EXPIRED = "expired"
+    """Must be fetched again before it can be served."""
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """Controls how clients use cached entries around their expiry time.
+
+    :param float stale_while_revalidate: Seconds after ``content_expires`` during which the stale
+        response is returned immediately while a fresh copy is fetched in the background
+    :param float refresh_ahead: Seconds before ``content_expires`` at which hot entries are
+        re-fetched in the background, so that they never expire while in use
+    :param int hot_threshold: Number of cache hits after which an entry counts as hot
+    """
+
+    stale_while_revalidate: float = 0.0
+    refresh_ahead: float = 0.0
+    hot_threshold: int = 2
+
+
+@dataclass
+class CacheEntry:
+    """A cached, already-deserialized response.
+
+    :param ResponseModel response: The deserialized response returned to callers
+    :param datetime expires: When the entry stops being fresh (``ResponseModel.content_expires``)
+    :param int size: Approximate size of the response body in bytes, used for size-bounded eviction
+    :param int hits: Number of times the entry has been served from the cache
+    :param str etag: The response's ``ETag`` validator, sent back as ``If-None-Match``
+    :param str last_modified: The response's ``Last-Modified`` validator, sent back as ``If-Modified-Since``
+    """
+
+    response: ResponseModel
+    expires: datetime | None
+    size: int = 0
+    hits: int = 0
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def is_fresh(self, now: datetime | None = None) -> bool:
+        """Check whether the entry can be served without contacting the API."""
+        return self.state(now=now) is CacheState.FRESH
+
+    def state(self, policy: CachePolicy | None = None, now: datetime | None = None) -> CacheState:
+        """Classify the entry according to its expiry time and ``policy``."""
+        if self.expires is None:
+            return CacheState.EXPIRED
+        policy = policy or _DEFAULT_POLICY
+        now = now or datetime.now(UTC)
+        expires = self.expires if self.expires.tzinfo is not None else self.expires.replace(tzinfo=UTC)
+        if now < expires:
+            if (
+                policy.refresh_ahead > 0
+                and self.hits >= policy.hot_threshold
+                and expires - now <= timedelta(seconds=policy.refresh_ahead)
+            ):
+                return CacheState.REFRESH_AHEAD
+            return CacheState.FRESH
+        if now < expires + timedelta(seconds=policy.stale_while_revalidate):
+            return CacheState.STALE
+        return CacheState.EXPIRED
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Request headers that ask the API to revalidate this entry (answering 304 if unchanged)."""
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+_DEFAULT_POLICY = CachePolicy()
+
+
+class ResponseCache(ABC):
+    """Abstract base class for response caches.
+
+    Keys are canonical request URLs (see ``RestClient.build_url``). Implementations
+    must be safe to use from multiple threads, as one cache may be shared by several
+    API clients.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> CacheEntry | None:
+        """Return the entry stored under ``key``, or None if there is none."""
+        ...
+
+    @abstractmethod
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Store ``entry`` under ``key``, replacing any existing entry."""
+        ...
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove the entry stored under ``key``, if any."""
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all entries."""
+        ...
+
+
+class LRUResponseCache(ResponseCache):
+    """Thread-safe in-memory cache with least-recently-used eviction.
+
+    The cache is bounded by number of entries and, optionally, by the total size
+    of the cached response bodies. When either bound is exceeded the least
+    recently used entries are evicted.
+
+    :param int max_entries: Maximum number of entries to keep (None for unbounded)
+    :param int max_size: Maximum total size in bytes of cached response bodies (None for unbounded)
+    """
+
+    def __init__(self, max_entries: int | None = 1024, max_size: int | None = None) -> None:
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        if self.max_size is not None and entry.size > self.max_size:
+            # never cache an entry that could not fit on its own
+            self.delete(key)
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous.size
+            self._entries[key] = entry
+            self._size += entry.size
+            self._evict()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._size -= entry.size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    @property
+    def size(self) -> int:
+        """Total size in bytes of the cached response bodies."""
+        return self._size
+
+    def _evict(self) -> None:
+        while self._entries and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_size is not None and self._size > self.max_size)
+        ):
+            _key, evicted = self._entries.popitem(last=False)
+            self._size -= evicted.size
+
+
+def cache_control_directives(cache_control: str | None) -> set[str]:
+    """Return the lower-cased directive names in a Cache-Control header (e.g. ``{"public", "max-age"}``)."""
+    if not cache_control:
+        return set()
+    return {directive.strip().split("=")[0].lower() for directive in cache_control.split(",")}
+
+
+def build_cache_entry(
+    response: ResponseModel,
+    headers: Mapping[str, str],
+    size: int,
+    previous: CacheEntry | None = None,
+) -> CacheEntry | None:
+    """Build the cache entry for a response, or None if it must not be cached.
+
+    Responses marked ``no-store`` are never cached. Responses that are not fresh
+    (no ``max-age``, or ``no-cache``) are only kept if they carry an ``ETag`` or
+    ``Last-Modified`` validator, so that they can be revalidated cheaply.
+    After a 304 Not Modified, pass the merged validators of the old entry and
+    the 304 response in ``headers``.
+
+    Args:
+        response: The deserialized response.
+        headers: The HTTP response headers.
+        size: Approximate size of the response body in bytes.
+        previous: The entry being replaced, whose hit count is carried over.
+
+    Returns:
+        A CacheEntry, or None if the response should not be cached.
+    """
+    directives = cache_control_directives(headers.get("Cache-Control"))
+    if "no-store" in directives:
+        return None
+    expires = None if "no-cache" in directives else response.content_expires
+    etag = headers.get("ETag")
+    last_modified = headers.get("Last-Modified")
+    if expires is None and etag is None and last_modified is None:
+        return None
+    return CacheEntry(
+        response=response,
+        expires=expires,
+        size=size,
+        # carry the hit count over so refreshed hot entries stay hot
+        hits=previous.hits if previous is not None else 0,
+        etag=etag,
+        last_modified=last_modified,
+    )
@@ -0,0 +1,182 @@
+# Circuit Breaker
+# This module stops clients from sending requests to a TfL API that keeps failing,
+# so that callers fail fast instead of waiting for every request to time out.
+
+import threading
+import time
+from enum import Enum
+from urllib.parse import urlsplit
+
+from .retry import categorize_exception, categorize_status
+
+FAILURE_CATEGORIES = frozenset({"timeout", "network", "server_error"})
+"""Error categories that count as a failure of the upstream API."""
+
+
+class CircuitState(Enum):
+    """State of a :class:`CircuitBreaker`."""
+
+    CLOSED = "closed"
+    """Requests are sent normally."""
+    OPEN = "open"
+    """Requests fail fast without being sent."""
+    HALF_OPEN = "half_open"
+    """A limited number of probe requests are sent to check whether the API has recovered."""
+
+
+class CircuitBreaker:
+    """Thread-safe circuit breaker for a single API.
+
+    The circuit opens after ``failure_threshold`` consecutive failures. While it is
+    open, requests are rejected without being sent. After ``recovery_timeout``
+    seconds it becomes half-open and lets ``half_open_max_calls`` probe requests
+    through: a successful probe closes the circuit, a failed one opens it again.
+
+    :param int failure_threshold: Consecutive failures after which the circuit opens
+    :param float recovery_timeout: Seconds the circuit stays open before probe requests are allowed
+    :param int half_open_max_calls: Number of probe requests allowed at a time while half-open
+    """
+
+    def __init__(
+        self, failure_threshold: int = 5, recovery_timeout: float = 30.0, half_open_max_calls: int = 1
+    ) -> None:
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        if half_open_max_calls < 1:
+            raise ValueError("half_open_max_calls must be at least 1")
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self._probe_started = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> CircuitState:
+        """The current state, moving from open to half-open once ``recovery_timeout`` has passed."""
+        with self._lock:
+            return self._current_state()
+
+    def _current_state(self) -> CircuitState:
+        if self._state is CircuitState.OPEN and time.monotonic() - self._opened_at >= self.recovery_timeout:
+            self._state = CircuitState.HALF_OPEN
+            self._probes = 0
+        return self._state
+
+    def allow_request(self) -> bool:
+        """Check whether a request may be sent, counting it as a probe while half-open."""
+        with self._lock:
+            state = self._current_state()
+            if state is CircuitState.CLOSED:
+                return True
+            if state is CircuitState.OPEN:
+                return False
+            now = time.monotonic()
+            if self._probes >= self.half_open_max_calls and now - self._probe_started >= self.recovery_timeout:
+                # a probe never reported back (e.g. it was cancelled): let another one through
+                self._probes = 0
+            if self._probes >= self.half_open_max_calls:
+                return False
+            self._probes += 1
+            self._probe_started = now
+            return True
+
+    def retry_after(self) -> float:
+        """Return the number of seconds until the circuit lets probe requests through."""
+        with self._lock:
+            if self._current_state() is not CircuitState.OPEN:
+                return 0.0
+            return max(0.0, self._opened_at + self.recovery_timeout - time.monotonic())
+
+    def record_success(self) -> None:
+        """Record a request that reached a healthy API, closing the circuit."""
+        with self._lock:
+            self._state = CircuitState.CLOSED
+            self._failures = 0
+
+    def record_failure(self) -> None:
+        """Record a failed request, opening the circuit once the threshold is reached."""
+        with self._lock:
+            state = self._current_state()
+            self._failures += 1
+            if state is CircuitState.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = CircuitState.OPEN
+                self._opened_at = time.monotonic()
+
+    def record_status(self, status_code: int) -> None:
+        """Record the outcome of a request from its final HTTP status."""
+        if categorize_status(status_code) in FAILURE_CATEGORIES:
+            self.record_failure()
+        else:
+            self.record_success()
+
+    def record_exception(self, exc: BaseException) -> None:
+        """Record a request that raised ``exc``; only timeouts and connection errors count as failures."""
+        if categorize_exception(exc) in FAILURE_CATEGORIES:
+            self.record_failure()
+
+
+def circuit_key(base_url: str, uri: str) -> str:
+    """Return the circuit breaker key for an endpoint: the base URL plus the API name.
+
+    TfL serves every API from the same host, so endpoints are grouped by the first
+    segment of their URI template, e.g. ``https://api.tfl.gov.uk/Journey`` for
+    ``/Journey/JourneyResults/{0}/to/{1}``.
+    """
+    api = urlsplit(uri).path.lstrip("/").split("/", 1)[0]
+    return f"{base_url.rstrip('/')}/{api}"
+
+
+class CircuitBreakerRegistry:
+    """Creates and holds one :class:`CircuitBreaker` per API, keyed by :func:`circuit_key`.
+
+    :param int failure_threshold: Consecutive failures after which a circuit opens
+    :param float recovery_timeout: Seconds a circuit stays open before probe requests are allowed
+    :param int half_open_max_calls: Number of probe requests allowed at a time while half-open
+    """
+
+    def __init__(
+        self, failure_threshold: int = 5, recovery_timeout: float = 30.0, half_open_max_calls: int = 1
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> CircuitBreaker:
+        """Return the circuit breaker for ``key``, creating it on first use."""
+        with self._lock:
+            breaker = self._breakers.get(key)
+            if breaker is None:
+                breaker = self._breakers[key] = CircuitBreaker(
+                    self.failure_threshold, self.recovery_timeout, self.half_open_max_calls
+                )
+            return breaker
+
+
+_shared_registry: CircuitBreakerRegistry | None = None
+_shared_registry_lock = threading.Lock()
+
+
+def get_shared_circuit_breakers() -> CircuitBreakerRegistry:
+    """Return the process-wide circuit breakers, shared by every client created with ``circuit_breakers=True``."""
+    global _shared_registry
+    with _shared_registry_lock:
+        if _shared_registry is None:
+            _shared_registry = CircuitBreakerRegistry()
+        return _shared_registry
+
+
+def resolve_circuit_breakers(
+    circuit_breakers: CircuitBreakerRegistry | bool | None,
+) -> CircuitBreakerRegistry | None:
+    """Turn a client's ``circuit_breakers`` argument into a registry (True selects the shared registry)."""
+    if circuit_breakers is True:
+        return get_shared_circuit_breakers()
+    if circuit_breakers is False or circuit_breakers is None:
+        return None
+    return circuit_breakers
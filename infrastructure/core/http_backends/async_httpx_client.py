@@ -1,12 +1,17 @@
 # httpx-based Async HTTP Client Implementation
 # This module provides an asynchronous HTTP client implementation using the httpx library.
 
-from collections.abc import Mapping
-from typing import Any
+import asyncio
+from collections.abc import AsyncIterator, Mapping
+from contextlib import asynccontextmanager
+from types import TracebackType
+from typing import Any, Self
 
 import httpx
 
 from ..http_client import AsyncHTTPClientBase, HTTPResponse
+from ..timeouts import Timeout
+from .httpx_client import _ensure_http2_available, _httpx_timeout
 
 
 class AsyncHttpxResponse:
@@ -36,6 +41,11 @@ class AsyncHttpxResponse:
         """Response body as text."""
         return self._response.text
 
+    @property
+    def content(self) -> bytes:
+        """Response body as bytes, decompressed according to Content-Encoding."""
+        return self._response.content
+
     @property
     def url(self) -> str:
         """The URL of the request."""
@@ -54,34 +64,160 @@ class AsyncHttpxResponse:
         """Raise an exception if the response indicates an error."""
         self._response.raise_for_status()
 
+    def aiter_bytes(self, chunk_size: int | None = None) -> AsyncIterator[bytes]:
+        """Iterate over the decompressed body of a streamed response as it arrives."""
+        return self._response.aiter_bytes(chunk_size)
+
+    async def aread(self) -> bytes:
+        """Read the rest of a streamed response, so that ``content``, ``text`` and ``json()`` can be used."""
+        return await self._response.aread()
+
 
 class AsyncHttpxClient(AsyncHTTPClientBase):
     """Asynchronous HTTP client implementation using the httpx library.
 
-    This HTTP client provides async HTTP requests using httpx,
-    enabling high-performance concurrent API calls.
+    The client owns a single pooled ``httpx.AsyncClient`` that is reused by
+    every request, so concurrent calls (e.g. ``asyncio.gather`` over many
+    endpoint calls) share keep-alive connections and, with ``http2=True``,
+    multiplex over a single connection per host.
+
+    The pool is created on first use inside the running event loop. If the
+    client is later used from a different event loop (for example successive
+    ``asyncio.run`` calls) a fresh pool is created for that loop. When used
+    as an async context manager the pool is reference counted: it is closed
+    when the last ``async with`` block exits, which lets several API clients
+    share one instance safely. :meth:`aclose` closes the pool immediately;
+    the next request opens a new one.
+
+    API clients created without an ``http_client`` use the process-wide
+    instance returned by :func:`get_shared_async_httpx_client`. They never
+    close it, since other clients may have requests in flight on it.
+
+    :param int max_connections: Maximum number of concurrent connections in the pool
+    :param int max_keepalive_connections: Maximum number of idle connections kept alive
+    :param float keepalive_expiry: Seconds an idle connection is kept before being closed
+    :param bool http2: Enable HTTP/2 multiplexing (requires ``pip install httpx[http2]``)
     """
 
+    def __init__(
+        self,
+        max_connections: int | None = 100,
+        max_keepalive_connections: int | None = 20,
+        keepalive_expiry: float | None = 5.0,
+        http2: bool = False,
+    ) -> None:
+        if http2:
+            _ensure_http2_available()
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = http2
+        self._client: httpx.AsyncClient | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._context_depth = 0
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The pooled ``httpx.AsyncClient`` for the running event loop, created on first access."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._loop is not loop:
+            if self._client is not None and self._loop is not loop:
+                _discard_pool(self._client, self._loop)
+            self._client = httpx.AsyncClient(limits=self.limits, http2=self.http2)
+            self._loop = loop
+        return self._client
+
     async def get(
         self,
         url: str,
         headers: dict[str, str] | None = None,
-        timeout: int | None = None,
+        timeout: float | Timeout | None = None,
     ) -> HTTPResponse:
-        """Send an async GET request using the httpx library.
+        """Send an async GET request using the pooled httpx client.
 
         Args:
             url: The URL to send the request to (should include query parameters).
             headers: Optional headers to include in the request.
-            timeout: Request timeout in seconds. Defaults to 30 if not specified.
+            timeout: Request timeout in seconds, or a Timeout with separate connect/read/write/pool
+                phases. Defaults to 30 seconds if not specified.
 
         Returns:
             An AsyncHttpxResponse object wrapping the httpx.Response.
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                url,
-                headers=headers,
-                timeout=timeout if timeout is not None else 30,
-            )
-            return AsyncHttpxResponse(response)
+        response = await self.client.get(
+            url,
+            headers=headers,
+            timeout=_httpx_timeout(timeout),
+        )
+        return AsyncHttpxResponse(response)
+
+    @asynccontextmanager
+    async def stream(
+        self,
+        url: str,
+        headers: dict[str, str] | None = None,
+        timeout: float | Timeout | None = None,
+    ) -> AsyncIterator[HTTPResponse]:
+        """Send an async GET request using the pooled httpx client, reading the body as it arrives.
+
+        Args:
+            url: The URL to send the request to (should include query parameters).
+            headers: Optional headers to include in the request.
+            timeout: Request timeout in seconds, or a Timeout with separate connect/read/write/pool
+                phases. Defaults to 30 seconds if not specified.
+
+        Yields:
+            An AsyncHttpxResponse object wrapping the unread httpx.Response.
+        """
+        async with self.client.stream("GET", url, headers=headers, timeout=_httpx_timeout(timeout)) as response:
+            yield AsyncHttpxResponse(response)
+
+    async def aclose(self) -> None:
+        """Close the pooled httpx client and release its connections."""
+        client, self._client = self._client, None
+        loop, self._loop = self._loop, None
+        if client is None:
+            return
+        if loop is asyncio.get_running_loop():
+            await client.aclose()
+        else:
+            _discard_pool(client, loop)
+
+    async def __aenter__(self) -> Self:
+        self._context_depth += 1
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self._context_depth -= 1
+        if self._context_depth <= 0:
+            self._context_depth = 0
+            await self.aclose()
+
+
+def _discard_pool(client: httpx.AsyncClient, loop: asyncio.AbstractEventLoop | None) -> None:
+    """Release a pool bound to another event loop, which cannot be awaited from the running one.
+
+    If that loop is still running (in another thread) the pool is closed there. Otherwise the
+    loop has stopped and nothing can await the pool any more, so it is dropped and its sockets
+    are closed when it is garbage collected.
+    """
+    if loop is not None and loop.is_running() and not loop.is_closed():
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+
+
+_shared_client: AsyncHttpxClient | None = None
+
+
+def get_shared_async_httpx_client() -> AsyncHttpxClient:
+    """Return the process-wide AsyncHttpxClient used by async API clients by default."""
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = AsyncHttpxClient()
+    return _shared_client
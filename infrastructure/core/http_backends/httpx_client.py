@@ -1,12 +1,16 @@
 # httpx-based HTTP Client Implementation (Synchronous)
 # This module provides a synchronous HTTP client implementation using the httpx library.
 
-from collections.abc import Mapping
+import importlib.util
+import threading
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
 from typing import Any
 
 import httpx
 
 from ..http_client import HTTPClientBase, HTTPResponse
+from ..timeouts import Timeout
 
 
 class HttpxResponse:
@@ -37,6 +41,11 @@ class HttpxResponse:
         """Response body as text."""
         return self._response.text
 
+    @property
+    def content(self) -> bytes:
+        """Response body as bytes, decompressed according to Content-Encoding."""
+        return self._response.content
+
     @property
     def url(self) -> str:
         """The URL of the request."""
@@ -55,33 +64,123 @@ class HttpxResponse:
         """Raise an exception if the response indicates an error."""
         self._response.raise_for_status()
 
+    def iter_bytes(self, chunk_size: int | None = None) -> Iterator[bytes]:
+        """Iterate over the decompressed body of a streamed response as it arrives."""
+        return self._response.iter_bytes(chunk_size)
+
+    def read(self) -> bytes:
+        """Read the rest of a streamed response, so that ``content``, ``text`` and ``json()`` can be used."""
+        return self._response.read()
+
 
 class HttpxClient(HTTPClientBase):
     """Synchronous HTTP client implementation using the httpx library.
 
-    This HTTP client provides synchronous HTTP requests using httpx,
-    offering better performance and connection pooling compared to requests.
+    The client owns a long-lived ``httpx.Client`` so that TCP and TLS
+    connections to the TfL API are kept alive and reused between requests.
+    The underlying client is created on first use and is safe to share
+    between threads. Call :meth:`close` (or use the client as a context
+    manager) to release pooled connections; a closed client transparently
+    opens a new pool if it is used again.
+
+    :param int max_connections: Maximum number of concurrent connections in the pool
+    :param int max_keepalive_connections: Maximum number of idle connections kept alive
+    :param float keepalive_expiry: Seconds an idle connection is kept before being closed
+    :param bool http2: Enable HTTP/2 (requires the ``h2`` package, ``pip install httpx[http2]``)
     """
 
+    def __init__(
+        self,
+        max_connections: int | None = 100,
+        max_keepalive_connections: int | None = 20,
+        keepalive_expiry: float | None = 5.0,
+        http2: bool = False,
+    ) -> None:
+        if http2:
+            _ensure_http2_available()
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = http2
+        self._client: httpx.Client | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def client(self) -> httpx.Client:
+        """The pooled ``httpx.Client``, created on first access."""
+        client = self._client
+        if client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = httpx.Client(limits=self.limits, http2=self.http2)
+                client = self._client
+        return client
+
     def get(
         self,
         url: str,
         headers: dict[str, str] | None = None,
-        timeout: int | None = None,
+        timeout: float | Timeout | None = None,
     ) -> HTTPResponse:
-        """Send a GET request using the httpx library.
+        """Send a GET request using the pooled httpx client.
 
         Args:
             url: The URL to send the request to (should include query parameters).
             headers: Optional headers to include in the request.
-            timeout: Request timeout in seconds. Defaults to 30 if not specified.
+            timeout: Request timeout in seconds, or a Timeout with separate connect/read/write/pool
+                phases. Defaults to 30 seconds if not specified.
 
         Returns:
             An HttpxResponse object wrapping the httpx.Response.
         """
-        response = httpx.get(
+        response = self.client.get(
             url,
             headers=headers,
-            timeout=timeout if timeout is not None else 30,
+            timeout=_httpx_timeout(timeout),
         )
         return HttpxResponse(response)
+
+    @contextmanager
+    def stream(
+        self,
+        url: str,
+        headers: dict[str, str] | None = None,
+        timeout: float | Timeout | None = None,
+    ) -> Iterator[HTTPResponse]:
+        """Send a GET request using the pooled httpx client, reading the body as it arrives.
+
+        Args:
+            url: The URL to send the request to (should include query parameters).
+            headers: Optional headers to include in the request.
+            timeout: Request timeout in seconds, or a Timeout with separate connect/read/write/pool
+                phases. Defaults to 30 seconds if not specified.
+
+        Yields:
+            An HttpxResponse object wrapping the unread httpx.Response.
+        """
+        with self.client.stream("GET", url, headers=headers, timeout=_httpx_timeout(timeout)) as response:
+            yield HttpxResponse(response)
+
+    def close(self) -> None:
+        """Close the pooled httpx client and release its connections."""
+        with self._lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
+
+
+def _ensure_http2_available() -> None:
+    """Raise a helpful ImportError if HTTP/2 support is not installed."""
+    if importlib.util.find_spec("h2") is None:
+        raise ImportError("HTTP/2 support requires the 'h2' package. Install it with: pip install httpx[http2]")
+
+
+def _httpx_timeout(timeout: float | Timeout | None) -> float | httpx.Timeout:
+    """Convert a timeout into the value httpx expects, defaulting to 30 seconds."""
+    if timeout is None:
+        return 30
+    if isinstance(timeout, Timeout):
+        return httpx.Timeout(connect=timeout.connect, read=timeout.read, write=timeout.write, pool=timeout.pool)
+    return timeout
@@ -1,13 +1,22 @@
 # Requests-based HTTP Client Implementation
 # This module provides an HTTP client implementation using the requests library.
 
-from collections.abc import Mapping
+import json
+import threading
+import weakref
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
 from typing import Any
 
 import requests
 from requests import Response
+from requests.adapters import HTTPAdapter
 
 from ..http_client import HTTPClientBase, HTTPResponse
+from ..timeouts import Timeout
+
+# requests reads a streamed body in chunks of this many bytes (httpx yields what it receives)
+STREAM_CHUNK_SIZE = 64 * 1024
 
 
 class RequestsResponse:
@@ -38,6 +47,11 @@ class RequestsResponse:
         """Response body as text."""
         return self._response.text
 
+    @property
+    def content(self) -> bytes:
+        """Response body as bytes, decompressed according to Content-Encoding."""
+        return self._response.content
+
     @property
     def url(self) -> str:
         """The URL of the request."""
@@ -49,40 +63,132 @@ class RequestsResponse:
         return self._response.reason or ""
 
     def json(self) -> Any:
-        """Parse response body as JSON."""
-        return self._response.json()
+        """Parse response body as JSON.
+
+        The decompressed bytes are parsed directly, without decoding them into a ``str`` first.
+        """
+        return json.loads(self._response.content)
 
     def raise_for_status(self) -> None:
         """Raise an exception if the response indicates an error."""
         self._response.raise_for_status()
 
+    def iter_bytes(self, chunk_size: int | None = None) -> Iterator[bytes]:
+        """Iterate over the decompressed body of a streamed response as it arrives."""
+        return self._response.iter_content(chunk_size or STREAM_CHUNK_SIZE)
+
+    def read(self) -> bytes:
+        """Read the rest of a streamed response, so that ``content``, ``text`` and ``json()`` can be used."""
+        return self._response.content
+
 
 class RequestsClient(HTTPClientBase):
     """HTTP client implementation using the requests library.
 
-    This is the default HTTP client for the library, providing synchronous
-    HTTP requests using the popular requests library.
+    Requests are sent through ``requests.Session`` objects so connections are
+    kept alive and reused. A single ``HTTPAdapter`` (and therefore a single
+    urllib3 connection pool) is shared by all threads, while each thread gets
+    its own ``Session`` so that no session state (cookies, etc.) is shared.
+    This makes one instance safe to use from a thread pool. A thread's session
+    is released when the thread ends.
+
+    :param int pool_connections: Number of host pools to cache in the adapter
+    :param int pool_maxsize: Maximum number of connections kept per host pool
+    :param bool pool_block: Block when the pool is exhausted instead of opening extra connections
     """
 
+    def __init__(
+        self,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+    ) -> None:
+        self.adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        self._local = threading.local()
+        # weak references only: the thread-local holds each session, so it goes away with its thread
+        self._sessions: weakref.WeakSet[requests.Session] = weakref.WeakSet()
+        self._lock = threading.Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        """The calling thread's session, created on first access."""
+        session: requests.Session | None = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.mount("https://", self.adapter)
+            session.mount("http://", self.adapter)
+            self._local.session = session
+            with self._lock:
+                self._sessions.add(session)
+        return session
+
     def get(
         self,
         url: str,
         headers: dict[str, str] | None = None,
-        timeout: int | None = None,
+        timeout: float | Timeout | None = None,
     ) -> HTTPResponse:
-        """Send a GET request using the requests library.
+        """Send a GET request using the calling thread's session.
 
         Args:
             url: The URL to send the request to (should include query parameters).
             headers: Optional headers to include in the request.
-            timeout: Request timeout in seconds. Defaults to 30 if not specified.
+            timeout: Request timeout in seconds, or a Timeout (requests only supports the connect and
+                read phases). Defaults to 30 seconds if not specified.
 
         Returns:
             A RequestsResponse object wrapping the requests.Response.
         """
-        response = requests.get(
+        response = self.session.get(
             url,
             headers=headers,
-            timeout=timeout if timeout is not None else 30,
+            timeout=_requests_timeout(timeout),
         )
         return RequestsResponse(response)
+
+    @contextmanager
+    def stream(
+        self,
+        url: str,
+        headers: dict[str, str] | None = None,
+        timeout: float | Timeout | None = None,
+    ) -> Iterator[HTTPResponse]:
+        """Send a GET request using the calling thread's session, reading the body as it arrives.
+
+        Args:
+            url: The URL to send the request to (should include query parameters).
+            headers: Optional headers to include in the request.
+            timeout: Request timeout in seconds, or a Timeout (requests only supports the connect and
+                read phases). Defaults to 30 seconds if not specified.
+
+        Yields:
+            A RequestsResponse object wrapping the unread requests.Response.
+        """
+        response = self.session.get(url, headers=headers, timeout=_requests_timeout(timeout), stream=True)
+        try:
+            yield RequestsResponse(response)
+        finally:
+            response.close()
+
+    def close(self) -> None:
+        """Close all sessions and the shared connection pool."""
+        with self._lock:
+            sessions, self._sessions = list(self._sessions), weakref.WeakSet()
+        for session in sessions:
+            session.close()
+        self.adapter.close()
+        # sessions are closed, so every thread (including this one) starts a new one on next use
+        self._local = threading.local()
+
+
+def _requests_timeout(timeout: float | Timeout | None) -> float | tuple[float | None, float | None]:
+    """Convert a timeout into the value requests expects, defaulting to 30 seconds."""
+    if timeout is None:
+        return 30
+    if isinstance(timeout, Timeout):
+        return (timeout.connect, timeout.read)
+    return timeout
@@ -56,7 +56,10 @@ class ApiError(BaseModel):
     retry_count: int | None = Field(None, description="Number of retries attempted")
     error_category: str | None = Field(
         None,
-        description="Error category: network, authentication, rate_limit, client_error, server_error, timeout, unknown",
+        description=(
+            "Error category: network, authentication, rate_limit, client_error, server_error, timeout, "
+            "circuit_open, unknown"
+        ),
     )
 
     @field_validator("timestamp_utc", mode="before")
@@ -21,11 +21,27 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from typing import Any
-from urllib.parse import urlencode, urljoin, urlsplit, urlunsplit
+import logging
+import threading
+import time
+from collections.abc import Iterator, Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import ExitStack, contextmanager
+from types import TracebackType
+from typing import Any, Self
 
-from .http_client import HTTPClientBase, get_default_http_client
+from .hedging import HedgePolicy, hedge_endpoint
+from .http_client import HTTPClientBase, HTTPResponse, get_default_accept_encoding, get_default_http_client
+from .rate_limit import RateLimiter, resolve_rate_limiter
 from .response import UnifiedResponse
+from .retry import DEFAULT_RETRY_POLICY, RetryPolicy, parse_retry_after
+from .routes import build_url, encode_query
+from .timeouts import Timeout, TimeoutTypes, resolve_timeout
+
+logger = logging.getLogger(__name__)
+
+HEDGE_MAX_WORKERS = 64
+"""Threads sending the duplicates of hedged requests."""
 
 
 class RestClient:
@@ -33,47 +49,273 @@ class RestClient:
 
     :param str app_key: App key to access TfL unified API
     :param HTTPClientBase http_client: HTTP client implementation (defaults to HttpxClient)
+    :param RateLimiter rate_limiter: Optional client-side rate limiter; True shares the default limiter for app_key
+    :param RetryPolicy retry_policy: Which failed requests to retry and how long to wait in between (None disables retries)
+    :param Timeout timeout: Timeout for every request made by this client; per-operation phases apply on top of it
+    :param str accept_encoding: Accept-Encoding header value (defaults to every compression format that can be
+        decoded, see ``get_default_accept_encoding``); pass "identity" to request uncompressed responses
+    :param HedgePolicy hedge_policy: Optional policy sending a duplicate of requests that are slower than usual and
+        using whichever response arrives first. Each hedged request is sent from a thread of its own and its
+        duplicate from a thread pool owned by the client.
     """
 
-    def __init__(self, app_key: str | None = None, http_client: HTTPClientBase | None = None) -> None:
+    def __init__(
+        self,
+        app_key: str | None = None,
+        http_client: HTTPClientBase | None = None,
+        rate_limiter: RateLimiter | bool | None = None,
+        retry_policy: RetryPolicy | None = DEFAULT_RETRY_POLICY,
+        timeout: TimeoutTypes | None = None,
+        accept_encoding: str | None = None,
+        hedge_policy: HedgePolicy | None = None,
+    ) -> None:
         self.app_key = {"app_key": app_key} if app_key else None
+        self.accept_encoding = accept_encoding if accept_encoding is not None else get_default_accept_encoding()
+        self._request_headers = self._get_request_headers()
+        self.rate_limiter = resolve_rate_limiter(rate_limiter, app_key)
+        self.retry_policy = retry_policy
+        self.timeout = Timeout.of(timeout)
         self.http_client = http_client if http_client is not None else get_default_http_client()
+        self.hedge_policy = hedge_policy
+        self._hedge_executor: ThreadPoolExecutor | None = None
+        self._hedge_executor_lock = threading.Lock()
 
     def send_request(
-        self, base_url: str, location: str, params: dict[str, Any] | None = None
+        self,
+        base_url: str,
+        location: str,
+        params: dict[str, Any] | None = None,
+        headers: Mapping[str, str] | None = None,
+        timeout: TimeoutTypes | None = None,
+    ) -> UnifiedResponse:
+        return self.send(self.build_url(base_url, location, params), headers=headers, timeout=timeout)
+
+    def send(
+        self,
+        url: str,
+        headers: Mapping[str, str] | None = None,
+        timeout: TimeoutTypes | None = None,
+        endpoint: str | None = None,
     ) -> UnifiedResponse:
-        request_headers = self._get_request_headers()
-        request_path = urljoin(base_url, location)
-
-        # Build URL using urllib for reliability
-        query_string = self._get_query_strings(params)
-        url_parts = urlsplit(request_path)
-        url = urlunsplit((
-            url_parts.scheme,
-            url_parts.netloc,
-            url_parts.path,
-            query_string,
-            url_parts.fragment,
-        ))
-
-        response = self.http_client.get(
-            url,
-            headers=request_headers,
-            timeout=30,
-        )
-        return UnifiedResponse(response)
+        """Send a GET request to a prebuilt URL, retrying transient failures.
+
+        Args:
+            url: The full request URL, as returned by ``build_url``.
+            headers: Optional extra request headers (e.g. conditional request validators).
+            timeout: Optional per-operation timeout, whose phases replace those of the client's timeout.
+            endpoint: Optional URI template of the operation, e.g. ``/StopPoint/{0}/Arrivals``, which the
+                hedging policy selects endpoints and tracks latencies by.
+
+        Returns:
+            A UnifiedResponse wrapping the HTTP response.
+        """
+        request_headers = self._request_headers | headers if headers else self._request_headers.copy()
+        request_timeout = resolve_timeout(self.timeout, timeout)
+
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            try:
+                response = UnifiedResponse(self._get(url, request_headers, request_timeout, endpoint))
+            except Exception as exc:
+                delay = self._retry_delay(url, attempt, exc=exc)
+                if delay is None:
+                    raise
+            else:
+                delay = self._retry_delay(url, attempt, response=response)
+                if delay is None:
+                    response.retry_count = attempt
+                    return response
+            attempt += 1
+            time.sleep(delay)
+
+    @contextmanager
+    def stream(
+        self,
+        url: str,
+        headers: Mapping[str, str] | None = None,
+        timeout: TimeoutTypes | None = None,
+    ) -> Iterator[UnifiedResponse]:
+        """Send a GET request to a prebuilt URL, reading the response body as it arrives.
+
+        Failed requests are retried like in :meth:`send`. The body of a successful response
+        is left unread for the caller to stream; the body of an error response is read.
+
+        Args:
+            url: The full request URL, as returned by ``build_url``.
+            headers: Optional extra request headers.
+            timeout: Optional per-operation timeout, whose phases replace those of the client's timeout.
+
+        Yields:
+            A UnifiedResponse wrapping the HTTP response, which is closed when the block exits.
+        """
+        request_headers = self._request_headers | headers if headers else self._request_headers.copy()
+        request_timeout = resolve_timeout(self.timeout, timeout)
+
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            with ExitStack() as stack:
+                try:
+                    request = self.http_client.stream(url, headers=request_headers, timeout=request_timeout)
+                    response = UnifiedResponse(stack.enter_context(request))
+                except Exception as exc:
+                    delay = self._retry_delay(url, attempt, exc=exc)
+                    if delay is None:
+                        raise
+                else:
+                    if response.status_code != 200:
+                        response.read()
+                    delay = self._retry_delay(url, attempt, response=response)
+                    if delay is None:
+                        response.retry_count = attempt
+                        yield response
+                        return
+            attempt += 1
+            time.sleep(delay)
+
+    def _get(self, url: str, headers: Mapping[str, str], timeout: Timeout | None, endpoint: str | None) -> HTTPResponse:
+        """Send one attempt of a request, hedging it if the hedging policy applies to its endpoint."""
+        policy = self.hedge_policy
+        key = hedge_endpoint(url, endpoint)
+        if policy is None or not policy.applies_to(key):
+            return self.http_client.get(url, headers=headers, timeout=timeout)
+        delay = policy.delay(key)
+        # the request gets a thread of its own, so that it is never queued behind the hedges of other requests
+        request: Future[HTTPResponse] = Future()
+        request.set_running_or_notify_cancel()
+        threading.Thread(
+            target=self._send_hedged, args=(request, policy, key, url, headers, timeout), name="tfl-hedged", daemon=True
+        ).start()
+        requests = [request]
+        done, _ = wait(requests, timeout=delay)
+        if not done and policy.try_hedge():
+            logger.debug("Hedging %s after %.3fs", url, delay)
+            requests.append(self._get_hedge_executor().submit(self._send_hedge, url, headers, timeout))
+        return self._first_response(requests)
+
+    def _send_hedged(
+        self,
+        request: Future[HTTPResponse],
+        policy: HedgePolicy,
+        key: str,
+        url: str,
+        headers: Mapping[str, str],
+        timeout: Timeout | None,
+    ) -> None:
+        """Send a hedged request, recording its latency even when its hedge answers first."""
+        started = time.monotonic()
+        try:
+            response = self.http_client.get(url, headers=headers, timeout=timeout)
+        except BaseException as exc:
+            request.set_exception(exc)
+        else:
+            policy.record(key, time.monotonic() - started)
+            request.set_result(response)
+
+    def _send_hedge(self, url: str, headers: Mapping[str, str], timeout: Timeout | None) -> HTTPResponse:
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        return self.http_client.get(url, headers=headers, timeout=timeout)
+
+    @staticmethod
+    def _first_response(requests: list[Future[HTTPResponse]]) -> HTTPResponse:
+        """Return the first response received, abandoning the other request.
+
+        A request that fails is ignored while the other one may still succeed; if both fail,
+        the original request's exception is raised.
+        """
+        pending = set(requests)
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for request in requests:
+                if request in done and request.exception() is None:
+                    for other in pending:
+                        other.cancel()  # a request that has started cannot be cancelled: its response is dropped
+                    return request.result()
+        return requests[0].result()
+
+    def _get_hedge_executor(self) -> ThreadPoolExecutor:
+        with self._hedge_executor_lock:
+            if self._hedge_executor is None:
+                self._hedge_executor = ThreadPoolExecutor(max_workers=HEDGE_MAX_WORKERS, thread_name_prefix="tfl-hedge")
+            return self._hedge_executor
+
+    def _retry_delay(
+        self,
+        url: str,
+        attempt: int,
+        response: UnifiedResponse | None = None,
+        exc: Exception | None = None,
+    ) -> float | None:
+        """Return how long to wait before retrying a failed attempt, or None if it is not retried.
+
+        Args:
+            url: The request URL, for logging.
+            attempt: Number of attempts already retried.
+            response: The response of the attempt, if one was received.
+            exc: The exception raised by the attempt, if no response was received.
+        """
+        if self.retry_policy is None:
+            return None
+        if exc is not None:
+            if not self.retry_policy.should_retry_exception(exc, attempt):
+                return None
+            logger.debug("Retrying %s after %s (attempt %d)", url, type(exc).__name__, attempt + 1)
+            return self.retry_policy.backoff(attempt)
+        if response is None or not response.is_error:
+            return None
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if not self.retry_policy.should_retry_status(response.status_code, attempt, retry_after):
+            return None
+        logger.debug("Retrying %s after HTTP %d (attempt %d)", url, response.status_code, attempt + 1)
+        return self.retry_policy.backoff(attempt, retry_after)
+
+    def build_url(self, base_url: str, location: str, params: dict[str, Any] | None = None) -> str:
+        """Build the canonical request URL for an endpoint.
+
+        The same URL is used to send the request and as the response cache key.
+
+        Args:
+            base_url: The base URL for the API.
+            location: The API endpoint path.
+            params: Optional query parameters (None values are dropped).
+
+        Returns:
+            The full request URL including the query string.
+        """
+        return build_url(base_url, location, params)
+
+    def close(self) -> None:
+        """Close the underlying HTTP client and release pooled connections."""
+        with self._hedge_executor_lock:
+            executor, self._hedge_executor = self._hedge_executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+        self.http_client.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
 
     def _get_request_headers(self) -> dict[str, str]:
         request_headers = {
             "Content-Type": "application/json",
             "Accept": "application/json",
+            "Accept-Encoding": self.accept_encoding,
         }
         if self.app_key is not None:
             request_headers |= self.app_key
         return request_headers
 
     def _get_query_strings(self, params: dict[str, Any] | None) -> str:
-        if params is None:
-            params = {}
-        # drop params that are None
-        return urlencode({k: v for k, v in params.items() if v is not None})
+        return encode_query(params)
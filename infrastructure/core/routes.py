@@ -0,0 +1,94 @@
+# Routes
+# This module compiles the endpoint entries of the generated ``endpoints/*_config.py``
+# tables into immutable Route objects, so that request URLs are built in one pass
+# instead of running urljoin/urlsplit/urlunsplit on every call.
+
+import re
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any
+from urllib.parse import quote_plus, urljoin, urlsplit, urlunsplit
+
+from .timeouts import timeout_phases
+
+# characters that urlsplit/urljoin treat specially: such paths take the slow path so the
+# resulting URL is exactly the one build_url would produce
+_NEEDS_URLJOIN = re.compile(r"^//|[?#\t\r\n]|/\.")
+
+
+@lru_cache(maxsize=4096)
+def _quote(value: str) -> str:
+    return quote_plus(value)
+
+
+def encode_query(params: Mapping[str, Any] | None) -> str:
+    """Encode query parameters like ``urlencode``, dropping None values.
+
+    Parameter names and values repeat between calls, so their percent-encoded
+    forms are cached.
+    """
+    if not params:
+        return ""
+    return "&".join(
+        f"{_quote(str(key))}={quote_plus(value) if isinstance(value, bytes) else _quote(str(value))}"
+        for key, value in params.items()
+        if value is not None
+    )
+
+
+def build_url(base_url: str, location: str, params: Mapping[str, Any] | None = None) -> str:
+    """Join ``location`` onto ``base_url`` and replace the query string with ``params``."""
+    url_parts = urlsplit(urljoin(base_url, location))
+    return urlunsplit((url_parts.scheme, url_parts.netloc, url_parts.path, encode_query(params), url_parts.fragment))
+
+
+@dataclass(frozen=True, slots=True)
+class Route:
+    """An endpoint config entry compiled for building request URLs.
+
+    :param str base_url: Base URL of the API
+    :param str uri: Path template, formatted with the positional path parameters
+    :param str model: Name of the model the response is deserialized into
+    :param Mapping timeout: The timeout phases set for the operation, applied on top of the client's timeout
+    :param str origin: Scheme and host of ``base_url``, or None when ``uri`` is not an absolute path
+    """
+
+    base_url: str
+    uri: str
+    model: str
+    timeout: Mapping[str, float | None] | None
+    origin: str | None
+
+    def path(self, params: Sequence[Any] = ()) -> str:
+        """Format the path template with the positional path parameters."""
+        return self.uri.format(*params) if params else self.uri
+
+    def url(self, path: str, query: Mapping[str, Any] | None = None) -> str:
+        """Build the full request URL for a formatted ``path`` and its query parameters."""
+        if self.origin is None or _NEEDS_URLJOIN.search(path):
+            return build_url(self.base_url, path, query)
+        query_string = encode_query(query)
+        return f"{self.origin}{path}?{query_string}" if query_string else f"{self.origin}{path}"
+
+
+_routes: dict[tuple[str, str, str], Route] = {}
+
+
+def compile_route(base_url: str, endpoint_and_model: Mapping[str, Any]) -> Route:
+    """Return the Route for an endpoint config entry, compiling it on first use."""
+    uri = endpoint_and_model["uri"]
+    model = endpoint_and_model["model"]
+    key = (base_url, uri, model)
+    route = _routes.get(key)
+    if route is None:
+        parts = urlsplit(base_url)
+        route = _routes[key] = Route(
+            base_url=base_url,
+            uri=uri,
+            model=model,
+            timeout=MappingProxyType(timeout_phases(endpoint_and_model.get("timeout"))) or None,
+            origin=f"{parts.scheme}://{parts.netloc}" if uri.startswith("/") and parts.netloc else None,
+        )
+    return route
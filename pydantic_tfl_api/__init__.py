@@ -1,35 +1,40 @@
-from .endpoints import (
-    LineClient,
-    AirQualityClient,
-    OccupancyClient,
-    VehicleClient,
-    CrowdingClient,
-    BikePointClient,
-    SearchClient,
-    AccidentStatsClient,
-    JourneyClient,
-    RoadClient,
-    PlaceClient,
-    ModeClient,
-    StopPointClient,
-    LiftDisruptionsClient,
-    AsyncLineClient,
-    AsyncAirQualityClient,
-    AsyncOccupancyClient,
-    AsyncVehicleClient,
-    AsyncCrowdingClient,
-    AsyncBikePointClient,
-    AsyncSearchClient,
-    AsyncAccidentStatsClient,
-    AsyncJourneyClient,
-    AsyncRoadClient,
-    AsyncPlaceClient,
-    AsyncModeClient,
-    AsyncStopPointClient,
-    AsyncLiftDisruptionsClient,
-)
+from typing import TYPE_CHECKING
+
 from . import models
-from .core import __version__
+from .core import __version__, warmup
+from .core.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .endpoints import (
+        LineClient,
+        AirQualityClient,
+        OccupancyClient,
+        VehicleClient,
+        CrowdingClient,
+        BikePointClient,
+        SearchClient,
+        AccidentStatsClient,
+        JourneyClient,
+        RoadClient,
+        PlaceClient,
+        ModeClient,
+        StopPointClient,
+        LiftDisruptionsClient,
+        AsyncLineClient,
+        AsyncAirQualityClient,
+        AsyncOccupancyClient,
+        AsyncVehicleClient,
+        AsyncCrowdingClient,
+        AsyncBikePointClient,
+        AsyncSearchClient,
+        AsyncAccidentStatsClient,
+        AsyncJourneyClient,
+        AsyncRoadClient,
+        AsyncPlaceClient,
+        AsyncModeClient,
+        AsyncStopPointClient,
+        AsyncLiftDisruptionsClient,
+    )
 
 __all__ = [
     "LineClient",
@@ -61,5 +66,39 @@ __all__ = [
     "AsyncStopPointClient",
     "AsyncLiftDisruptionsClient",
     "models",
+    "warmup",
     "__version__",
 ]
+
+_CLIENT_MODULES = {
+    "LineClient": ".endpoints",
+    "AirQualityClient": ".endpoints",
+    "OccupancyClient": ".endpoints",
+    "VehicleClient": ".endpoints",
+    "CrowdingClient": ".endpoints",
+    "BikePointClient": ".endpoints",
+    "SearchClient": ".endpoints",
+    "AccidentStatsClient": ".endpoints",
+    "JourneyClient": ".endpoints",
+    "RoadClient": ".endpoints",
+    "PlaceClient": ".endpoints",
+    "ModeClient": ".endpoints",
+    "StopPointClient": ".endpoints",
+    "LiftDisruptionsClient": ".endpoints",
+    "AsyncLineClient": ".endpoints",
+    "AsyncAirQualityClient": ".endpoints",
+    "AsyncOccupancyClient": ".endpoints",
+    "AsyncVehicleClient": ".endpoints",
+    "AsyncCrowdingClient": ".endpoints",
+    "AsyncBikePointClient": ".endpoints",
+    "AsyncSearchClient": ".endpoints",
+    "AsyncAccidentStatsClient": ".endpoints",
+    "AsyncJourneyClient": ".endpoints",
+    "AsyncRoadClient": ".endpoints",
+    "AsyncPlaceClient": ".endpoints",
+    "AsyncModeClient": ".endpoints",
+    "AsyncStopPointClient": ".endpoints",
+    "AsyncLiftDisruptionsClient": ".endpoints",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _CLIENT_MODULES)
@@ -1,6 +1,10 @@
 from .async_client import AsyncClient
 from .async_rest_client import AsyncRestClient
+from .cache import CacheEntry, CachePolicy, CacheState, LRUResponseCache, ResponseCache
+from .circuit_breaker import CircuitBreaker, CircuitBreakerRegistry, CircuitState, get_shared_circuit_breakers
 from .client import Client
+from .deserializer import Validation, override_validation
+from .hedging import HedgePolicy
 from .http_backends import AsyncHttpxClient, HttpxClient
 from .http_client import (
     AsyncHTTPClientBase,
@@ -9,9 +13,15 @@ from .http_client import (
     get_default_async_http_client,
     get_default_http_client,
 )
+from .model_registry import ModelRegistry, get_model_registry, warmup
 from .package_models import ApiError, GenericResponseModel, ResponseModel
+from .pagination import PageError
+from .rate_limit import RateLimiter, get_shared_rate_limiter
 from .response import UnifiedResponse
 from .rest_client import RestClient
+from .retry import RetryPolicy
+from .streaming import AsyncItemStream, ItemStream
+from .timeouts import Timeout, get_default_timeout, override_timeout, set_default_timeout
 
 # Optional requests import - only available if requests is installed
 try:
@@ -44,6 +54,31 @@ __all__ = [
     "HttpxClient",
     "AsyncHttpxClient",
     "UnifiedResponse",
+    "ResponseCache",
+    "LRUResponseCache",
+    "CacheEntry",
+    "CachePolicy",
+    "CacheState",
+    "RateLimiter",
+    "get_shared_rate_limiter",
+    "RetryPolicy",
+    "CircuitBreaker",
+    "CircuitBreakerRegistry",
+    "CircuitState",
+    "get_shared_circuit_breakers",
+    "HedgePolicy",
+    "Timeout",
+    "get_default_timeout",
+    "set_default_timeout",
+    "override_timeout",
+    "Validation",
+    "override_validation",
+    "ItemStream",
+    "AsyncItemStream",
+    "PageError",
+    "ModelRegistry",
+    "get_model_registry",
+    "warmup",
     "get_default_http_client",
     "get_default_async_http_client",
     "__version__",
@@ -0,0 +1,70 @@
+# Batching
+# This module splits long id lists into the chunks accepted by TfL's comma-separated
+# id endpoints (e.g. /Line/{ids}/Status, "Max. approx. 20 ids") and merges the
+# responses to the chunks back into one response.
+
+from collections.abc import Iterable, Sequence
+from datetime import datetime
+from typing import Any
+
+from pydantic import RootModel
+
+from .package_models import ApiError, ResponseModel
+
+DEFAULT_BATCH_SIZE = 20
+"""Ids per request: TfL documents its multi-id endpoints as taking "Max. approx. 20 ids"."""
+
+
+def chunk_ids(ids: str | Iterable[str], batch_size: int = DEFAULT_BATCH_SIZE) -> list[str]:
+    """Split ids into comma-separated chunks of at most ``batch_size`` ids.
+
+    Blank and repeated ids are dropped; the order of the others is kept.
+
+    :param ids: The ids, as an iterable or a comma-separated string
+    :param int batch_size: Maximum number of ids per chunk
+    :raises ValueError: If ``batch_size`` is less than 1
+    """
+    if batch_size < 1:
+        raise ValueError(f"batch_size must be at least 1, not {batch_size}")
+    if isinstance(ids, str):
+        ids = ids.split(",")
+    unique = list(dict.fromkeys(id_.strip() for id_ in ids if id_.strip()))
+    return [",".join(unique[start : start + batch_size]) for start in range(0, len(unique), batch_size)]
+
+
+def _earliest(values: Iterable[datetime | None]) -> datetime | None:
+    known = [value for value in values if value is not None]
+    return min(known) if known else None
+
+
+def _merge_content(contents: Sequence[Any]) -> Any:
+    first = contents[0]
+    if isinstance(first, list):  # "raw" validation
+        return [item for content in contents for item in content]
+    if isinstance(first, RootModel) and isinstance(first.root, list):
+        # the items are already deserialized: build the merged model without validating them again
+        return type(first).model_construct([item for content in contents for item in content.root])
+    raise ValueError(f"{type(first).__name__} responses cannot be merged: they do not hold an array")
+
+
+def merge_responses(results: Sequence[ResponseModel | ApiError]) -> ResponseModel | ApiError:
+    """Merge the responses to the chunks of a batched call into one response.
+
+    The arrays of the responses are concatenated in order. The merged response expires
+    when the first of them does, and its timestamp is that of the oldest response.
+
+    :param Sequence results: The responses, in chunk order
+    :return: The merged response, or the first ApiError if any chunk failed
+    :raises ValueError: If the responses do not hold arrays
+    """
+    responses: list[ResponseModel] = []
+    for result in results:
+        if isinstance(result, ApiError):
+            return result
+        responses.append(result)
+    return ResponseModel.model_construct(
+        content_expires=_earliest(response.content_expires for response in responses),
+        shared_expires=_earliest(response.shared_expires for response in responses),
+        response_timestamp=_earliest(response.response_timestamp for response in responses),
+        content=_merge_content([response.content for response in responses]),
+    )
@@ -23,55 +23,322 @@
 # SOFTWARE.
 
 
-import pkgutil
+import logging
+import threading
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from contextlib import ExitStack
 from datetime import UTC, datetime, timedelta
 from email.utils import parsedate_to_datetime
-from importlib import import_module
-from typing import Any
-
-from pydantic import BaseModel, RootModel
-
-from pydantic_tfl_api import models
-
+from functools import partial
+from types import TracebackType
+from typing import Any, ParamSpec, Self
+
+from pydantic import BaseModel
+
+from .batching import DEFAULT_BATCH_SIZE, chunk_ids, merge_responses
+from .bulk import (
+    DEFAULT_CONCURRENCY,
+    DEFAULT_MAX_WORKERS,
+    call_as_completed,
+    call_in_order,
+    check_concurrency,
+    submit_call,
+)
+from .cache import CacheEntry, CachePolicy, CacheState, ResponseCache, build_cache_entry
+from .circuit_breaker import CircuitBreaker, CircuitBreakerRegistry, circuit_key, resolve_circuit_breakers
+from .deserializer import Deserializer, Validation, check_validation, compile_deserializer, resolve_validation
+from .hedging import HedgePolicy
 from .http_client import HTTPClientBase
+from .model_registry import get_model_registry
 from .package_models import ApiError, ResponseModel
+from .pagination import DEFAULT_PREFETCH, iter_pages, response_model
+from .rate_limit import RateLimiter, resolve_rate_limiter
 from .response import UnifiedResponse
 from .rest_client import RestClient
+from .retry import DEFAULT_RETRY_POLICY, RetryPolicy, categorize_status
+from .routes import Route, compile_route
+from .streaming import ItemStream, compile_stream_plan, is_streaming, iter_array_items, streaming
+from .timeouts import TimeoutTypes
+
+logger = logging.getLogger(__name__)
+
+P = ParamSpec("P")
 
 
 class Client:
     """Client
 
+    A client is safe to share between threads. Its connection pool, cache, rate limiter and circuit
+    breakers are thread-safe, and the state of each request (URL, headers, timeout, validation mode)
+    is local to the call. Concurrent calls made by :meth:`map`, :meth:`as_completed`,
+    :meth:`call_batched` and :meth:`iter_all_pages` run on the client's thread pool.
+
     :param str api_token: API token to access TfL unified API
     :param HTTPClientBase http_client: HTTP client implementation (defaults to RequestsClient)
+    :param ResponseCache cache: Optional response cache; fresh entries are returned without any I/O
+    :param CachePolicy cache_policy: Stale-while-revalidate / refresh-ahead behaviour for cached entries.
+        Background refreshes run in daemon threads.
+    :param bool coalesce_requests: Share one HTTP request and result between threads that request
+        the same URL at the same time (default True)
+    :param RateLimiter rate_limiter: Optional client-side rate limiter applied before every request. Pass True
+        to share the default limiter for ``api_token`` with every other client using the same key.
+    :param RetryPolicy retry_policy: Retries for transient failures (timeouts, connection errors, 502/503 and
+        429 with Retry-After) with exponential backoff. Pass None to disable retries.
+    :param CircuitBreakerRegistry circuit_breakers: Optional per-API circuit breakers. While the circuit for an
+        API is open, calls return an ApiError with ``error_category="circuit_open"`` without sending a request.
+        Pass True to share one set of circuit breakers with every other client that also passes True.
+    :param Timeout timeout: Timeout for every request made by this client, either in seconds or as a Timeout with
+        separate connect/read/write/pool phases. Replaces the default set with ``set_default_timeout``; the phases
+        that the endpoint config sets for slow operations still apply on top of it. ``override_timeout`` overrides
+        both for a single call.
+    :param str accept_encoding: Accept-Encoding header value. Defaults to gzip and deflate, plus brotli when the
+        ``brotli`` package is installed; pass "identity" to request uncompressed responses.
+    :param str validation: How responses are deserialized. "full" (the default) validates them; "construct" builds
+        the models without validating them; "raw" returns the parsed JSON. Only use "construct"
+        or "raw" for trusted data. ``override_validation`` overrides it for a single call.
+    :param Executor executor: Thread pool running concurrent calls. Defaults to a pool of up to 32 threads,
+        created on first use and shut down by ``close``; an executor passed in is left running.
+    :param HedgePolicy hedge_policy: Optional policy for latency-critical endpoints: a request still waiting for
+        its response after a high percentile of the endpoint's recent latencies is sent a second time, and the
+        first response is used. The policy caps the share of duplicated requests.
     """
 
-    def __init__(self, api_token: str | None = None, http_client: HTTPClientBase | None = None):
-        self.client = RestClient(api_token, http_client)
-        self.models = self._load_models()
+    def __init__(
+        self,
+        api_token: str | None = None,
+        http_client: HTTPClientBase | None = None,
+        cache: ResponseCache | None = None,
+        cache_policy: CachePolicy | None = None,
+        coalesce_requests: bool = True,
+        rate_limiter: RateLimiter | bool | None = None,
+        retry_policy: RetryPolicy | None = DEFAULT_RETRY_POLICY,
+        circuit_breakers: CircuitBreakerRegistry | bool | None = None,
+        timeout: TimeoutTypes | None = None,
+        accept_encoding: str | None = None,
+        validation: Validation = "full",
+        executor: Executor | None = None,
+        hedge_policy: HedgePolicy | None = None,
+    ):
+        self.client = RestClient(
+            api_token,
+            http_client,
+            rate_limiter=rate_limiter,
+            retry_policy=retry_policy,
+            timeout=timeout,
+            accept_encoding=accept_encoding,
+            hedge_policy=hedge_policy,
+        )
+        self.circuit_breakers = resolve_circuit_breakers(circuit_breakers)
+        self.cache = cache
+        self.cache_policy = cache_policy or CachePolicy()
+        self.coalesce_requests = coalesce_requests
+        self._refreshing: set[str] = set()
+        self._refreshing_lock = threading.Lock()
+        self._in_flight: dict[str, Future[ResponseModel | ApiError]] = {}
+        self._in_flight_lock = threading.Lock()
+        self.models: Mapping[str, type[BaseModel]] = get_model_registry()
+        self._deserializers: dict[str, Deserializer] = {}
+        self.validation = check_validation(validation)
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._executor_lock = threading.Lock()
+
+    def close(self) -> None:
+        """Close the underlying HTTP client and release pooled connections, and shut down the client's thread pool."""
+        self.client.close()
+        with self._executor_lock:
+            executor, owned = self._executor, self._owns_executor
+            if owned:
+                self._executor = None
+        if owned and executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _get_executor(self) -> Executor:
+        """Return the thread pool running concurrent calls, creating it on first use."""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=DEFAULT_MAX_WORKERS, thread_name_prefix="tfl-client")
+            return self._executor
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def stream_items(
+        self, operation: Callable[P, object], *args: P.args, **kwargs: P.kwargs
+    ) -> ItemStream[Any] | ApiError:
+        """Call an endpoint method, returning the items of its response as they are received.
+
+        The response body is parsed incrementally and each item of its array, e.g. every
+        StopPoint of a StopPointsResponse, is deserialized on its own with the client's
+        validation mode, so only one item is held in memory at a time. Streamed responses
+        are not cached or coalesced, and the other fields of the response are skipped.
+
+        :param Callable operation: An endpoint method of this client, e.g. ``client.GetByModeByPathModesQueryPage``
+        :return: An ItemStream of the items, or an ApiError if the request failed
+        :raises ValueError: If the operation's response model does not hold exactly one array of models
+        """
+        with streaming():
+            return operation(*args, **kwargs)  # type: ignore[return-value]
+
+    def call_batched(
+        self,
+        operation: Callable[..., ResponseModel | ApiError],
+        ids: str | Iterable[str],
+        *args: Any,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_concurrency: int | None = None,
+        **kwargs: Any,
+    ) -> ResponseModel | ApiError:
+        """Call a multi-id endpoint method with any number of ids.
+
+        The ids are split into chunks of ``batch_size``, which the method is called with
+        concurrently on the client's thread pool; the array responses are merged into one response
+        that expires when the first chunk's response does. Overrides such as
+        ``override_timeout`` apply to every chunk.
+
+        :param Callable operation: An endpoint method taking comma-separated ids as its first argument,
+            e.g. ``client.StatusByIdsByPathIdsQueryDetail``
+        :param ids: The ids, as an iterable or a comma-separated string; repeated ids are requested once
+        :param int batch_size: Maximum number of ids per request
+        :param int max_concurrency: Maximum number of requests in flight at once (default: all chunks)
+        :return: The merged response, or the first ApiError if any chunk failed
+        :raises ValueError: If there are no ids or max_concurrency is less than 1, or the operation's responses
+            do not hold an array
+        """
+        chunks = chunk_ids(ids, batch_size)
+        if not chunks:
+            raise ValueError("ids must contain at least one id")
+        concurrency = check_concurrency(len(chunks) if max_concurrency is None else max_concurrency)
+        if len(chunks) == 1:
+            return merge_responses([operation(chunks[0], *args, **kwargs)])
+        results = call_in_order(
+            self._get_executor(), partial(operation, **kwargs), ((chunk, *args) for chunk in chunks), concurrency
+        )
+        return merge_responses(list(results))
 
-    def _load_models(self) -> dict[str, type[BaseModel]]:
-        models_dict: dict[str, type[BaseModel]] = {}
+    def iter_all_pages(
+        self,
+        operation: Callable[..., ResponseModel | ApiError],
+        *args: Any,
+        prefetch: int = DEFAULT_PREFETCH,
+        **kwargs: Any,
+    ) -> ItemStream[Any] | ApiError:
+        """Call a paginated endpoint method for every page, returning the items of all pages in order.
+
+        Page 1 is requested first. Its ``total`` and ``pageSize`` give the number of pages; without them,
+        pages are requested until one is empty or not full. Later pages are fetched ahead on the client's
+        thread pool, up to ``prefetch`` at a time, while the items of earlier pages are read. Use the stream as a
+        context manager, or close it, to stop fetching pages when stopping early.
+
+        :param Callable operation: An endpoint method taking a ``page`` argument, e.g.
+            ``client.GetByModeByPathModesQueryPage``
+        :param int prefetch: Maximum number of pages being fetched at a time
+        :return: An ItemStream of the items, or an ApiError if page 1 could not be fetched. If a later page
+            cannot be fetched, iterating raises a PageError holding its ApiError.
+        :raises ValueError: If the operation's response does not hold an array of items
+        """
+        if prefetch < 1:
+            raise ValueError(f"prefetch must be at least 1, not {prefetch}")
+        first = operation(*args, page=1, **kwargs)
+        if isinstance(first, ApiError):
+            return first
+        executor = self._get_executor()
+        futures: set[Future[ResponseModel | ApiError]] = set()
+
+        def submit(page: int) -> Future[ResponseModel | ApiError]:
+            future = submit_call(executor, operation, *args, page=page, **kwargs)
+            futures.add(future)
+            future.add_done_callback(futures.discard)
+            return future
+
+        def cancel() -> None:
+            for future in list(futures):
+                future.cancel()
+
+        return ItemStream(iter_pages(first, submit, prefetch, response_model(operation)), cancel)
+
+    def map(
+        self,
+        operation: Callable[..., ResponseModel | ApiError],
+        *iterables: Iterable[Any],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        rate_limiter: RateLimiter | bool | None = None,
+    ) -> Iterator[ResponseModel | ApiError]:
+        """Call an endpoint method for each item of ``iterables``, yielding the results in order.
+
+        Like the builtin ``map``, the method is called with one item of each iterable, e.g.
+        ``client.map(client.ArrivalsByPathId, stop_ids)``; the iterables must have the same length.
+        The calls run on the client's thread pool, at most ``concurrency`` at a time, and items are
+        read from the iterables only as calls are started. Results that finish early are held until
+        the ones before them have been yielded; use :meth:`as_completed` to receive each result as
+        soon as it is ready. If a call raises, the calls not yet started are cancelled and the
+        exception propagates. Close the iterator, e.g. with ``contextlib.closing``, to cancel them
+        when stopping early.
+
+        :param Callable operation: An endpoint method of this client
+        :param int concurrency: Maximum number of calls in flight at a time
+        :param RateLimiter rate_limiter: Optional limiter pacing the calls, in addition to the client's own.
+            Pass True to share the default limiter for the client's app key.
+        :return: An iterator of the results, each a response model or an ApiError
+        """
+        return call_in_order(
+            self._get_executor(),
+            operation,
+            zip(*iterables, strict=True),
+            check_concurrency(concurrency),
+            self._bulk_rate_limiter(rate_limiter),
+        )
 
-        # Load models from individual model files
-        for _importer, modname, _ispkg in pkgutil.iter_modules(models.__path__):
-            module = import_module(f"..models.{modname}", __package__)
-            for model_name in dir(module):
-                attr = getattr(module, model_name)
-                if isinstance(attr, type) and issubclass(attr, BaseModel):
-                    models_dict[model_name] = attr
+    def as_completed(
+        self,
+        operation: Callable[..., ResponseModel | ApiError],
+        *iterables: Iterable[Any],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        rate_limiter: RateLimiter | bool | None = None,
+    ) -> Iterator[tuple[tuple[Any, ...], ResponseModel | ApiError]]:
+        """Call an endpoint method for each item of ``iterables``, yielding the results as they finish.
+
+        Works like :meth:`map`, but each result is yielded as soon as its call finishes, together
+        with the arguments of the call so that it can be matched to its input, e.g.
+        ``for (stop_id,), arrivals in client.as_completed(client.ArrivalsByPathId, stop_ids)``.
+
+        :param Callable operation: An endpoint method of this client
+        :param int concurrency: Maximum number of calls in flight at a time
+        :param RateLimiter rate_limiter: Optional limiter pacing the calls, in addition to the client's own.
+            Pass True to share the default limiter for the client's app key.
+        :return: An iterator of (arguments, result) pairs
+        """
+        calls = call_as_completed(
+            self._get_executor(),
+            operation,
+            zip(*iterables, strict=True),
+            check_concurrency(concurrency),
+            self._bulk_rate_limiter(rate_limiter),
+        )
 
-        # Also load models imported in the main models module (like GenericResponseModel)
-        for model_name in dir(models):
-            if not model_name.startswith("_"):  # Skip private attributes
-                attr = getattr(models, model_name)
-                if isinstance(attr, type) and issubclass(attr, BaseModel):
-                    models_dict[model_name] = attr
+        def results() -> Iterator[tuple[tuple[Any, ...], ResponseModel | ApiError]]:
+            try:
+                for _, args, result in calls:
+                    yield args, result
+            finally:
+                calls.close()
 
-        # Register core models used for error handling
-        models_dict["ApiError"] = ApiError
+        return results()
 
-        return models_dict
+    def _bulk_rate_limiter(self, rate_limiter: RateLimiter | bool | None) -> RateLimiter | None:
+        app_key = self.client.app_key["app_key"] if self.client.app_key else None
+        limiter = resolve_rate_limiter(rate_limiter, app_key)
+        # the client already takes a token from its own limiter for every request
+        return None if limiter is self.client.rate_limiter else limiter
 
     @staticmethod
     def _parse_int_or_none(value: str) -> int | None:
@@ -118,13 +385,19 @@ class Client:
         except (TypeError, ValueError):
             return None
 
-    def _deserialize(self, model_name: str, response: UnifiedResponse) -> Any:
+    def _deserialize(self, model_name: str, response: UnifiedResponse, validation: Validation | None = None) -> Any:
         shared_expiry, result_expiry = self._get_result_expiry(response)
         response_date_time = self._get_datetime_from_response_headers(response)
-        Model = self._get_model(model_name)
-        data = response.json()
-
-        result = self._create_model_instance(Model, data, result_expiry, shared_expiry, response_date_time)
+        deserializer = self._get_deserializer(model_name)
+
+        result = self._create_model_instance(
+            deserializer,
+            response.content,
+            result_expiry,
+            shared_expiry,
+            response_date_time,
+            validation or resolve_validation(self.validation),
+        )
 
         return result
 
@@ -134,37 +407,69 @@ class Client:
             raise ValueError(f"No model found with name {model_name}")
         return Model
 
+    def _get_deserializer(self, model_name: str) -> Deserializer:
+        """Get the compiled deserializer for a model, compiling it on first use."""
+        deserializer = self._deserializers.get(model_name)
+        if deserializer is None:
+            deserializer = self._deserializers[model_name] = compile_deserializer(self._get_model(model_name))
+        return deserializer
+
     def _create_model_instance(
         self,
-        model: BaseModel,
-        response_json: Any,
+        deserializer: Deserializer,
+        response_content: bytes,
         result_expiry: datetime | None,
         shared_expiry: datetime | None,
         response_date_time: datetime | None,
+        validation: Validation = "full",
     ) -> ResponseModel:
-        is_root_model = isinstance(model, type) and issubclass(model, RootModel)
-
-        # Adjust for root models: RootModel expects one positional argument
-        if is_root_model:
-            # If it's a root model and response_json is not already a list, wrap it in a list
-            if not isinstance(response_json, (list)):
-                response_json = [response_json]  # Wrap the input in a list if necessary
+        # with full validation, pydantic-core parses and validates the raw bytes in one pass,
+        # without building the intermediate dicts and lists that response.json() would
+        content = deserializer(response_content, validation)
 
-            # Create the root model by passing the input directly
-            content = model(response_json)
-
-        else:
-            # For non-root models: If it's a dict, expand it into keyword arguments
-            content = model(**response_json) if isinstance(response_json, dict) else model(response_json)
-
-        return ResponseModel(
+        # trusted modes skip validating the wrapper too: raw content is not a model
+        build = ResponseModel if validation == "full" else ResponseModel.model_construct
+        return build(
             content_expires=result_expiry,
             shared_expires=shared_expiry,
             content=content,
             response_timestamp=response_date_time,
         )
 
-    def _deserialize_error(self, response: UnifiedResponse) -> ApiError:
+    def _store_in_cache(
+        self, key: str, response: UnifiedResponse, result: ResponseModel, previous: CacheEntry | None = None
+    ) -> None:
+        if self.cache is None:
+            return
+        entry = build_cache_entry(result, response.headers, size=len(response.content), previous=previous)
+        if entry is not None:
+            self.cache.set(key, entry)
+
+    def _revalidate_cached(self, key: str, entry: CacheEntry, response: UnifiedResponse) -> ResponseModel:
+        shared_expiry, result_expiry = self._get_result_expiry(response)
+        result = entry.response.model_copy(
+            update={
+                "content_expires": result_expiry,
+                "shared_expires": shared_expiry,
+                "response_timestamp": self._get_datetime_from_response_headers(response),
+            }
+        )
+        if self.cache is not None:
+            # a 304 may omit the validators, in which case the cached ones still apply
+            validators = {
+                "Cache-Control": response.headers.get("Cache-Control"),
+                "ETag": response.headers.get("ETag") or entry.etag,
+                "Last-Modified": response.headers.get("Last-Modified") or entry.last_modified,
+            }
+            headers = {name: value for name, value in validators.items() if value is not None}
+            revalidated = build_cache_entry(result, headers, size=entry.size, previous=entry)
+            if revalidated is not None:
+                self.cache.set(key, revalidated)
+            else:
+                self.cache.delete(key)
+        return result
+
+    def _deserialize_error(self, response: UnifiedResponse, retry_count: int = 0) -> ApiError:
         # Get timestamp from Date header, or use current time if not present
         date_header = response.headers.get("Date")
         timestamp = parsedate_to_datetime(date_header) if date_header else datetime.now(UTC)
@@ -177,12 +482,27 @@ class Client:
             http_status=response.reason or "Unknown",
             relative_uri=response.url or "",
             message=response.text or "No response body",
+            retry_count=retry_count,
+            error_category=categorize_status(response.status_code),
+        )
+
+    @staticmethod
+    def _circuit_open_error(breaker: CircuitBreaker, endpoint: str) -> ApiError:
+        return ApiError(
+            timestamp_utc=datetime.now(UTC),
+            exception_type="CircuitOpen",
+            http_status_code=503,
+            http_status="Service Unavailable",
+            relative_uri=endpoint,
+            message=f"Circuit breaker is open after repeated failures, retry in {breaker.retry_after():.0f}s",
+            retry_count=0,
+            error_category="circuit_open",
         )
 
     def _send_request_and_deserialize(
         self,
         base_url: str,
-        endpoint_and_model: dict[str, str],
+        endpoint_and_model: dict[str, Any],
         params: str | float | list[str | int | float] | None = None,
         endpoint_args: dict[str, Any] | None = None,
     ) -> ResponseModel | ApiError:
@@ -191,11 +511,142 @@ class Client:
         if not isinstance(params, list):
             params = [params]
 
-        endpoint = endpoint_and_model["uri"].format(*params)
-        model_name = endpoint_and_model["model"]
+        route = compile_route(base_url, endpoint_and_model)
+        endpoint = route.path(params)
+        url = route.url(endpoint, endpoint_args)
+
+        validation = resolve_validation(self.validation)
+        if is_streaming():
+            return self._stream(route, endpoint, url, validation)  # type: ignore[return-value]
+        if self.cache is None and not self.coalesce_requests:
+            return self._fetch(route, endpoint, url, None, validation)
 
-        response = self.client.send_request(base_url, endpoint, endpoint_args)
+        # results of different validation modes are different objects: never share them
+        key = url if validation == "full" else f"{url} validation={validation}"
+        cache_key = key if self.cache is not None else None
+
+        def fetch() -> ResponseModel | ApiError:
+            return self._coalesce(key, lambda: self._fetch(route, endpoint, url, cache_key, validation))
+
+        if cache_key is not None:
+            cached = self._get_from_cache(cache_key, fetch)
+            if cached is not None:
+                return cached
+
+        return fetch()
+
+    def _fetch(
+        self,
+        route: Route,
+        endpoint: str,
+        url: str,
+        cache_key: str | None,
+        validation: Validation = "full",
+    ) -> ResponseModel | ApiError:
+        entry = self.cache.get(cache_key) if self.cache is not None and cache_key is not None else None
+        validators = entry.conditional_headers() if entry is not None else None
+        breaker = self._get_circuit_breaker(route, endpoint)
+        if breaker is not None and not breaker.allow_request():
+            return self._circuit_open_error(breaker, endpoint)
+        try:
+            response = self.client.send(url, headers=validators, timeout=route.timeout, endpoint=route.uri)
+        except Exception as exc:
+            if breaker is not None:
+                breaker.record_exception(exc)
+            raise
+        if breaker is not None:
+            breaker.record_status(response.status_code)
+
+        if response.status_code == 304 and entry is not None and cache_key is not None:
+            return self._revalidate_cached(cache_key, entry, response)
+        if response.status_code != 200:
+            return self._deserialize_error(response, retry_count=response.retry_count)
+        result = self._deserialize(route.model, response, validation)
+        if cache_key is not None:
+            self._store_in_cache(cache_key, response, result, previous=entry)
+        return result
 
+    def _stream(self, route: Route, endpoint: str, url: str, validation: Validation) -> ItemStream[Any] | ApiError:
+        """Send the request and return a stream of the deserialized items of its response."""
+        plan = compile_stream_plan(self._get_model(route.model))
+        deserializer = compile_deserializer(plan.item_model)
+        breaker = self._get_circuit_breaker(route, endpoint)
+        if breaker is not None and not breaker.allow_request():
+            return self._circuit_open_error(breaker, endpoint)
+        stack = ExitStack()
+        try:
+            response = stack.enter_context(self.client.stream(url, timeout=route.timeout))
+        except Exception as exc:
+            if breaker is not None:
+                breaker.record_exception(exc)
+            raise
+        if breaker is not None:
+            breaker.record_status(response.status_code)
         if response.status_code != 200:
-            return self._deserialize_error(response)
-        return self._deserialize(model_name, response)
+            with stack:
+                return self._deserialize_error(response, retry_count=response.retry_count)
+        items = (
+            deserializer.from_data(item, validation) for item in iter_array_items(response.iter_bytes(), plan.path)
+        )
+        return ItemStream(items, stack.close)
+
+    def _get_circuit_breaker(self, route: Route, endpoint: str) -> CircuitBreaker | None:
+        if self.circuit_breakers is None:
+            return None
+        return self.circuit_breakers.get(circuit_key(route.base_url, endpoint))
+
+    def _coalesce(self, key: str, fetch: Callable[[], ResponseModel | ApiError]) -> ResponseModel | ApiError:
+        if not self.coalesce_requests:
+            return fetch()
+        with self._in_flight_lock:
+            future = self._in_flight.get(key)
+            leader = future is None
+            if future is None:
+                future = self._in_flight[key] = Future()
+        if not leader:
+            # another thread is already fetching this URL: wait for its result
+            return future.result()
+
+        try:
+            result = fetch()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._in_flight_lock:
+                del self._in_flight[key]
+
+    def _get_from_cache(self, key: str, refresh: Callable[[], object]) -> ResponseModel | None:
+        if self.cache is None:
+            return None
+        entry = self.cache.get(key)
+        if entry is None:
+            return None
+        entry.hits += 1
+        state = entry.state(self.cache_policy)
+        if state is CacheState.EXPIRED:
+            return None
+        if state is not CacheState.FRESH:
+            self._refresh_in_background(key, refresh)
+        return entry.response
+
+    def _refresh_in_background(self, key: str, refresh: Callable[[], object]) -> None:
+        with self._refreshing_lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def run() -> None:
+            try:
+                refresh()
+            except Exception:
+                # the cached entry keeps being served until it leaves the stale window
+                logger.warning("Background refresh of %s failed", key, exc_info=True)
+            finally:
+                with self._refreshing_lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=run, name=f"tfl-cache-refresh:{key}", daemon=True).start()
@@ -0,0 +1,207 @@
+# Deserializer
+# This module compiles response models into Deserializer plans: the model's validator
+# and its root/non-root handling are worked out once per model, so deserializing a
+# response is a single validator call. Trusted callers can skip validation: "construct"
+# builds the models without validating their fields and "raw" returns the parsed JSON.
+
+import types
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Literal, Union, get_args, get_origin
+
+from pydantic import BaseModel, RootModel
+from pydantic_core import from_json
+
+Validation = Literal["full", "construct", "raw"]
+"""How responses are deserialized: validated ("full"), built without validation ("construct") or left as JSON ("raw")."""
+
+VALIDATION_MODES: tuple[Validation, ...] = get_args(Validation)
+
+_validation_override: ContextVar[Validation | None] = ContextVar("tfl_validation_override", default=None)
+
+
+def check_validation(validation: str) -> Validation:
+    """Return ``validation`` if it is a valid mode, raising ValueError otherwise."""
+    if validation not in VALIDATION_MODES:
+        raise ValueError(f"validation must be one of {', '.join(VALIDATION_MODES)}, not {validation!r}")
+    return validation
+
+
+@contextmanager
+def override_validation(validation: Validation) -> Iterator[Validation]:
+    """Deserialize every response received inside the ``with`` block using ``validation``.
+
+    The override is stored in a context variable, so it applies to the current
+    thread or asyncio task only and takes precedence over the client's setting.
+    """
+    token = _validation_override.set(check_validation(validation))
+    try:
+        yield validation
+    finally:
+        _validation_override.reset(token)
+
+
+def resolve_validation(client_validation: Validation) -> Validation:
+    """Pick the validation mode for a request: per call, then per client."""
+    return _validation_override.get() or client_validation
+
+
+@dataclass(frozen=True, slots=True)
+class Deserializer:
+    """A response model compiled for validating raw response bodies.
+
+    :param type model: The model the response is deserialized into
+    :param Callable validate_json: The model's pydantic-core validator, validating JSON bytes
+    :param Callable validate_python: The model's pydantic-core validator, validating parsed JSON
+    :param bool wrap_single: Whether a body that is not a JSON array is wrapped in one (root models)
+    """
+
+    model: type[BaseModel]
+    validate_json: Callable[[bytes], BaseModel]
+    validate_python: Callable[[Any], BaseModel]
+    wrap_single: bool
+
+    def __call__(self, content: bytes, validation: Validation = "full") -> Any:
+        """Deserialize a response body; only "full" validates it."""
+        if validation == "full":
+            # Root models expect a list: wrap a single JSON value in an array before validating
+            if self.wrap_single and not content.lstrip().startswith(b"["):
+                content = b"[" + content + b"]"
+            return self.validate_json(content)
+        return self.from_data(from_json(content), validation)
+
+    def from_data(self, data: Any, validation: Validation = "full") -> Any:
+        """Deserialize parsed JSON, such as one item of a streamed array."""
+        if validation == "raw":
+            return data
+        if self.wrap_single and not isinstance(data, list):
+            data = [data]
+        if validation == "full":
+            return self.validate_python(data)
+        return construct_model(self.model, data)
+
+
+_deserializers: dict[type[BaseModel], Deserializer] = {}
+
+
+def compile_deserializer(model: type[BaseModel]) -> Deserializer:
+    """Return the Deserializer for a model, building the model's validator on first use."""
+    deserializer = _deserializers.get(model)
+    if deserializer is None:
+        # generated models defer building their validator; build it now so it can be bound
+        if not model.__pydantic_complete__:
+            model.model_rebuild()
+        deserializer = _deserializers[model] = Deserializer(
+            model=model,
+            validate_json=model.__pydantic_validator__.validate_json,
+            validate_python=model.__pydantic_validator__.validate_python,
+            wrap_single=issubclass(model, RootModel),
+        )
+    return deserializer
+
+
+# Converter = function turning a parsed JSON value into the value of a constructed field
+Converter = Callable[[Any], Any]
+
+_object_setattr = object.__setattr__
+
+
+@dataclass(frozen=True, slots=True)
+class ConstructPlan:
+    """How to build a model from parsed JSON without validating it.
+
+    :param dict fields: Key in the JSON object to the field name and the converter for nested models
+    :param dict defaults: Default values of the optional fields
+    :param bool direct: Whether instances can be built by setting their state directly, which is faster
+        than ``model_construct`` but only possible without default factories, extras, private attributes
+        or ``model_post_init``
+    """
+
+    fields: dict[str, tuple[str, Converter | None]]
+    defaults: dict[str, Any]
+    direct: bool
+
+
+_construct_plans: dict[type[BaseModel], ConstructPlan] = {}
+
+
+def _converter(annotation: Any) -> Converter | None:
+    """Return a converter for values of ``annotation``, or None when the parsed JSON is used as is."""
+    origin = get_origin(annotation)
+    if origin is Union or origin is types.UnionType:
+        converters = [_converter(arg) for arg in get_args(annotation) if arg is not type(None)]
+        return converters[0] if len(converters) == 1 else None
+    if origin is list:
+        args = get_args(annotation)
+        item = _converter(args[0]) if args else None
+        if item is None:
+            return None
+        return lambda values: [item(value) for value in values] if isinstance(values, list) else values
+    if origin is dict:
+        args = get_args(annotation)
+        value_converter = _converter(args[1]) if len(args) == 2 else None
+        if value_converter is None:
+            return None
+        return lambda values: (
+            {key: value_converter(value) for key, value in values.items()} if isinstance(values, dict) else values
+        )
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return partial(construct_model, annotation)
+    return None
+
+
+def _construct_plan(model: type[BaseModel]) -> ConstructPlan:
+    plan = _construct_plans.get(model)
+    if plan is None:
+        # resolve forward references such as Place.children: list['Place']
+        if not model.__pydantic_complete__:
+            model.model_rebuild()
+        fields: dict[str, tuple[str, Converter | None]] = {}
+        defaults: dict[str, Any] = {}
+        direct = (
+            model.model_config.get("extra") != "allow"
+            and not model.__pydantic_post_init__
+            and not model.__private_attributes__
+        )
+        for name, field in model.model_fields.items():
+            key = field.validation_alias if isinstance(field.validation_alias, str) else field.alias or name
+            fields[key] = (name, _converter(field.annotation))
+            if field.default_factory is not None:
+                direct = False
+            elif not field.is_required():
+                defaults[name] = field.default
+        plan = _construct_plans[model] = ConstructPlan(fields, defaults, direct)
+    return plan
+
+
+def construct_model(model: type[BaseModel], data: Any) -> Any:
+    """Build ``model`` from parsed JSON without validation, recursing into nested models.
+
+    Nothing is validated or converted: values keep their JSON types (e.g. datetimes stay strings).
+    """
+    plan = _construct_plan(model)
+    if model.__pydantic_root_model__:
+        _, converter = plan.fields["root"]
+        return model.model_construct(converter(data) if converter is not None else data)
+    if not isinstance(data, dict):
+        return data
+    values = dict(plan.defaults)
+    fields_set = set()
+    for key, value in data.items():
+        field = plan.fields.get(key)
+        if field is None:
+            continue
+        name, converter = field
+        values[name] = converter(value) if converter is not None and value is not None else value
+        fields_set.add(name)
+    if not plan.direct:
+        return model.model_construct(fields_set, **values)
+    instance = model.__new__(model)
+    _object_setattr(instance, "__dict__", values)
+    _object_setattr(instance, "__pydantic_fields_set__", fields_set)
+    _object_setattr(instance, "__pydantic_extra__", None)
+    _object_setattr(instance, "__pydantic_private__", None)
+    return instance
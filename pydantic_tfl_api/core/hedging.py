@@ -0,0 +1,102 @@
+# Hedging
+# This module decides when a slow request is "hedged": a duplicate is sent once the
+# request has been outstanding for longer than a high percentile of its endpoint's
+# recent latencies, and whichever response arrives first is used. This cuts the tail
+# latency of endpoints whose p99 is many times their median, at the cost of a capped
+# share of duplicate requests.
+
+import math
+import threading
+from collections import deque
+from collections.abc import Iterable
+from urllib.parse import urlsplit
+
+
+class HedgePolicy:
+    """Thread-safe hedging policy, shared by sync and async clients.
+
+    A request is hedged once it has been outstanding for the ``percentile`` latency of the
+    last ``window`` responses of its endpoint (or ``initial_delay`` until ``min_samples``
+    responses have been seen). Hedges are paid for from a budget that grows by ``max_ratio``
+    with every request, so at most that share of requests is duplicated over time, with
+    bursts of up to ``burst`` hedges.
+
+    :param float percentile: Percentile of recent latencies after which a request is hedged
+    :param float max_ratio: Largest share of requests that may be hedged, e.g. 0.05 for 5%
+    :param Iterable endpoints: URI templates of the endpoints to hedge, e.g. ``"/StopPoint/{0}/Arrivals"``;
+        None hedges every endpoint
+    :param float initial_delay: Seconds before hedging while an endpoint has fewer than ``min_samples`` latencies
+    :param float min_delay: Lower bound of the delay in seconds, so that fast endpoints are not hedged on jitter
+    :param int window: Number of recent latencies kept per endpoint
+    :param int min_samples: Latencies needed before the percentile is used
+    :param float burst: Largest number of hedges that may be sent in a row
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        max_ratio: float = 0.05,
+        endpoints: Iterable[str] | None = None,
+        initial_delay: float = 1.0,
+        min_delay: float = 0.05,
+        window: int = 200,
+        min_samples: int = 20,
+        burst: float = 10.0,
+    ) -> None:
+        if not 0 < percentile < 100:
+            raise ValueError("percentile must be between 0 and 100")
+        if not 0 < max_ratio <= 1:
+            raise ValueError("max_ratio must be greater than 0 and at most 1")
+        if window < 1 or min_samples < 1:
+            raise ValueError("window and min_samples must be at least 1")
+        self.percentile = percentile
+        self.max_ratio = max_ratio
+        self.endpoints = frozenset(endpoints) if endpoints is not None else None
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.window = window
+        self.min_samples = min(min_samples, window)
+        self.burst = max(1.0, burst)
+        self._latencies: dict[str, deque[float]] = {}
+        self._budget = 1.0
+        self.requests = 0
+        self.hedges = 0
+        self._lock = threading.Lock()
+
+    def applies_to(self, endpoint: str) -> bool:
+        """Check whether requests to ``endpoint`` (a URI template or URL) are hedged."""
+        return self.endpoints is None or endpoint in self.endpoints
+
+    def delay(self, endpoint: str) -> float:
+        """Return how long to wait for a response to ``endpoint`` before hedging, counting the request."""
+        with self._lock:
+            self.requests += 1
+            self._budget = min(self.burst, self._budget + self.max_ratio)
+            latencies = self._latencies.get(endpoint)
+            if latencies is None or len(latencies) < self.min_samples:
+                return max(self.min_delay, self.initial_delay)
+            ordered = sorted(latencies)
+        rank = math.ceil(self.percentile / 100 * len(ordered)) - 1
+        return max(self.min_delay, ordered[rank])
+
+    def try_hedge(self) -> bool:
+        """Take one hedge from the budget, returning False when the share of hedged requests is used up."""
+        with self._lock:
+            if self._budget < 1:
+                return False
+            self._budget -= 1
+            self.hedges += 1
+            return True
+
+    def record(self, endpoint: str, seconds: float) -> None:
+        """Record how long a request to ``endpoint`` took to receive its response."""
+        with self._lock:
+            latencies = self._latencies.get(endpoint)
+            if latencies is None:
+                latencies = self._latencies[endpoint] = deque(maxlen=self.window)
+            latencies.append(seconds)
+
+
+def hedge_endpoint(url: str, endpoint: str | None) -> str:
+    """Return the key a request's latency is tracked under: its URI template, or the URL's path without one."""
+    return endpoint if endpoint is not None else urlsplit(url).path
@@ -2,9 +2,14 @@
 # This module provides the base abstractions for HTTP clients, allowing
 # the library to support multiple HTTP backends (requests, httpx, etc.)
 
+import importlib.util
 from abc import ABC, abstractmethod
-from collections.abc import Mapping
-from typing import Any, Protocol, runtime_checkable
+from collections.abc import AsyncIterator, Iterator, Mapping
+from contextlib import asynccontextmanager, contextmanager
+from types import TracebackType
+from typing import Any, Protocol, Self, runtime_checkable
+
+from .timeouts import Timeout
 
 
 @runtime_checkable
@@ -31,6 +36,11 @@ class HTTPResponse(Protocol):
         """Response body as text."""
         ...
 
+    @property
+    def content(self) -> bytes:
+        """Response body as bytes, after any Content-Encoding has been decoded."""
+        ...
+
     @property
     def url(self) -> str:
         """The URL of the request."""
@@ -63,20 +73,62 @@ class HTTPClientBase(ABC):
         self,
         url: str,
         headers: dict[str, str] | None = None,
-        timeout: int | None = None,
+        timeout: float | Timeout | None = None,
     ) -> HTTPResponse:
         """Send a GET request.
 
         Args:
             url: The URL to send the request to (should include query parameters).
             headers: Optional headers to include in the request.
-            timeout: Request timeout in seconds.
+            timeout: Request timeout in seconds, or a Timeout with separate connect/read/write/pool phases.
 
         Returns:
             An HTTPResponse object containing the response data.
         """
         ...
 
+    @contextmanager
+    def stream(
+        self,
+        url: str,
+        headers: dict[str, str] | None = None,
+        timeout: float | Timeout | None = None,
+    ) -> Iterator[HTTPResponse]:
+        """Send a GET request, reading the response body as it arrives.
+
+        The response is closed when the ``with`` block exits. Backends that can stream
+        return a response with an ``iter_bytes`` method; the default implementation
+        reads the whole body with :meth:`get`.
+
+        Args:
+            url: The URL to send the request to (should include query parameters).
+            headers: Optional headers to include in the request.
+            timeout: Request timeout in seconds, or a Timeout with separate connect/read/write/pool phases.
+
+        Yields:
+            An HTTPResponse object whose body has not been read yet.
+        """
+        yield self.get(url, headers=headers, timeout=timeout)
+
+    def close(self) -> None:
+        """Release any resources (e.g. pooled connections) held by the client.
+
+        The default implementation does nothing; backends that keep connections
+        open between requests override it.
+        """
+        return None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
 
 class AsyncHTTPClientBase(ABC):
     """Abstract base class for asynchronous HTTP clients.
@@ -91,20 +143,78 @@ class AsyncHTTPClientBase(ABC):
         self,
         url: str,
         headers: dict[str, str] | None = None,
-        timeout: int | None = None,
+        timeout: float | Timeout | None = None,
     ) -> HTTPResponse:
         """Send an async GET request.
 
         Args:
             url: The URL to send the request to (should include query parameters).
             headers: Optional headers to include in the request.
-            timeout: Request timeout in seconds.
+            timeout: Request timeout in seconds, or a Timeout with separate connect/read/write/pool phases.
 
         Returns:
             An HTTPResponse object containing the response data.
         """
         ...
 
+    @asynccontextmanager
+    async def stream(
+        self,
+        url: str,
+        headers: dict[str, str] | None = None,
+        timeout: float | Timeout | None = None,
+    ) -> AsyncIterator[HTTPResponse]:
+        """Send an async GET request, reading the response body as it arrives.
+
+        The response is closed when the ``async with`` block exits. Backends that can
+        stream return a response with an ``aiter_bytes`` method; the default
+        implementation reads the whole body with :meth:`get`.
+
+        Args:
+            url: The URL to send the request to (should include query parameters).
+            headers: Optional headers to include in the request.
+            timeout: Request timeout in seconds, or a Timeout with separate connect/read/write/pool phases.
+
+        Yields:
+            An HTTPResponse object whose body has not been read yet.
+        """
+        yield await self.get(url, headers=headers, timeout=timeout)
+
+    async def aclose(self) -> None:
+        """Release any resources (e.g. pooled connections) held by the client.
+
+        The default implementation does nothing; backends that keep connections
+        open between requests override it.
+        """
+        return None
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+
+def get_default_accept_encoding() -> str:
+    """Get the Accept-Encoding header value for the compression formats that can be decoded.
+
+    gzip and deflate are always supported. Brotli is advertised when the ``brotli``
+    or ``brotlicffi`` package is installed, which httpx and urllib3 (used by requests)
+    both pick up to decode ``br`` responses.
+
+    Returns:
+        A comma-separated list of content codings.
+    """
+    encodings = ["gzip", "deflate"]
+    if importlib.util.find_spec("brotli") is not None or importlib.util.find_spec("brotlicffi") is not None:
+        encodings.append("br")
+    return ", ".join(encodings)
+
 
 def get_default_http_client() -> HTTPClientBase:
     """Get the default HTTP client implementation.
@@ -128,7 +238,9 @@ def get_default_http_client() -> HTTPClientBase:
 def get_default_async_http_client() -> AsyncHTTPClientBase:
     """Get the default async HTTP client implementation.
 
-    Returns the async httpx client for use with asyncio.
+    Returns a process-wide shared async httpx client, so that every async API
+    client created without an explicit ``http_client`` draws connections from
+    the same pool.
 
     Returns:
         An AsyncHTTPClientBase implementation.
@@ -137,9 +249,9 @@ def get_default_async_http_client() -> AsyncHTTPClientBase:
         ImportError: If httpx is not installed.
     """
     try:
-        from .http_backends.async_httpx_client import AsyncHttpxClient
+        from .http_backends.async_httpx_client import get_shared_async_httpx_client
 
-        return AsyncHttpxClient()
+        return get_shared_async_httpx_client()
     except ImportError:
         raise ImportError(
             "httpx is required for async client support. "
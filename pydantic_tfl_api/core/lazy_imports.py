@@ -0,0 +1,50 @@
+# Lazy Imports
+# This module implements PEP 562 lazy loading for the generated packages: names
+# exported by ``pydantic_tfl_api``, ``endpoints`` and ``models`` are imported from
+# their modules the first time they are accessed, so importing the package does
+# not build every client and pydantic schema up front.
+
+import sys
+from collections.abc import Callable, Mapping
+from importlib import import_module
+from types import ModuleType
+from typing import Any
+
+
+class _LazyModule(ModuleType):
+    """Module type for packages whose exports are imported on first access."""
+
+    _lazy_exports: Mapping[str, str]
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Importing a submodule binds it as an attribute of its package. Generated
+        # modules are named after the class they define, so that binding would shadow
+        # the class; leave the name to __getattr__ instead.
+        if isinstance(value, ModuleType) and name in self._lazy_exports:
+            return
+        super().__setattr__(name, value)
+
+
+def lazy_exports(package: str, exports: Mapping[str, str]) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Return the module ``__getattr__`` and ``__dir__`` for a package with lazily imported exports.
+
+    :param str package: ``__name__`` of the package
+    :param Mapping exports: Exported name to the module that defines it, relative to ``package``
+    """
+    module = sys.modules[package]
+
+    def module_getattr(name: str) -> Any:
+        target = exports.get(name)
+        if target is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(import_module(target, package), name)
+        # cache on the package so later lookups do not come back through __getattr__
+        module.__dict__[name] = value
+        return value
+
+    def module_dir() -> list[str]:
+        return sorted(module.__dict__.keys() | exports.keys())
+
+    module.__dict__["_lazy_exports"] = exports
+    module.__class__ = _LazyModule
+    return module_getattr, module_dir
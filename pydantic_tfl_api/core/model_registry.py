@@ -0,0 +1,77 @@
+# Model Registry
+# This module maps response model names to their classes. The names and modules come
+# from the generated ``models/_registry.py`` table, and each model is imported the
+# first time it is looked up, so creating a client no longer imports and scans every
+# model module.
+
+import threading
+from collections.abc import Iterable, Iterator, Mapping
+from importlib import import_module
+
+from pydantic import BaseModel
+
+from .package_models import ApiError
+
+
+class ModelRegistry(Mapping[str, type[BaseModel]]):
+    """Read-only mapping of model names to model classes, imported on first lookup.
+
+    :param Mapping modules: Model name to the module that defines it, relative to ``package``
+    :param str package: Package that relative module names are resolved against
+    :param Mapping extra: Models that are already imported, such as ApiError
+    """
+
+    def __init__(
+        self,
+        modules: Mapping[str, str],
+        package: str,
+        extra: Mapping[str, type[BaseModel]] | None = None,
+    ) -> None:
+        self._modules = dict(modules)
+        self._package = package
+        self._resolved: dict[str, type[BaseModel]] = dict(extra or {})
+
+    def __getitem__(self, name: str) -> type[BaseModel]:
+        model = self._resolved.get(name)
+        if model is None:
+            module = self._modules[name]
+            model = self._resolved[name] = getattr(import_module(module, self._package), name)
+        return model
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._resolved or name in self._modules
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._modules
+        yield from (name for name in self._resolved if name not in self._modules)
+
+    def __len__(self) -> int:
+        return len(self._modules.keys() | self._resolved.keys())
+
+
+_shared_registry: ModelRegistry | None = None
+_shared_registry_lock = threading.Lock()
+
+
+def get_model_registry() -> ModelRegistry:
+    """Return the process-wide model registry shared by every client."""
+    global _shared_registry
+    with _shared_registry_lock:
+        if _shared_registry is None:
+            _registry = import_module("..models._registry", __package__)
+            _shared_registry = ModelRegistry(_registry.MODEL_MODULES, _registry.__package__, {"ApiError": ApiError})
+        return _shared_registry
+
+
+def warmup(models: Iterable[str | type[BaseModel]] | None = None) -> None:
+    """Build the validators of the given models now, instead of on their first response.
+
+    Generated models defer building their validators until first use. Call this
+    at startup, for example in a pre-fork master process, so that the work is
+    done once and shared by forked workers.
+
+    :param Iterable models: Model names or classes to build; all models when None
+    """
+    registry = get_model_registry()
+    for model in registry if models is None else models:
+        (registry[model] if isinstance(model, str) else model).model_rebuild()
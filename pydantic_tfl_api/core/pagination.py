@@ -0,0 +1,172 @@
+# Pagination
+# This module iterates over the items of every page of a paginated endpoint, such as
+# StopPoint/Mode/{modes}?page=N. The number of pages is read from the first page when
+# it gives the total (StopPointsResponse); otherwise pages are read until one is empty.
+# Later pages are fetched ahead, a bounded number at a time, while earlier ones are read.
+
+import asyncio
+import inspect
+from collections import deque
+from collections.abc import AsyncGenerator, Callable, Generator
+from concurrent.futures import Future
+from typing import Any, get_args
+
+from pydantic import BaseModel, RootModel
+
+from .package_models import ApiError, ResponseModel
+from .streaming import compile_stream_plan
+
+DEFAULT_PREFETCH = 4
+"""Pages fetched ahead of the page being read."""
+
+
+class PageError(Exception):
+    """Raised while iterating over the pages of an endpoint when a page after the first cannot be fetched.
+
+    :param int page: The number of the page
+    :param ApiError error: The error returned for the page
+    """
+
+    def __init__(self, page: int, error: ApiError) -> None:
+        super().__init__(f"Fetching page {page} failed: {error.http_status_code} {error.message}")
+        self.page = page
+        self.error = error
+
+
+def response_model(operation: Callable[..., object]) -> type[BaseModel] | None:
+    """Return the model of the content of an endpoint method's responses, read from its return annotation.
+
+    Generated endpoint methods return ``ResponseModel[<model>] | ApiError``; None is returned for
+    callables not annotated that way.
+    """
+    try:
+        annotation = inspect.get_annotations(operation, eval_str=True).get("return")
+    except (NameError, TypeError):
+        return None
+    for arg in get_args(annotation):
+        metadata = getattr(arg, "__pydantic_generic_metadata__", None)
+        if metadata and metadata["origin"] is ResponseModel and metadata["args"]:
+            model = metadata["args"][0]
+            return model if isinstance(model, type) and issubclass(model, BaseModel) else None
+    return None
+
+
+def page_items(content: Any, model: type[BaseModel] | None = None) -> tuple[list[Any], int | None, int | None]:
+    """Return the items of a page, and the total number of items and the page size when the page gives them.
+
+    :param content: The content of the page's response, in any validation mode
+    :param type model: The response model of the page, which names the items' key when the content
+        was not validated into it ("raw" validation)
+    :raises ValueError: If the content does not hold exactly one array of items
+    """
+    if isinstance(content, RootModel):
+        content = content.root
+    if isinstance(content, list):
+        return content, None, None
+    if isinstance(content, BaseModel):
+        key = compile_stream_plan(type(content)).path[0]
+        data = {field.alias or name: getattr(content, name) for name, field in type(content).model_fields.items()}
+    elif isinstance(content, dict):  # "raw" validation
+        if model is not None:
+            key = compile_stream_plan(model).path[0]
+        else:
+            keys = [
+                key
+                for key, value in content.items()
+                if isinstance(value, list) and all(isinstance(item, dict) for item in value)
+            ]
+            if len(keys) != 1:
+                raise ValueError("The page does not hold one array of items")
+            key = keys[0]
+        data = content
+    else:
+        raise ValueError(f"{type(content).__name__} responses are not pages of items")
+    return data.get(key) or [], data.get("total"), data.get("pageSize")
+
+
+def _page_count(total: int | None, page_size: int | None) -> int | None:
+    if total is None or not page_size:
+        return None
+    return max(1, -(-total // page_size))
+
+
+def _is_last_page(items: list[Any], page_size: int | None) -> bool:
+    """Without a total, the last page is the first one that is empty or not full."""
+    return not items or (page_size is not None and len(items) < page_size)
+
+
+def iter_pages(
+    first: ResponseModel,
+    submit: Callable[[int], Future[ResponseModel | ApiError]],
+    prefetch: int = DEFAULT_PREFETCH,
+    model: type[BaseModel] | None = None,
+) -> Generator[Any]:
+    """Yield the items of every page, in order, fetching up to ``prefetch`` pages ahead.
+
+    :param ResponseModel first: The response for page 1
+    :param Callable submit: Starts fetching a page, returning a Future of its response
+    :param int prefetch: Maximum number of pages being fetched at a time
+    :param type model: The response model of the pages, see :func:`page_items`
+    :raises ValueError: If the pages do not hold an array of items
+    """
+    items, total, page_size = page_items(first.content, model)
+    last = _page_count(total, page_size)
+
+    def pages() -> Generator[Any]:
+        yield from items
+        if last == 1 or (last is None and _is_last_page(items, page_size)):
+            return
+        pending: deque[tuple[int, Future[ResponseModel | ApiError]]] = deque()
+        next_page = 2
+        while True:
+            while len(pending) < prefetch and (last is None or next_page <= last):
+                pending.append((next_page, submit(next_page)))
+                next_page += 1
+            if not pending:
+                return
+            page, future = pending.popleft()
+            result = future.result()
+            if isinstance(result, ApiError):
+                raise PageError(page, result)
+            next_items, _, _ = page_items(result.content, model)
+            yield from next_items
+            if last is None and _is_last_page(next_items, page_size):
+                return
+
+    return pages()
+
+
+def aiter_pages(
+    first: ResponseModel,
+    submit: Callable[[int], asyncio.Future[ResponseModel | ApiError]],
+    prefetch: int = DEFAULT_PREFETCH,
+    model: type[BaseModel] | None = None,
+) -> AsyncGenerator[Any]:
+    """Async variant of :func:`iter_pages`, where ``submit`` starts a task fetching the page."""
+    items, total, page_size = page_items(first.content, model)
+    last = _page_count(total, page_size)
+
+    async def pages() -> AsyncGenerator[Any]:
+        for item in items:
+            yield item
+        if last == 1 or (last is None and _is_last_page(items, page_size)):
+            return
+        pending: deque[tuple[int, asyncio.Future[ResponseModel | ApiError]]] = deque()
+        next_page = 2
+        while True:
+            while len(pending) < prefetch and (last is None or next_page <= last):
+                pending.append((next_page, submit(next_page)))
+                next_page += 1
+            if not pending:
+                return
+            page, future = pending.popleft()
+            result = await future
+            if isinstance(result, ApiError):
+                raise PageError(page, result)
+            next_items, _, _ = page_items(result.content, model)
+            for item in next_items:
+                yield item
+            if last is None and _is_last_page(next_items, page_size):
+                return
+
+    return pages()
@@ -0,0 +1,92 @@
+# Rate Limiting
+# This module provides a client-side token bucket so that requests are paced to
+# TfL's per app_key quota instead of being rejected with 429 Too Many Requests.
+
+import asyncio
+import threading
+import time
+from typing import Self
+
+ANONYMOUS_REQUESTS_PER_SECOND = 1.0
+"""TfL's limit for requests made without an app_key."""
+
+APP_KEY_REQUESTS_PER_SECOND = 500 / 60
+"""TfL's default limit for requests made with an app_key (500 requests per minute)."""
+
+
+class RateLimiter:
+    """Thread-safe token bucket shared by sync and async clients.
+
+    Tokens are added at ``rate`` per second up to ``capacity``, which is the
+    largest burst that can be sent without waiting. Each request takes one
+    token; when the bucket is empty the request reserves the next token and
+    waits until it is due, so waiting callers are served in arrival order.
+
+    :param float rate: Sustained number of requests per second
+    :param float capacity: Burst size in requests (defaults to one second's worth of requests, and at least 1)
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        if self.capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def per_minute(cls, requests: float, capacity: float | None = None) -> Self:
+        """Create a limiter allowing ``requests`` requests per minute."""
+        return cls(requests / 60, capacity)
+
+    def acquire(self) -> None:
+        """Take a token, blocking the calling thread until one is available."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Take a token, suspending the calling coroutine until one is available."""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def reserve(self) -> float:
+        """Take a token and return how many seconds the caller must wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+
+_shared_limiters: dict[str | None, RateLimiter] = {}
+_shared_limiters_lock = threading.Lock()
+
+
+def get_shared_rate_limiter(app_key: str | None = None) -> RateLimiter:
+    """Return the process-wide rate limiter for ``app_key``.
+
+    All clients using the same app_key share one limiter, paced at TfL's
+    default quota: 1 request per second without a key and 500 requests per
+    minute with one.
+    """
+    with _shared_limiters_lock:
+        limiter = _shared_limiters.get(app_key)
+        if limiter is None:
+            rate = APP_KEY_REQUESTS_PER_SECOND if app_key else ANONYMOUS_REQUESTS_PER_SECOND
+            limiter = _shared_limiters[app_key] = RateLimiter(rate)
+        return limiter
+
+
+def resolve_rate_limiter(rate_limiter: RateLimiter | bool | None, app_key: str | None) -> RateLimiter | None:
+    """Turn a client's ``rate_limiter`` argument into a limiter (True selects the shared limiter for the key)."""
+    if rate_limiter is True:
+        return get_shared_rate_limiter(app_key)
+    if rate_limiter is False or rate_limiter is None:
+        return None
+    return rate_limiter
@@ -1,7 +1,7 @@
 # Unified Response Wrapper
 # This module provides a unified response wrapper for consistency across HTTP clients.
 
-from collections.abc import Mapping
+from collections.abc import AsyncIterator, Iterator, Mapping
 from typing import Any
 
 from .http_client import HTTPResponse
@@ -26,6 +26,8 @@ class UnifiedResponse:
             response: An object conforming to the HTTPResponse protocol.
         """
         self._response = response
+        self.retry_count = 0
+        """Number of times the request was retried before this response was received."""
 
     @property
     def status_code(self) -> int:
@@ -42,6 +44,15 @@ class UnifiedResponse:
         """Response body as text."""
         return self._response.text
 
+    @property
+    def content(self) -> bytes:
+        """Response body as bytes, already decompressed by the HTTP client.
+
+        Falls back to encoding ``text`` for HTTP clients whose responses have no ``content``.
+        """
+        content = getattr(self._response, "content", None)
+        return content if isinstance(content, bytes) else self.text.encode()
+
     @property
     def url(self) -> str:
         """The URL of the request."""
@@ -71,6 +82,35 @@ class UnifiedResponse:
         """
         self._response.raise_for_status()
 
+    def iter_bytes(self) -> Iterator[bytes]:
+        """Iterate over the body of a streamed response as it arrives.
+
+        Falls back to the whole ``content`` for responses that were not streamed.
+        """
+        iter_bytes = getattr(self._response, "iter_bytes", None)
+        return iter_bytes() if iter_bytes is not None else iter((self.content,))
+
+    async def aiter_bytes(self) -> AsyncIterator[bytes]:
+        """Async variant of :meth:`iter_bytes`, for responses of async HTTP clients."""
+        aiter_bytes = getattr(self._response, "aiter_bytes", None)
+        if aiter_bytes is None:
+            yield self.content
+            return
+        async for chunk in aiter_bytes():
+            yield chunk
+
+    def read(self) -> None:
+        """Read the rest of a streamed response, so that ``content``, ``text`` and ``json()`` can be used."""
+        read = getattr(self._response, "read", None)
+        if read is not None:
+            read()
+
+    async def aread(self) -> None:
+        """Async variant of :meth:`read`, for responses of async HTTP clients."""
+        aread = getattr(self._response, "aread", None)
+        if aread is not None:
+            await aread()
+
     @property
     def ok(self) -> bool:
         """Check if the response was successful (status code < 400)."""
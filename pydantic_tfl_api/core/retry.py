@@ -0,0 +1,126 @@
+# Retry Policy
+# This module decides which failed requests are retried and how long to wait
+# between attempts, using capped exponential backoff with jitter and honouring
+# the Retry-After header that TfL sends with 429 and 503 responses.
+
+import random
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+
+import httpx
+
+try:
+    import requests
+
+    _TIMEOUT_ERRORS: tuple[type[BaseException], ...] = (TimeoutError, httpx.TimeoutException, requests.Timeout)
+    _NETWORK_ERRORS: tuple[type[BaseException], ...] = (
+        ConnectionError,
+        httpx.TransportError,
+        requests.ConnectionError,
+    )
+except ImportError:
+    _TIMEOUT_ERRORS = (TimeoutError, httpx.TimeoutException)
+    _NETWORK_ERRORS = (ConnectionError, httpx.TransportError)
+
+
+def categorize_status(status_code: int) -> str | None:
+    """Return the ``ApiError.error_category`` for an HTTP status, or None for a successful response."""
+    if status_code < 400:
+        return None
+    if status_code in (401, 403):
+        return "authentication"
+    if status_code in (408, 504):
+        return "timeout"
+    if status_code == 429:
+        return "rate_limit"
+    if status_code < 500:
+        return "client_error"
+    return "server_error"
+
+
+def categorize_exception(exc: BaseException) -> str:
+    """Return the error category for an exception raised by an HTTP client."""
+    if isinstance(exc, _TIMEOUT_ERRORS):
+        return "timeout"
+    if isinstance(exc, _NETWORK_ERRORS):
+        return "network"
+    return "unknown"
+
+
+def parse_retry_after(value: str | None, now: datetime | None = None) -> float | None:
+    """Parse a Retry-After header (delay in seconds or an HTTP date) into seconds to wait."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, (retry_at - (now or datetime.now(UTC))).total_seconds())
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Controls which failed requests are retried and how long to wait in between.
+
+    Each category has its own retry budget. Responses with a 429 status are only
+    retried when TfL says when to try again (``Retry-After``), since TfL also uses
+    429 for invalid app keys.
+
+    :param int timeout: Retries for timeouts (408, 504 or a client-side timeout)
+    :param int network: Retries for connection errors
+    :param int server_error: Retries for transient server errors (``server_error_statuses``)
+    :param int rate_limit: Retries for 429 responses carrying a Retry-After header
+    :param frozenset server_error_statuses: 5xx statuses that are considered transient
+    :param float backoff_base: Delay before the first retry in seconds, doubled on every attempt
+    :param float backoff_max: Upper bound for the exponential backoff delay in seconds
+    :param bool jitter: Wait a random time between 0 and the backoff delay ("full jitter") to
+        avoid clients retrying in lock-step
+    :param float max_retry_after: Give up instead of waiting when Retry-After asks for longer than this
+    """
+
+    timeout: int = 1
+    network: int = 1
+    server_error: int = 2
+    rate_limit: int = 2
+    server_error_statuses: frozenset[int] = frozenset({502, 503})
+    backoff_base: float = 0.5
+    backoff_max: float = 8.0
+    jitter: bool = True
+    max_retry_after: float = 30.0
+
+    def retries_for(self, category: str | None) -> int:
+        """Return the number of retries allowed for an error category."""
+        if category in ("timeout", "network", "server_error", "rate_limit"):
+            return int(getattr(self, category))
+        return 0
+
+    def should_retry_status(self, status_code: int, attempt: int, retry_after: float | None) -> bool:
+        """Check whether a response with ``status_code`` is retried after ``attempt`` earlier retries."""
+        category = categorize_status(status_code)
+        if category == "server_error" and status_code not in self.server_error_statuses:
+            return False
+        if category == "rate_limit" and retry_after is None:
+            return False
+        if retry_after is not None and retry_after > self.max_retry_after:
+            return False
+        return attempt < self.retries_for(category)
+
+    def should_retry_exception(self, exc: BaseException, attempt: int) -> bool:
+        """Check whether a request that raised ``exc`` is retried after ``attempt`` earlier retries."""
+        return attempt < self.retries_for(categorize_exception(exc))
+
+    def backoff(self, attempt: int, retry_after: float | None = None) -> float:
+        """Return the number of seconds to wait before retry number ``attempt + 1``."""
+        if retry_after is not None:
+            return retry_after
+        delay = min(self.backoff_max, self.backoff_base * 2**attempt)
+        return random.uniform(0, delay) if self.jitter else delay
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
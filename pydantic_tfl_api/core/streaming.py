@@ -0,0 +1,344 @@
+# Streaming
+# This module splits a JSON response into the items of one of its arrays while the
+# response is still being received, so that huge responses (e.g. every StopPoint of
+# a mode) can be deserialized item by item. Only the current item is held in memory,
+# rather than the whole body, its parsed JSON and the model tree at once.
+
+import codecs
+import json
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generator,
+    Iterable,
+    Iterator,
+)
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from types import TracebackType
+from typing import Any, Generic, Self, TypeVar, get_args, get_origin
+
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+_DELIMITERS = _WHITESPACE + ",]}"
+
+
+class _IncompleteError(Exception):
+    """Raised when the buffer ends before the next value is complete."""
+
+
+class ArrayItemParser:
+    """Push parser returning each item of a JSON array as the document arrives.
+
+    Feed it the response body chunk by chunk. The array is found by following ``path``
+    through nested objects; other values are skipped. A document holding a single object
+    where a top-level array is expected is returned as one item. Only the items of the
+    current chunk are held in memory, so memory use is bounded by the largest item.
+
+    :param tuple path: Keys of the objects enclosing the array; empty for a top-level array
+    """
+
+    def __init__(self, path: tuple[str, ...] = ()) -> None:
+        self.path = path
+        self.done = False
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._pos = 0
+        self._retry_at = 0
+        self._depth = 0
+        self._state = "object" if path else "array"
+        self._final = False
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """Add the next chunk of the document and return the parsed items it completed."""
+        if self.done:
+            return []
+        self._buffer = self._buffer[self._pos :] + self._text.decode(chunk)
+        self._pos = 0
+        # an incomplete value is parsed again from its start: wait until the buffer has doubled
+        # so that a value spanning many chunks is not parsed once per chunk
+        if len(self._buffer) < self._retry_at:
+            return []
+        return self._parse()
+
+    def close(self) -> list[Any]:
+        """Parse the rest of the document once it has been received in full, returning its last items.
+
+        :raises ValueError: If the document ended, or stopped being valid JSON, before the end of the array
+        """
+        self._final = True
+        self._buffer = self._buffer[self._pos :] + self._text.decode(b"", final=True)
+        self._pos = 0
+        items = self._parse()
+        if not self.done:
+            raise ValueError("JSON document is incomplete or invalid: the end of the array was not found")
+        return items
+
+    def _parse(self) -> list[Any]:
+        items: list[Any] = []
+        try:
+            while not self.done:
+                self._step(items)
+        except _IncompleteError:
+            self._retry_at = 2 * (len(self._buffer) - self._pos)
+        else:
+            self._buffer = ""
+        return items
+
+    def _next(self, pos: int) -> int:
+        """Return the position of the next non-whitespace character."""
+        buffer = self._buffer
+        while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+            pos += 1
+        if pos >= len(buffer):
+            raise _IncompleteError
+        return pos
+
+    def _value(self, pos: int) -> tuple[Any, int]:
+        """Parse the value at ``pos``; a value running to the end of the buffer may continue in the next chunk."""
+        try:
+            value, end = _decoder.raw_decode(self._buffer, pos)
+        except json.JSONDecodeError:
+            raise _IncompleteError from None
+        if not self._final and (
+            end >= len(self._buffer)
+            # a number is complete only once a delimiter follows it: "12" may continue as "12.5"
+            or (type(value) in (int, float) and self._buffer[end] not in _DELIMITERS)
+        ):
+            raise _IncompleteError
+        return value, end
+
+    def _step(self, items: list[Any]) -> None:
+        """Consume one token, committing the position only once the token is complete."""
+        pos = self._next(self._pos)
+        char = self._buffer[pos]
+        state = self._state
+        if state == "object":
+            if char != "{":
+                raise ValueError(f"Expected an object holding {self.path[self._depth]!r}, found {char!r}")
+            pos += 1
+            self._state = "key"
+        elif state == "key":
+            if char == "}":
+                self.done = True  # the array is missing: there are no items
+                pos += 1
+            elif char == ",":
+                pos += 1
+            else:
+                key, pos = self._value(pos)
+                pos = self._next(pos)
+                if self._buffer[pos] != ":":
+                    raise ValueError(f"Expected ':' after key {key!r}")
+                pos += 1
+                if key == self.path[self._depth]:
+                    self._depth += 1
+                    self._state = "object" if self._depth < len(self.path) else "array"
+                else:
+                    self._state = "skip"
+        elif state == "skip":
+            _, pos = self._value(pos)
+            self._state = "key"
+        elif state == "array":
+            if char == "[":
+                pos += 1
+                self._state = "item"
+            elif char == "{" and not self.path:
+                item, pos = self._value(pos)
+                items.append(item)
+                self.done = True
+            else:
+                value, pos = self._value(pos)
+                if value is not None:
+                    raise ValueError(f"Expected an array, found {type(value).__name__}")
+                self.done = True
+        elif char == "]":
+            pos += 1
+            self.done = True
+        elif char == ",":
+            pos += 1
+        else:
+            item, pos = self._value(pos)
+            items.append(item)
+        self._pos = pos
+
+
+def iter_array_items(chunks: Iterable[bytes], path: tuple[str, ...] = ()) -> Iterator[Any]:
+    """Yield each item of the array at ``path`` as the chunks of the document arrive."""
+    parser = ArrayItemParser(path)
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
+
+
+async def aiter_array_items(chunks: AsyncIterable[bytes], path: tuple[str, ...] = ()) -> AsyncIterator[Any]:
+    """Async variant of :func:`iter_array_items`."""
+    parser = ArrayItemParser(path)
+    async for chunk in chunks:
+        for item in parser.feed(chunk):
+            yield item
+    for item in parser.close():
+        yield item
+
+
+@dataclass(frozen=True, slots=True)
+class StreamPlan:
+    """Where the items of a response model are, and what they are.
+
+    :param tuple path: Keys of the objects enclosing the array of items
+    :param type item_model: Model of each item
+    """
+
+    path: tuple[str, ...]
+    item_model: type[BaseModel]
+
+
+def _list_item_model(annotation: Any) -> type[BaseModel] | None:
+    """Return X for an annotation of list[X] (or list[X] | None) where X is a model."""
+    if get_origin(annotation) is not list:
+        args: tuple[Any, ...] = tuple(arg for arg in get_args(annotation) if arg is not type(None))
+        if len(args) != 1:
+            return None
+        annotation = args[0]
+    args = get_args(annotation) if get_origin(annotation) is list else ()
+    if len(args) == 1 and isinstance(args[0], type) and issubclass(args[0], BaseModel):
+        return args[0]
+    return None
+
+
+_stream_plans: dict[type[BaseModel], StreamPlan] = {}
+
+
+def compile_stream_plan(model: type[BaseModel]) -> StreamPlan:
+    """Find the array of models to stream in a response model.
+
+    Root models stream their items; other models stream their only field holding a list of models.
+
+    :param type model: The response model
+    :raises ValueError: If the model does not contain exactly one array of models
+    """
+    plan = _stream_plans.get(model)
+    if plan is None:
+        if not model.__pydantic_complete__:
+            model.model_rebuild()
+        if model.__pydantic_root_model__:
+            item_model = _list_item_model(model.model_fields["root"].annotation)
+            candidates = [((), item_model)] if item_model is not None else []
+        else:
+            candidates = []
+            for name, field in model.model_fields.items():
+                item_model = _list_item_model(field.annotation)
+                if item_model is not None:
+                    key = field.validation_alias if isinstance(field.validation_alias, str) else field.alias or name
+                    candidates.append(((key,), item_model))
+        if len(candidates) != 1:
+            raise ValueError(f"{model.__name__} responses cannot be streamed: they do not hold one array of models")
+        path, item_model = candidates[0]
+        plan = _stream_plans[model] = StreamPlan(path, item_model)
+    return plan
+
+
+class ItemStream(Generic[T]):
+    """Iterator over the items of a streamed response.
+
+    The response is closed once the items are exhausted or an error is raised. Use the
+    stream as a context manager, or call :meth:`close`, to release the connection when
+    stopping early.
+    """
+
+    def __init__(self, items: Generator[T], close: Callable[[], object]) -> None:
+        self._items = items
+        self._close: Callable[[], object] | None = close
+
+    def __iter__(self) -> Self:
+        return self
+
+    def __next__(self) -> T:
+        if self._close is None:
+            raise StopIteration
+        try:
+            return next(self._items)
+        except BaseException:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        """Close the response; the stream yields no further items."""
+        close, self._close = self._close, None
+        if close is not None:
+            self._items.close()
+            close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+class AsyncItemStream(Generic[T]):
+    """Async iterator over the items of a streamed response, see :class:`ItemStream`."""
+
+    def __init__(self, items: AsyncGenerator[T], aclose: Callable[[], Awaitable[object]]) -> None:
+        self._items = items
+        self._aclose: Callable[[], Awaitable[object]] | None = aclose
+
+    def __aiter__(self) -> Self:
+        return self
+
+    async def __anext__(self) -> T:
+        if self._aclose is None:
+            raise StopAsyncIteration
+        try:
+            return await anext(self._items)
+        except BaseException:
+            await self.aclose()
+            raise
+
+    async def aclose(self) -> None:
+        """Close the response; the stream yields no further items."""
+        aclose, self._aclose = self._aclose, None
+        if aclose is not None:
+            await self._items.aclose()
+            await aclose()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+
+_streaming: ContextVar[bool] = ContextVar("tfl_streaming", default=False)
+
+
+@contextmanager
+def streaming() -> Iterator[None]:
+    """Make endpoint calls inside the ``with`` block return item streams instead of response models."""
+    token = _streaming.set(True)
+    try:
+        yield
+    finally:
+        _streaming.reset(token)
+
+
+def is_streaming() -> bool:
+    """Whether the current endpoint call should return an item stream."""
+    return _streaming.get()
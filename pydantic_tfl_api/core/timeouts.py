@@ -0,0 +1,104 @@
+# Timeouts
+# This module describes request timeouts split into connect/read/write/pool phases,
+# and resolves which timeout applies to a request: a per-call override, or the
+# per-operation phases (from the endpoint config) on top of the per-client timeout
+# or the process-wide default.
+
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, replace
+
+DEFAULT_TIMEOUT_SECONDS = 30.0
+"""Timeout for every phase of a request when nothing else is configured."""
+
+
+@dataclass(frozen=True)
+class Timeout:
+    """Per-phase request timeouts in seconds; None disables the timeout for that phase.
+
+    Backends that cannot enforce a phase ignore it: ``requests`` only supports
+    ``connect`` and ``read``.
+
+    :param float connect: Time allowed to establish a connection
+    :param float read: Time allowed between bytes received from the server
+    :param float write: Time allowed to send the request
+    :param float pool: Time allowed to wait for a free connection from the pool
+    """
+
+    connect: float | None = DEFAULT_TIMEOUT_SECONDS
+    read: float | None = DEFAULT_TIMEOUT_SECONDS
+    write: float | None = DEFAULT_TIMEOUT_SECONDS
+    pool: float | None = DEFAULT_TIMEOUT_SECONDS
+
+    @classmethod
+    def of(cls, value: "TimeoutTypes | None") -> "Timeout | None":
+        """Convert a number of seconds (applied to every phase) or a mapping of phases into a Timeout."""
+        if value is None or isinstance(value, Timeout):
+            return value
+        if isinstance(value, Mapping):
+            return cls(**value)
+        return cls(value, value, value, value)
+
+
+TimeoutTypes = Timeout | float | Mapping[str, float | None]
+"""Values accepted wherever a timeout can be configured."""
+
+_default_timeout = Timeout()
+
+_timeout_override: ContextVar[Timeout | None] = ContextVar("tfl_timeout_override", default=None)
+
+
+def get_default_timeout() -> Timeout:
+    """Return the process-wide default timeout."""
+    return _default_timeout
+
+
+def set_default_timeout(timeout: TimeoutTypes) -> None:
+    """Set the process-wide timeout used by clients without a more specific timeout."""
+    global _default_timeout
+    resolved = Timeout.of(timeout)
+    if resolved is None:
+        raise ValueError("timeout must not be None")
+    _default_timeout = resolved
+
+
+@contextmanager
+def override_timeout(timeout: TimeoutTypes) -> Iterator[Timeout]:
+    """Use ``timeout`` for every request made inside the ``with`` block.
+
+    The override is stored in a context variable, so it applies to the current
+    thread or asyncio task only and takes precedence over every other setting.
+    """
+    resolved = Timeout.of(timeout)
+    if resolved is None:
+        raise ValueError("timeout must not be None")
+    token = _timeout_override.set(resolved)
+    try:
+        yield resolved
+    finally:
+        _timeout_override.reset(token)
+
+
+def timeout_phases(value: TimeoutTypes | None) -> dict[str, float | None]:
+    """Return the phases set by a timeout: those named in a mapping, or all four for seconds or a Timeout."""
+    if value is None:
+        return {}
+    if isinstance(value, Mapping):
+        return dict(value)
+    return asdict(Timeout.of(value))
+
+
+def resolve_timeout(client_timeout: Timeout | None, operation_timeout: TimeoutTypes | None) -> Timeout:
+    """Pick the timeout for a request.
+
+    A per-call override applies as is. Otherwise the phases given for the operation, such as the
+    longer read timeout of a slow endpoint, replace those of the per-client timeout, or of the
+    default when the client has none.
+    """
+    override = _timeout_override.get()
+    if override is not None:
+        return override
+    base = client_timeout or _default_timeout
+    phases = timeout_phases(operation_timeout)
+    return replace(base, **phases) if phases else base
@@ -1,4 +1,4 @@
 base_url = "https://api.tfl.gov.uk"
 endpoints = {
-    'AccidentStats_Get': {'uri': '/AccidentStats/{0}', 'model': 'AccidentDetailArray'},
+    'AccidentStats_Get': {'uri': '/AccidentStats/{0}', 'model': 'AccidentDetailArray', 'timeout': {'read': 300.0}},
 }
@@ -1,19 +1,22 @@
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
-from .LineClient import AsyncLineClient, LineClient
-from .AirQualityClient import AsyncAirQualityClient, AirQualityClient
-from .OccupancyClient import AsyncOccupancyClient, OccupancyClient
-from .VehicleClient import AsyncVehicleClient, VehicleClient
-from .CrowdingClient import AsyncCrowdingClient, CrowdingClient
-from .BikePointClient import AsyncBikePointClient, BikePointClient
-from .SearchClient import AsyncSearchClient, SearchClient
-from .AccidentStatsClient import AsyncAccidentStatsClient, AccidentStatsClient
-from .JourneyClient import AsyncJourneyClient, JourneyClient
-from .RoadClient import AsyncRoadClient, RoadClient
-from .PlaceClient import AsyncPlaceClient, PlaceClient
-from .ModeClient import AsyncModeClient, ModeClient
-from .StopPointClient import AsyncStopPointClient, StopPointClient
-from .LiftDisruptionsClient import AsyncLiftDisruptionsClient, LiftDisruptionsClient
+from ..core.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from .LineClient import AsyncLineClient, LineClient
+    from .AirQualityClient import AsyncAirQualityClient, AirQualityClient
+    from .OccupancyClient import AsyncOccupancyClient, OccupancyClient
+    from .VehicleClient import AsyncVehicleClient, VehicleClient
+    from .CrowdingClient import AsyncCrowdingClient, CrowdingClient
+    from .BikePointClient import AsyncBikePointClient, BikePointClient
+    from .SearchClient import AsyncSearchClient, SearchClient
+    from .AccidentStatsClient import AsyncAccidentStatsClient, AccidentStatsClient
+    from .JourneyClient import AsyncJourneyClient, JourneyClient
+    from .RoadClient import AsyncRoadClient, RoadClient
+    from .PlaceClient import AsyncPlaceClient, PlaceClient
+    from .ModeClient import AsyncModeClient, ModeClient
+    from .StopPointClient import AsyncStopPointClient, StopPointClient
+    from .LiftDisruptionsClient import AsyncLiftDisruptionsClient, LiftDisruptionsClient
 
 TfLEndpoint = Literal[
     "LineClient",
@@ -79,3 +82,36 @@ __all__ = [
     "AsyncStopPointClient",
     "AsyncLiftDisruptionsClient",
 ]
+
+_CLIENT_MODULES = {
+    "LineClient": ".LineClient",
+    "AsyncLineClient": ".LineClient",
+    "AirQualityClient": ".AirQualityClient",
+    "AsyncAirQualityClient": ".AirQualityClient",
+    "OccupancyClient": ".OccupancyClient",
+    "AsyncOccupancyClient": ".OccupancyClient",
+    "VehicleClient": ".VehicleClient",
+    "AsyncVehicleClient": ".VehicleClient",
+    "CrowdingClient": ".CrowdingClient",
+    "AsyncCrowdingClient": ".CrowdingClient",
+    "BikePointClient": ".BikePointClient",
+    "AsyncBikePointClient": ".BikePointClient",
+    "SearchClient": ".SearchClient",
+    "AsyncSearchClient": ".SearchClient",
+    "AccidentStatsClient": ".AccidentStatsClient",
+    "AsyncAccidentStatsClient": ".AccidentStatsClient",
+    "JourneyClient": ".JourneyClient",
+    "AsyncJourneyClient": ".JourneyClient",
+    "RoadClient": ".RoadClient",
+    "AsyncRoadClient": ".RoadClient",
+    "PlaceClient": ".PlaceClient",
+    "AsyncPlaceClient": ".PlaceClient",
+    "ModeClient": ".ModeClient",
+    "AsyncModeClient": ".ModeClient",
+    "StopPointClient": ".StopPointClient",
+    "AsyncStopPointClient": ".StopPointClient",
+    "LiftDisruptionsClient": ".LiftDisruptionsClient",
+    "AsyncLiftDisruptionsClient": ".LiftDisruptionsClient",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _CLIENT_MODULES)
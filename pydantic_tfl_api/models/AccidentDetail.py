@@ -15,4 +15,4 @@ class AccidentDetail(BaseModel):
     casualties: list[Casualty] | None = Field(None)
     vehicles: list[Vehicle] | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
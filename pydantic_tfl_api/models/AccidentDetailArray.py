@@ -5,4 +5,4 @@ from .AccidentDetail import AccidentDetail
 
 class AccidentDetailArray(RootModel[list[AccidentDetail]]):
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -5,4 +5,4 @@ class ActiveServiceType(BaseModel):
     mode: str | None = Field(None)
     serviceType: str | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
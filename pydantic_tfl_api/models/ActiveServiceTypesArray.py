@@ -5,4 +5,4 @@ from .ActiveServiceType import ActiveServiceType
 
 class ActiveServiceTypesArray(RootModel[list[ActiveServiceType]]):
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -8,4 +8,4 @@ class AdditionalProperties(BaseModel):
     value: str | None = Field(None)
     modified: str | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -22,4 +22,4 @@ class ArrivalDeparture(BaseModel):
     departureStatus: DepartureStatusEnum | None = Field(None, description="Status of departure")
     timing: PredictionTiming | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
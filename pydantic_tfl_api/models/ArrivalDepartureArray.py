@@ -5,4 +5,4 @@ from .ArrivalDeparture import ArrivalDeparture
 
 class ArrivalDepartureArray(RootModel[list[ArrivalDeparture]]):
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
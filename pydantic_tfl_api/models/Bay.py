@@ -7,4 +7,4 @@ class Bay(BaseModel):
     free: int | None = Field(None)
     occupied: int | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -10,4 +10,4 @@ class BikePointOccupancy(BaseModel):
     emptyDocks: int | None = Field(None, description="Empty docks")
     totalDocks: int | None = Field(None, description="Total docks available")
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
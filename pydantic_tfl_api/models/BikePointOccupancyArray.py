@@ -5,4 +5,4 @@ from .BikePointOccupancy import BikePointOccupancy
 
 class BikePointOccupancyArray(RootModel[list[BikePointOccupancy]]):
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
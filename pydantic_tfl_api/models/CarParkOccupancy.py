@@ -9,4 +9,4 @@ class CarParkOccupancy(BaseModel):
     name: str | None = Field(None)
     carParkDetailsUrl: str | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -8,4 +8,4 @@ class Casualty(BaseModel):
     mode: str | None = Field(None)
     ageBand: str | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
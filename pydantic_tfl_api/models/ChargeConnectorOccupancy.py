@@ -6,4 +6,4 @@ class ChargeConnectorOccupancy(BaseModel):
     sourceSystemPlaceId: str | None = Field(None)
     status: str | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
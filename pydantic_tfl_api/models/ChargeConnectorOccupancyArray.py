@@ -5,4 +5,4 @@ from .ChargeConnectorOccupancy import ChargeConnectorOccupancy
 
 class ChargeConnectorOccupancyArray(RootModel[list[ChargeConnectorOccupancy]]):
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
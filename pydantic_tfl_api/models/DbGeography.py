@@ -6,4 +6,4 @@ from .DbGeographyWellKnownValue import DbGeographyWellKnownValue
 class DbGeography(BaseModel):
     geography: DbGeographyWellKnownValue | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -6,4 +6,4 @@ class DbGeographyWellKnownValue(BaseModel):
     wellKnownText: str | None = Field(None)
     wellKnownBinary: str | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -6,4 +6,4 @@ from .DisambiguationOption import DisambiguationOption
 class Disambiguation(BaseModel):
     disambiguationOptions: list[DisambiguationOption] | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -13,4 +13,4 @@ class DisruptedPoint(BaseModel):
     appearance: str | None = Field(None)
     additionalInformation: str | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -5,4 +5,4 @@ from .DisruptedPoint import DisruptedPoint
 
 class DisruptedPointArray(RootModel[list[DisruptedPoint]]):
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
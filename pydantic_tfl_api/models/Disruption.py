@@ -20,4 +20,4 @@ class Disruption(BaseModel):
     affectedStops: list[StopPoint] | None = Field(None, description="Gets or sets the stops affected by this disruption")
     closureText: str | None = Field(None, description="Text describing the closure type")
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
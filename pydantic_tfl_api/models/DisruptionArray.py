@@ -5,4 +5,4 @@ from .Disruption import Disruption
 
 class DisruptionArray(RootModel[list[Disruption]]):
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
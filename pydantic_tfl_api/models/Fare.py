@@ -14,4 +14,4 @@ class Fare(BaseModel):
     offPeak: int | None = Field(None)
     taps: list[FareTap] | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
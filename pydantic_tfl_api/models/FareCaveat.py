@@ -5,4 +5,4 @@ class FareCaveat(BaseModel):
     text: str | None = Field(None)
     type: str | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
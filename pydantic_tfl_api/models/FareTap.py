@@ -7,4 +7,4 @@ class FareTap(BaseModel):
     atcoCode: str | None = Field(None)
     tapDetails: FareTapDetails | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -9,4 +9,4 @@ class FareTapDetails(BaseModel):
     nationalLocationCode: int | None = Field(None)
     tapTimestamp: str | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
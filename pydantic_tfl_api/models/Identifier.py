@@ -15,4 +15,4 @@ class Identifier(BaseModel):
     routeType: RouteTypeEnum | None = Field(None)
     status: StatusEnum | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -8,4 +8,4 @@ class Instruction(BaseModel):
     detailed: str | None = Field(None)
     steps: list[InstructionStep] | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -20,4 +20,4 @@ class InstructionStep(BaseModel):
     descriptionHeading: str | None = Field(None)
     trackType: TrackTypeEnum | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -5,4 +5,4 @@ class Interval(BaseModel):
     stopId: str | None = Field(None)
     timeToArrival: float | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -18,4 +18,4 @@ class ItineraryResult(BaseModel):
     searchCriteria: SearchCriteria | None = Field(None)
     journeyVector: JourneyVector | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
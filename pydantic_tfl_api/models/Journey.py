@@ -13,4 +13,4 @@ class Journey(BaseModel):
     legs: list[Leg] | None = Field(None)
     fare: JourneyFare | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
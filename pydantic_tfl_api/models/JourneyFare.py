@@ -9,4 +9,4 @@ class JourneyFare(BaseModel):
     fares: list[Fare] | None = Field(None)
     caveats: list[FareCaveat] | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -9,4 +9,4 @@ class JourneyPlannerCycleHireDockingStationData(BaseModel):
     originId: str | None = Field(None)
     destinationId: str | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -7,4 +7,4 @@ class JourneyVector(BaseModel):
     via: str | None = Field(None)
     uri: str | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
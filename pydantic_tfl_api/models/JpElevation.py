@@ -10,4 +10,4 @@ class JpElevation(BaseModel):
     heightFromPreviousPoint: int | None = Field(None)
     gradient: float | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -6,4 +6,4 @@ class KnownJourney(BaseModel):
     minute: str | None = Field(None)
     intervalId: int | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
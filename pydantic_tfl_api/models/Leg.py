@@ -28,4 +28,4 @@ class Leg(BaseModel):
     isDisrupted: bool | None = Field(None)
     hasFixedLocations: bool | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -9,4 +9,4 @@ class LiftDisruption(BaseModel):
     outageEndArea: str | None = Field(None, description="Id for the end of the disrupted lift route")
     message: str | None = Field(None, description="Customer facing message for the disrupted lift route")
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -5,4 +5,4 @@ from .LiftDisruption import LiftDisruption
 
 class LiftDisruptionsArray(RootModel[list[LiftDisruption]]):
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
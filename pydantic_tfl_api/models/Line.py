@@ -19,4 +19,4 @@ class Line(BaseModel):
     serviceTypes: list[LineServiceTypeInfo] | None = Field(None)
     crowding: Crowding | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
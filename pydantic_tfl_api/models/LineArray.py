@@ -5,4 +5,4 @@ from .Line import Line
 
 class LineArray(RootModel[list[Line]]):
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -6,4 +6,4 @@ class LineGroup(BaseModel):
     stationAtcoCode: str | None = Field(None)
     lineIdentifier: list[str] | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
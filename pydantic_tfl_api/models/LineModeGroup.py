@@ -5,4 +5,4 @@ class LineModeGroup(BaseModel):
     modeName: str | None = Field(None)
     lineIdentifier: list[str] | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -10,4 +10,4 @@ class LineRouteSection(BaseModel):
     serviceType: str | None = Field(None)
     vehicleDestinationText: str | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -7,4 +7,4 @@ class LineServiceType(BaseModel):
     lineName: str | None = Field(None)
     lineSpecificServiceTypes: list[LineSpecificServiceType] | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -5,4 +5,4 @@ from .LineServiceType import LineServiceType
 
 class LineServiceTypeArray(RootModel[list[LineServiceType]]):
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
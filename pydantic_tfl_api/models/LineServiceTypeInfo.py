@@ -5,4 +5,4 @@ class LineServiceTypeInfo(BaseModel):
     name: str | None = Field(None)
     uri: str | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -7,4 +7,4 @@ class LineSpecificServiceType(BaseModel):
     serviceType: LineServiceTypeInfo | None = Field(None)
     stopServesServiceType: bool | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -15,4 +15,4 @@ class LineStatus(BaseModel):
     validityPeriods: list[ValidityPeriod] | None = Field(None)
     disruption: Disruption | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
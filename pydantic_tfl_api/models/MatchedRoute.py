@@ -15,4 +15,4 @@ class MatchedRoute(BaseModel):
     validTo: str | None = Field(None, description="The DateTime that the Service containing this Route is valid until.")
     validFrom: str | None = Field(None, description="The DateTime that the Service containing this Route is valid from.")
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
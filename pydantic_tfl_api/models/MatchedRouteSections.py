@@ -4,4 +4,4 @@ from pydantic import BaseModel, ConfigDict, Field
 class MatchedRouteSections(BaseModel):
     id: int | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -25,4 +25,4 @@ class MatchedStop(BaseModel):
     lat: float | None = Field(None)
     lon: float | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -7,4 +7,4 @@ class Mode(BaseModel):
     isScheduledService: bool | None = Field(None)
     modeName: str | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
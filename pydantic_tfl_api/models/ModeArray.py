@@ -5,4 +5,4 @@ from .Mode import Mode
 
 class ModeArray(RootModel[list[Mode]]):
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
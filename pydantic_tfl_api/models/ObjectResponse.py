@@ -5,4 +5,4 @@ from pydantic import ConfigDict, RootModel
 
 class ObjectResponse(RootModel[dict[str, Any]]):
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
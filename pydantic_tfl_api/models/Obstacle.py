@@ -7,4 +7,4 @@ class Obstacle(BaseModel):
     stopId: int | None = Field(None)
     position: str | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
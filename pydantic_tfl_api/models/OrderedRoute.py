@@ -6,4 +6,4 @@ class OrderedRoute(BaseModel):
     naptanIds: list[str] | None = Field(None)
     serviceType: str | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -9,4 +9,4 @@ class Path(BaseModel):
     stopPoints: list[Identifier] | None = Field(None)
     elevation: list[JpElevation] | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -5,4 +5,4 @@ class PathAttribute(BaseModel):
     name: str | None = Field(None)
     value: str | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -11,4 +11,4 @@ class Period(BaseModel):
     toTime: TwentyFourHourClockTime | None = Field(None)
     frequency: ServiceFrequency | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
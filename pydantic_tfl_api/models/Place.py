@@ -15,6 +15,4 @@ class Place(BaseModel):
     lat: float | None = Field(None, description="WGS84 latitude of the location.")
     lon: float | None = Field(None, description="WGS84 longitude of the location.")
 
-    model_config = ConfigDict(from_attributes=True)
-
-Place.model_rebuild()
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
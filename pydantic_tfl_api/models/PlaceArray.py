@@ -5,4 +5,4 @@ from .Place import Place
 
 class PlaceArray(RootModel[list[Place]]):
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -5,4 +5,4 @@ class PlaceCategory(BaseModel):
     category: str | None = Field(None)
     availableKeys: list[str] | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
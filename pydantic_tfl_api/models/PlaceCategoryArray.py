@@ -5,4 +5,4 @@ from .PlaceCategory import PlaceCategory
 
 class PlaceCategoryArray(RootModel[list[PlaceCategory]]):
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -7,4 +7,4 @@ class PlannedWork(BaseModel):
     createdDateTime: str | None = Field(None)
     lastUpdateDateTime: str | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
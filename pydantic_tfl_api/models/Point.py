@@ -7,4 +7,4 @@ class Point(BaseModel):
     lat: float | None = Field(None, description="WGS84 latitude of the location.")
     lon: float | None = Field(None, description="WGS84 longitude of the location.")
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -27,4 +27,4 @@ class Prediction(BaseModel):
     modeName: str | None = Field(None, description="The mode name of the station/line the prediction relates to")
     timing: PredictionTiming | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -5,4 +5,4 @@ from .Prediction import Prediction
 
 class PredictionArray(RootModel[list[Prediction]]):
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -9,4 +9,4 @@ class PredictionTiming(BaseModel):
     sent: str | None = Field(None)
     received: str | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -13,4 +13,4 @@ class RoadCorridor(BaseModel):
     statusAggregationEndDate: str | None = Field(None, description="The end of the period over which status has been aggregated, or null if this is the current corridor status.")
     url: str | None = Field(None, description="URL to retrieve this Corridor.")
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -5,4 +5,4 @@ from .RoadCorridor import RoadCorridor
 
 class RoadCorridorsArray(RootModel[list[RoadCorridor]]):
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
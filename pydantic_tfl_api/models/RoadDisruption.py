@@ -41,4 +41,4 @@ class RoadDisruption(BaseModel):
     roadDisruptionImpactAreas: list[RoadDisruptionImpactArea] | None = Field(None)
     recurringSchedules: list[RoadDisruptionSchedule] | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -13,4 +13,4 @@ class RoadDisruptionLine(BaseModel):
     startTime: str | None = Field(None)
     endTime: str | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -5,4 +5,4 @@ from .RoadDisruption import RoadDisruption
 
 class RoadDisruptionsArray(RootModel[list[RoadDisruption]]):
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -22,4 +22,4 @@ class RoadProject(BaseModel):
     externalPageUrl: str | None = Field(None)
     projectSummaryPageUrl: str | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -9,4 +9,4 @@ class RouteOption(BaseModel):
     directions: list[str] | None = Field(None)
     lineIdentifier: Identifier | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
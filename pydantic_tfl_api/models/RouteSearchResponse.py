@@ -7,4 +7,4 @@ class RouteSearchResponse(BaseModel):
     input: str | None = Field(None)
     searchMatches: list[RouteSearchMatch] | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -16,4 +16,4 @@ class RouteSection(BaseModel):
     validFrom: str | None = Field(None, description="The DateTime that the Service containing this Route is valid from.")
     routeSectionNaptanEntrySequence: list[RouteSectionNaptanEntrySequence] | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
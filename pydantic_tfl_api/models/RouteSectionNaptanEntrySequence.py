@@ -7,4 +7,4 @@ class RouteSectionNaptanEntrySequence(BaseModel):
     ordinal: int | None = Field(None)
     stopPoint: StopPoint | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -16,4 +16,4 @@ class RouteSequence(BaseModel):
     stopPointSequences: list[StopPointSequence] | None = Field(None)
     orderedLineRoutes: list[OrderedRoute] | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
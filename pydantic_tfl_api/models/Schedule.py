@@ -11,4 +11,4 @@ class Schedule(BaseModel):
     lastJourney: KnownJourney | None = Field(None)
     periods: list[Period] | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
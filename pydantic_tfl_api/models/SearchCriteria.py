@@ -9,4 +9,4 @@ class SearchCriteria(BaseModel):
     dateTimeType: DateTimeTypeEnum | None = Field(None)
     timeAdjustments: TimeAdjustments | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -8,4 +8,4 @@ class SearchMatch(BaseModel):
     lat: float | None = Field(None)
     lon: float | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -13,4 +13,4 @@ class SearchResponse(BaseModel):
     matches: list[SearchMatch] | None = Field(None)
     maxScore: float | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -5,4 +5,4 @@ class ServiceFrequency(BaseModel):
     lowestFrequency: float | None = Field(None)
     highestFrequency: float | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -7,4 +7,4 @@ class StationInterval(BaseModel):
     id: str | None = Field(None)
     intervals: list[Interval] | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
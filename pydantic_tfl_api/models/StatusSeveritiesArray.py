@@ -5,4 +5,4 @@ from .StatusSeverity import StatusSeverity
 
 class StatusSeveritiesArray(RootModel[list[StatusSeverity]]):
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -6,4 +6,4 @@ class StatusSeverity(BaseModel):
     severityLevel: int | None = Field(None)
     description: str | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -5,4 +5,4 @@ from .StopPoint import StopPoint
 
 class StopPointArray(RootModel[list[StopPoint]]):
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -15,4 +15,4 @@ class StopPointRouteSection(BaseModel):
     vehicleDestinationText: str | None = Field(None)
     destinationName: str | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -5,4 +5,4 @@ from .StopPointRouteSection import StopPointRouteSection
 
 class StopPointRouteSectionArray(RootModel[list[StopPointRouteSection]]):
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -14,4 +14,4 @@ class StopPointSequence(BaseModel):
     stopPoint: list[MatchedStop] | None = Field(None)
     serviceType: ServiceTypeEnum | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
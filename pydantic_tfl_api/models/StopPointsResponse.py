@@ -12,4 +12,4 @@ class StopPointsResponse(BaseModel):
     total: int | None = Field(None, description="The total number of StopPoints available across all pages")
     page: int | None = Field(None, description="The index of this page")
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -11,4 +11,4 @@ class Street(BaseModel):
     sourceSystemId: int | None = Field(None, description="The ID from the source system of the disruption that this street belongs to.")
     sourceSystemKey: str | None = Field(None, description="The key of the source system of the disruption that this street belongs to.")
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -9,4 +9,4 @@ class TimeAdjustments(BaseModel):
     later: TimeAdjustment | None = Field(None)
     latest: TimeAdjustment | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -7,4 +7,4 @@ class Timetable(BaseModel):
     departureStopId: str | None = Field(None)
     routes: list[TimetableRoute] | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
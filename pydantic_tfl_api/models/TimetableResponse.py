@@ -16,4 +16,4 @@ class TimetableResponse(BaseModel):
     disambiguation: Disambiguation | None = Field(None)
     statusErrorMessage: str | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -8,4 +8,4 @@ class TimetableRoute(BaseModel):
     stationIntervals: list[StationInterval] | None = Field(None)
     schedules: list[Schedule] | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
@@ -10,4 +10,4 @@ class TrainLoading(BaseModel):
     timeSlice: str | None = Field(None, description="Time in 24hr format with 15 minute intervals e.g. 0500-0515, 0515-0530 etc.")
     value: int | None = Field(None, description="Scale between 1-6, 1 = Very quiet, 2 = Quiet, 3 = Fairly busy, 4 = Busy, 5 = Very busy, 6 = Exceptionally busy")
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
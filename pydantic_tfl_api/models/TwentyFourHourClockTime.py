@@ -5,4 +5,4 @@ class TwentyFourHourClockTime(BaseModel):
     hour: str | None = Field(None)
     minute: str | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
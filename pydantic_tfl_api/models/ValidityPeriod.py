@@ -8,4 +8,4 @@ class ValidityPeriod(BaseModel):
     toDate: str | None = Field(None, description="Gets or sets the end date.")
     isNow: bool | None = Field(None, description="If true is a realtime status rather than planned or info")
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
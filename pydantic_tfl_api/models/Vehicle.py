@@ -4,4 +4,4 @@ from pydantic import BaseModel, ConfigDict, Field
 class Vehicle(BaseModel):
     type: str | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
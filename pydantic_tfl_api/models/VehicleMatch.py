@@ -11,4 +11,4 @@ class VehicleMatch(BaseModel):
     colour: str | None = Field(None)
     compliance: ComplianceEnum | None = Field(None)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
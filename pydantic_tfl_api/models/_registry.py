@@ -0,0 +1,120 @@
+# Generated by the build system: model name -> module, relative to this package
+
+MODEL_MODULES: dict[str, str] = {
+    "AccidentDetail": ".AccidentDetail",
+    "AccidentDetailArray": ".AccidentDetailArray",
+    "ActiveServiceType": ".ActiveServiceType",
+    "ActiveServiceTypesArray": ".ActiveServiceTypesArray",
+    "AdditionalProperties": ".AdditionalProperties",
+    "ArrivalDeparture": ".ArrivalDeparture",
+    "ArrivalDepartureArray": ".ArrivalDepartureArray",
+    "Bay": ".Bay",
+    "BikePointOccupancy": ".BikePointOccupancy",
+    "BikePointOccupancyArray": ".BikePointOccupancyArray",
+    "CarParkOccupancy": ".CarParkOccupancy",
+    "Casualty": ".Casualty",
+    "ChargeConnectorOccupancy": ".ChargeConnectorOccupancy",
+    "ChargeConnectorOccupancyArray": ".ChargeConnectorOccupancyArray",
+    "Crowding": ".Crowding",
+    "DbGeography": ".DbGeography",
+    "DbGeographyWellKnownValue": ".DbGeographyWellKnownValue",
+    "Disambiguation": ".Disambiguation",
+    "DisambiguationOption": ".DisambiguationOption",
+    "DisruptedPoint": ".DisruptedPoint",
+    "DisruptedPointArray": ".DisruptedPointArray",
+    "Disruption": ".Disruption",
+    "DisruptionArray": ".DisruptionArray",
+    "Fare": ".Fare",
+    "FareCaveat": ".FareCaveat",
+    "FareTap": ".FareTap",
+    "FareTapDetails": ".FareTapDetails",
+    "Identifier": ".Identifier",
+    "Instruction": ".Instruction",
+    "InstructionStep": ".InstructionStep",
+    "Interval": ".Interval",
+    "ItineraryResult": ".ItineraryResult",
+    "Journey": ".Journey",
+    "JourneyFare": ".JourneyFare",
+    "JourneyPlannerCycleHireDockingStationData": ".JourneyPlannerCycleHireDockingStationData",
+    "JourneyVector": ".JourneyVector",
+    "JpElevation": ".JpElevation",
+    "KnownJourney": ".KnownJourney",
+    "Leg": ".Leg",
+    "LiftDisruption": ".LiftDisruption",
+    "LiftDisruptionsArray": ".LiftDisruptionsArray",
+    "Line": ".Line",
+    "LineArray": ".LineArray",
+    "LineGroup": ".LineGroup",
+    "LineModeGroup": ".LineModeGroup",
+    "LineRouteSection": ".LineRouteSection",
+    "LineServiceType": ".LineServiceType",
+    "LineServiceTypeArray": ".LineServiceTypeArray",
+    "LineServiceTypeInfo": ".LineServiceTypeInfo",
+    "LineSpecificServiceType": ".LineSpecificServiceType",
+    "LineStatus": ".LineStatus",
+    "LondonAirForecast": ".LondonAirForecast",
+    "MatchedRoute": ".MatchedRoute",
+    "MatchedRouteSections": ".MatchedRouteSections",
+    "MatchedStop": ".MatchedStop",
+    "Mode": ".Mode",
+    "ModeArray": ".ModeArray",
+    "Object": ".Object",
+    "ObjectResponse": ".ObjectResponse",
+    "Obstacle": ".Obstacle",
+    "OrderedRoute": ".OrderedRoute",
+    "PassengerFlow": ".PassengerFlow",
+    "Path": ".Path",
+    "PathAttribute": ".PathAttribute",
+    "Period": ".Period",
+    "Place": ".Place",
+    "PlaceArray": ".PlaceArray",
+    "PlaceCategory": ".PlaceCategory",
+    "PlaceCategoryArray": ".PlaceCategoryArray",
+    "PlannedWork": ".PlannedWork",
+    "Point": ".Point",
+    "Prediction": ".Prediction",
+    "PredictionArray": ".PredictionArray",
+    "PredictionTiming": ".PredictionTiming",
+    "RoadCorridor": ".RoadCorridor",
+    "RoadCorridorsArray": ".RoadCorridorsArray",
+    "RoadDisruption": ".RoadDisruption",
+    "RoadDisruptionImpactArea": ".RoadDisruptionImpactArea",
+    "RoadDisruptionLine": ".RoadDisruptionLine",
+    "RoadDisruptionSchedule": ".RoadDisruptionSchedule",
+    "RoadDisruptionsArray": ".RoadDisruptionsArray",
+    "RoadProject": ".RoadProject",
+    "RouteOption": ".RouteOption",
+    "RouteSearchMatch": ".RouteSearchMatch",
+    "RouteSearchResponse": ".RouteSearchResponse",
+    "RouteSection": ".RouteSection",
+    "RouteSectionNaptanEntrySequence": ".RouteSectionNaptanEntrySequence",
+    "RouteSequence": ".RouteSequence",
+    "Schedule": ".Schedule",
+    "SearchCriteria": ".SearchCriteria",
+    "SearchMatch": ".SearchMatch",
+    "SearchResponse": ".SearchResponse",
+    "ServiceFrequency": ".ServiceFrequency",
+    "StationInterval": ".StationInterval",
+    "StatusSeveritiesArray": ".StatusSeveritiesArray",
+    "StatusSeverity": ".StatusSeverity",
+    "StopPoint": ".StopPoint",
+    "StopPointArray": ".StopPointArray",
+    "StopPointRouteSection": ".StopPointRouteSection",
+    "StopPointRouteSectionArray": ".StopPointRouteSectionArray",
+    "StopPointSequence": ".StopPointSequence",
+    "StopPointsResponse": ".StopPointsResponse",
+    "Street": ".Street",
+    "StreetSegment": ".StreetSegment",
+    "StringsArray": ".StringsArray",
+    "TimeAdjustment": ".TimeAdjustment",
+    "TimeAdjustments": ".TimeAdjustments",
+    "Timetable": ".Timetable",
+    "TimetableResponse": ".TimetableResponse",
+    "TimetableRoute": ".TimetableRoute",
+    "TrainLoading": ".TrainLoading",
+    "TwentyFourHourClockTime": ".TwentyFourHourClockTime",
+    "ValidityPeriod": ".ValidityPeriod",
+    "Vehicle": ".Vehicle",
+    "VehicleMatch": ".VehicleMatch",
+    "GenericResponseModel": "..core.package_models",
+}
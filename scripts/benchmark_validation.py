@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Benchmark the validation modes of the response deserializer against the recorded TfL responses.
+
+Each response body in tests/tfl_responses is deserialized into its model with every
+validation mode ("full", "construct" and "raw"), the way the clients deserialize a
+response. The best of several runs is reported per response, with the total over all
+responses and the time of each mode relative to "full".
+
+Usage:
+    python scripts/benchmark_validation.py [--repeat N] [--largest N]
+"""
+
+import argparse
+import json
+import sys
+import timeit
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).parent.parent
+RESPONSES_DIR = REPO_ROOT / "tests" / "tfl_responses"
+
+sys.path.insert(0, str(REPO_ROOT))
+
+from pydantic_tfl_api.core.deserializer import VALIDATION_MODES, compile_deserializer  # noqa: E402
+from pydantic_tfl_api.core.model_registry import get_model_registry  # noqa: E402
+from tests.config_for_tests import response_to_request_mapping  # noqa: E402
+
+
+def load_responses() -> list[tuple[str, str, bytes]]:
+    """Return the name, model name and body of every recorded response, largest first."""
+    responses = []
+    for name, request in response_to_request_mapping.items():
+        with open(RESPONSES_DIR / f"{name}.json") as f:
+            content = json.load(f)["content"].encode()
+        responses.append((name, request["model"], content))
+    return sorted(responses, key=lambda response: len(response[2]), reverse=True)
+
+
+def best_time(function: Callable[[], object], repeat: int) -> float:
+    """Return the fastest of ``repeat`` runs of ``function``, in seconds."""
+    return min(timeit.repeat(function, number=1, repeat=repeat))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=20, help="runs per response and mode (default: 20)")
+    parser.add_argument("--largest", type=int, default=10, help="responses listed individually (default: 10)")
+    args = parser.parse_args()
+
+    models = get_model_registry()
+    totals = dict.fromkeys(VALIDATION_MODES, 0.0)
+    rows = []
+    for name, model_name, content in load_responses():
+        deserializer = compile_deserializer(models[model_name])
+        times = {}
+        for mode in VALIDATION_MODES:
+            deserializer(content, mode)  # build the plan for the mode before timing it
+            times[mode] = best_time(partial(deserializer, content, mode), args.repeat)
+            totals[mode] += times[mode]
+        rows.append((name, len(content), times))
+
+    header = f"{'response':<58} {'KiB':>7}" + "".join(f" {mode + ' ms':>13}" for mode in VALIDATION_MODES)
+    print(header)
+    print("-" * len(header))
+    for name, size, times in rows[: args.largest]:
+        print(f"{name:<58} {size / 1024:>7.0f}" + "".join(f" {times[mode] * 1000:>13.2f}" for mode in VALIDATION_MODES))
+    print("-" * len(header))
+    size = sum(row[1] for row in rows)
+    label = f"all {len(rows)} responses"
+    print(f"{label:<58} {size / 1024:>7.0f}" + "".join(f" {totals[mode] * 1000:>13.2f}" for mode in VALIDATION_MODES))
+    print(
+        f"{'relative to full':<66}" + "".join(f" {totals[mode] / totals['full']:>13.2f}" for mode in VALIDATION_MODES)
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -17,6 +17,13 @@ from .utilities import (
     sanitize_name,
 )
 
+# Operations that are known to respond slowly, mapped to the timeout phases written into
+# their endpoint config entry (see pydantic_tfl_api.core.timeouts.Timeout).
+OPERATION_TIMEOUTS: dict[str, dict[str, float]] = {
+    # a whole year of accident statistics takes minutes to generate
+    "AccidentStats_Get": {"read": 300.0},
+}
+
 
 def get_api_name(spec: dict[str, Any]) -> str:
     """Extract API name from OpenAPI specification."""
@@ -228,7 +235,10 @@ class ClientGenerator:
 
                     model_name = self.get_model_name_from_path(response_content)
 
-                    config_lines.append(f"    '{operation_id}': {{'uri': '{path_uri}', 'model': '{model_name}'}},\n")
+                    entry = f"'uri': '{path_uri}', 'model': '{model_name}'"
+                    if timeout := OPERATION_TIMEOUTS.get(operation_id):
+                        entry += f", 'timeout': {timeout!r}"
+                    config_lines.append(f"    '{operation_id}': {{{entry}}},\n")
 
         config_lines.append("}\n")
 
@@ -402,24 +412,36 @@ class ClientGenerator:
 
         init_file_path = os.path.join(base_path, "__init__.py")
         with open(init_file_path, "w") as init_file:
-            class_names_joined = ",\n    ".join(all_class_names)
-            init_file.write(f"from .endpoints import (\n    {class_names_joined},\n)\n")
+            init_file.write("from typing import TYPE_CHECKING\n\n")
             init_file.write("from . import models\n")
-            init_file.write("from .core import __version__\n")
+            init_file.write("from .core import __version__, warmup\n")
+            init_file.write("from .core.lazy_imports import lazy_exports\n\n")
+
+            # Clients are imported from .endpoints on first access; the import is only for type checkers
+            class_names_joined = ",\n        ".join(all_class_names)
+            init_file.write(f"if TYPE_CHECKING:\n    from .endpoints import (\n        {class_names_joined},\n    )\n")
 
             init_file.write("\n__all__ = [\n")
             init_file.write(",\n".join([f'    "{name}"' for name in all_class_names]))
-            init_file.write(',\n    "models",\n    "__version__",\n]\n')
+            init_file.write(',\n    "models",\n    "warmup",\n    "__version__",\n]\n\n')
+
+            init_file.write("_CLIENT_MODULES = {\n")
+            init_file.write("".join(f'    "{name}": ".endpoints",\n' for name in all_class_names))
+            init_file.write("}\n\n")
+            init_file.write("__getattr__, __dir__ = lazy_exports(__name__, _CLIENT_MODULES)\n")
 
         endpoint_path = os.path.join(base_path, "endpoints")
         os.makedirs(endpoint_path, exist_ok=True)
         endpoint_init_file = os.path.join(endpoint_path, "__init__.py")
         with open(endpoint_init_file, "w") as endpoint_init:
-            endpoint_init.write("from typing import Literal\n\n")
-            # Import both sync and async clients from each file
+            endpoint_init.write("from typing import TYPE_CHECKING, Literal\n\n")
+            endpoint_init.write("from ..core.lazy_imports import lazy_exports\n\n")
+            # Import both sync and async clients from each file, for type checkers only:
+            # at runtime each client module is imported on first access
+            endpoint_init.write("if TYPE_CHECKING:\n")
             for class_name in class_names:
                 async_class_name = f"Async{class_name}"
-                endpoint_init.write(f"from .{class_name} import {async_class_name}, {class_name}\n")
+                endpoint_init.write(f"    from .{class_name} import {async_class_name}, {class_name}\n")
             endpoint_init.write("\n")
 
             # Generate TfLEndpoint Literal type (sync clients only for backwards compatibility)
@@ -432,7 +454,14 @@ class ClientGenerator:
 
             endpoint_init.write("__all__ = [\n")
             endpoint_init.write(",\n".join([f'    "{name}"' for name in all_class_names]))
-            endpoint_init.write(",\n]\n")
+            endpoint_init.write(",\n]\n\n")
+
+            endpoint_init.write("_CLIENT_MODULES = {\n")
+            for class_name in class_names:
+                endpoint_init.write(f'    "{class_name}": ".{class_name}",\n')
+                endpoint_init.write(f'    "Async{class_name}": ".{class_name}",\n')
+            endpoint_init.write("}\n\n")
+            endpoint_init.write("__getattr__, __dir__ = lazy_exports(__name__, _CLIENT_MODULES)\n")
 
         self._generated_clients.append(init_file_path)
         self._generated_clients.append(endpoint_init_file)
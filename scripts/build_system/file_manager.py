@@ -73,13 +73,17 @@ class FileManager:
 
         with open(init_file, "w") as init_f:
             # Standard library imports first
-            init_f.write("from typing import Literal\n\n")
+            init_f.write("from typing import TYPE_CHECKING, Literal\n\n")
+            init_f.write("from ..core.lazy_imports import lazy_exports\n")
+            init_f.write("from ._registry import MODEL_MODULES\n\n")
 
-            # Write import statements in dependency-aware order to minimize forward references
-            self.write_import_statements(init_f, models, models_dir, sorted_models)
+            # Models are imported on first access (see __getattr__ below); the imports are only
+            # written out for type checkers, in dependency-aware order to minimize forward references
+            init_f.write("if TYPE_CHECKING:\n")
+            self.write_import_statements(init_f, models, models_dir, sorted_models, indent="    ")
 
             # Import GenericResponseModel from core for backward compatibility
-            init_f.write("\nfrom ..core.package_models import GenericResponseModel\n")
+            init_f.write("    from ..core.package_models import GenericResponseModel\n")
 
             for model_name, model in models.items():
                 self.save_model_file(
@@ -102,11 +106,37 @@ class FileManager:
             )
 
             model_names = ",\n    ".join(f'"{key}"' for key in sorted(models.keys()))
-            init_f.write(f"__all__ = [\n    {model_names},\n    'GenericResponseModel'\n]\n")
+            init_f.write(f"__all__ = [\n    {model_names},\n    'GenericResponseModel'\n]\n\n")
+
+            init_f.write("__getattr__, __dir__ = lazy_exports(__name__, MODEL_MODULES)\n")
+
+        self.write_model_registry(models, models_dir)
 
         # Write enums after saving the models
         self._write_enum_files(models, models_dir)
 
+    def write_model_registry(self, models: dict[str, type[BaseModel] | type[list]], models_dir: str) -> None:
+        """
+        Write the _registry.py table mapping each model name to the module that defines it.
+
+        Clients look models up through this table and import them on first use, instead of
+        importing and scanning every module in the models package.
+
+        Args:
+            models: Dictionary of model names to model classes
+            models_dir: Directory where models are saved
+        """
+        registry_file = os.path.join(models_dir, "_registry.py")
+        self._generated_files.append(registry_file)
+
+        entries = "".join(f'    "{model_name}": ".{model_name}",\n' for model_name in sorted(models.keys()))
+        with open(registry_file, "w") as registry_f:
+            registry_f.write("# Generated by the build system: model name -> module, relative to this package\n\n")
+            registry_f.write("MODEL_MODULES: dict[str, str] = {\n")
+            registry_f.write(entries)
+            registry_f.write('    "GenericResponseModel": "..core.package_models",\n')
+            registry_f.write("}\n")
+
     def save_model_file(
         self,
         model_name: str,
@@ -190,7 +220,7 @@ class FileManager:
         Returns:
             Model configuration string
         """
-        return "model_config = ConfigDict(from_attributes=True)"
+        return "model_config = ConfigDict(from_attributes=True, defer_build=True)"
 
     def write_import_statements(
         self,
@@ -198,6 +228,7 @@ class FileManager:
         models: dict[str, type[BaseModel]],
         models_dir: str,
         sorted_models: list[str] | None = None,
+        indent: str = "",
     ) -> None:
         """
         Write import statements in dependency-aware order to minimize forward references.
@@ -207,6 +238,7 @@ class FileManager:
             models: Dictionary of all models
             models_dir: Directory where models are saved
             sorted_models: Optional list of models in dependency order
+            indent: Prefix for each import line, e.g. to nest them in an ``if TYPE_CHECKING:`` block
         """
         # If we have a topologically sorted order, use it; otherwise fall back to alphabetical
         model_order = sorted_models or sorted(models.keys())
@@ -214,7 +246,7 @@ class FileManager:
         # Write imports in dependency order to minimize forward references
         for model_name in model_order:
             if model_name in models:
-                init_f.write(f"from .{model_name} import {model_name}\n")
+                init_f.write(f"{indent}from .{model_name} import {model_name}\n")
 
     def sanitize_field_name(self, field_name: str) -> str:
         """
@@ -499,9 +531,8 @@ class FileManager:
         # Note: __slots__ removed - Pydantic v2 BaseModel already uses __slots__ internally
         # Manual __slots__ definition conflicts with Pydantic's metaclass
 
-        # Add model_rebuild() if circular dependencies exist
-        if sanitized_model_name in circular_models:
-            model_file.write(f"\n{sanitized_model_name}.model_rebuild()\n")
+        # No model_rebuild() for circular dependencies: with defer_build the validator is built,
+        # and forward references resolved, on first use (or by pydantic_tfl_api.warmup())
 
     def _find_enum_imports(self, model: BaseModel) -> set[str]:
         """Find all enum imports in the model fields."""
@@ -3,63 +3,186 @@
 This module provides reusable fixtures for mocking HTTP responses
 that conform to the HTTPResponse protocol, enabling tests to work
 with any HTTP backend (httpx or requests).
+
+Fake HTTP clients defined at module level in test files build their
+responses with ``make_http_response`` and extend ``FakeHTTPClient`` or
+``AsyncFakeHTTPClient``, imported from this module. Tests of time-based
+behaviour patch the time functions with a ``FakeClock``.
 """
 
+import asyncio
 import json
-from collections.abc import Callable
+import threading
+import time
+from collections.abc import Callable, Mapping
+from datetime import UTC, datetime
+from email.utils import format_datetime
+from http import HTTPStatus
+from typing import Any
 from unittest.mock import Mock
 
 import pytest
 
-from pydantic_tfl_api.core.http_client import HTTPResponse
+from pydantic_tfl_api.core.http_client import AsyncHTTPClientBase, HTTPClientBase, HTTPResponse
+from pydantic_tfl_api.core.timeouts import Timeout
+
+
+def make_http_response(
+    content: Any = None,
+    status_code: int = 200,
+    headers: Mapping[str, str] | None = None,
+    url: str = "https://api.tfl.gov.uk/Line/Meta/Modes",
+    reason: str | None = None,
+) -> Mock:
+    """Create a mock HTTPResponse protocol-compliant object.
+
+    Args:
+        content: The body, as bytes or as a JSON-serialisable value (None for an empty body).
+        status_code: The HTTP status code.
+        headers: Response headers; a ``Date`` header with the current time is added unless one is given.
+        url: The URL of the request.
+        reason: The reason phrase, defaulting to the standard phrase of ``status_code``.
+    """
+    body = content if isinstance(content, bytes) else b"" if content is None else json.dumps(content).encode()
+    mock = Mock(spec=HTTPResponse)
+    mock.status_code = status_code
+    mock.headers = {"Date": format_datetime(datetime.now(UTC), usegmt=True), **(headers or {})}
+    mock.url = url
+    mock.reason = reason if reason is not None else HTTPStatus(status_code).phrase
+    mock.content = body
+    mock.text = body.decode()
+    try:
+        mock.json.return_value = json.loads(body) if body else {}
+    except ValueError:
+        mock.json.side_effect = ValueError("response body is not JSON")
+    return mock
+
+
+class _FakeHTTPClientState:
+    """Request recording shared by the sync and async fake HTTP clients."""
+
+    def __init__(
+        self,
+        *responses: HTTPResponse,
+        respond: Callable[[str], HTTPResponse] | None = None,
+        delay: float = 0.0,
+    ) -> None:
+        self.responses = list(responses)
+        self.respond_to = respond
+        self.delay = delay
+        self.urls: list[str] = []
+        self.request_headers: list[dict[str, str]] = []
+        self.timeouts: list[float | Timeout | None] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.cancelled = 0
+        self._lock = threading.Lock()
+
+    def _start(self, url: str, headers: dict[str, str] | None, timeout: float | Timeout | None) -> int:
+        with self._lock:
+            self.urls.append(url)
+            self.request_headers.append(headers or {})
+            self.timeouts.append(timeout)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            return len(self.urls) - 1
+
+    def _finish(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+
+    def respond(self, number: int, url: str) -> HTTPResponse:
+        """Return the response to the ``number``-th request (counting from 0), which was sent to ``url``."""
+        if self.respond_to is not None:
+            return self.respond_to(url)
+        with self._lock:
+            return self.responses.pop(0) if len(self.responses) > 1 else self.responses[0]
+
+
+class FakeHTTPClient(_FakeHTTPClientState, HTTPClientBase):
+    """HTTP client answering with queued responses, or with ``respond(url)``, and recording every request.
+
+    Queued responses are returned in order and the last one is repeated. Each request takes
+    ``delay`` seconds; the number of requests in flight is tracked so that tests can check
+    how many were sent concurrently. Subclasses override ``wait`` and ``respond`` for other
+    behaviour, such as failing or blocking requests.
+
+    :param HTTPResponse responses: Responses to return in order
+    :param Callable respond: Builds the response to a URL, used instead of queued responses
+    :param float delay: Seconds each request takes
+    """
+
+    def wait(self, number: int, url: str) -> None:
+        """Wait while the ``number``-th request is in flight."""
+        time.sleep(self.delay)
+
+    def get(
+        self, url: str, headers: dict[str, str] | None = None, timeout: float | Timeout | None = None
+    ) -> HTTPResponse:
+        number = self._start(url, headers, timeout)
+        try:
+            self.wait(number, url)
+        finally:
+            self._finish()
+        return self.respond(number, url)
+
+
+class AsyncFakeHTTPClient(_FakeHTTPClientState, AsyncHTTPClientBase):
+    """Async variant of FakeHTTPClient, also counting the requests that were cancelled."""
+
+    async def wait(self, number: int, url: str) -> None:
+        """Wait while the ``number``-th request is in flight."""
+        await asyncio.sleep(self.delay)
+
+    async def get(
+        self, url: str, headers: dict[str, str] | None = None, timeout: float | Timeout | None = None
+    ) -> HTTPResponse:
+        number = self._start(url, headers, timeout)
+        try:
+            await self.wait(number, url)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self._finish()
+        return self.respond(number, url)
+
+
+class FakeClock:
+    """Stands in for time.monotonic / time.sleep so that waiting advances a virtual clock.
+
+    Tests patch a module's ``time.monotonic`` (and ``time.sleep`` where it waits) with the
+    methods of an instance, then advance ``now`` by hand.
+    """
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.sleeps: list[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
 
 
 @pytest.fixture
 def mock_http_response_factory() -> Callable[..., Mock]:
     """Factory fixture for creating mock HTTPResponse protocol-compliant objects.
 
-    Returns a factory function that creates Mock objects conforming to the
-    HTTPResponse protocol. Use this when you need to test code that works
-    with any HTTP backend.
+    Returns ``make_http_response``. Use this when you need to test code that
+    works with any HTTP backend.
 
     Example:
         def test_something(mock_http_response_factory):
             response = mock_http_response_factory(
-                status_code=200,
+                {"key": "value"},
                 headers={"Content-Type": "application/json"},
-                text='{"key": "value"}'
             )
             # response conforms to HTTPResponse protocol
     """
-    def create(
-        status_code: int = 200,
-        headers: dict[str, str] | None = None,
-        text: str = "",
-        url: str = "http://test.com",
-        reason: str = "OK",
-        json_data: dict[str, object] | list[object] | None = None,
-    ) -> Mock:
-        mock = Mock(spec=HTTPResponse)
-        mock.status_code = status_code
-        mock.headers = headers or {}
-        mock.text = text
-        mock.url = url
-        mock.reason = reason
-
-        # Handle json() method
-        if json_data is not None:
-            mock.json.return_value = json_data
-        elif text:
-            try:
-                mock.json.return_value = json.loads(text)
-            except (json.JSONDecodeError, ValueError):
-                mock.json.return_value = {}
-        else:
-            mock.json.return_value = {}
-
-        return mock
-
-    return create
+    return make_http_response
 
 
 @pytest.fixture
@@ -75,6 +198,7 @@ def http_response_from_json_factory() -> Callable[[str], Mock]:
             response = http_response_from_json_factory("tests/tfl_responses/line.json")
             result = client._deserialize(model_name, response)
     """
+
     def create(json_file: str) -> Mock:
         with open(json_file) as f:
             serialised_response = json.load(f)
@@ -91,6 +215,7 @@ def http_response_from_json_factory() -> Callable[[str], Mock]:
         mock.status_code = serialised_response["status_code"]
         mock.url = serialised_response["url"]
         mock.text = content_str
+        mock.content = content_str.encode()
         mock.reason = "OK"
         mock.json.return_value = content_data
 
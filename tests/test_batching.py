@@ -0,0 +1,251 @@
+"""Tests for calling multi-id endpoints with any number of ids."""
+
+import asyncio
+from datetime import UTC, datetime
+from typing import Any
+from unittest.mock import Mock
+from urllib.parse import unquote, urlparse
+
+import pytest
+
+from pydantic_tfl_api import AsyncLineClient, LineClient
+from pydantic_tfl_api.core import (
+    ApiError,
+    HTTPResponse,
+    ResponseModel,
+    Timeout,
+    override_timeout,
+    override_validation,
+)
+from pydantic_tfl_api.core.batching import chunk_ids, merge_responses
+from pydantic_tfl_api.models import Line, LineArray
+
+from .conftest import AsyncFakeHTTPClient, FakeHTTPClient, make_http_response
+
+LINE_IDS = [f"line-{number}" for number in range(45)]
+
+
+def line_response(url: str, status_code: int = 200, max_age: int = 60) -> Mock:
+    ids = unquote(urlparse(url).path.split("/")[2]).split(",")
+    return make_http_response(
+        [{"id": id_, "name": id_.title()} for id_ in ids],
+        status_code,
+        headers={"Cache-Control": f"public, max-age={max_age}", "Date": "Wed, 14 Oct 2026 10:00:00 GMT"},
+        url=url,
+    )
+
+
+class LineStatusHTTPClient(FakeHTTPClient):
+    """HTTP client answering /Line/{ids}/Status with one Line per id, tracking concurrent requests."""
+
+    def __init__(self, delay: float = 0.0, failing_id: str | None = None) -> None:
+        super().__init__(delay=delay)
+        self.failing_id = failing_id
+
+    def respond(self, number: int, url: str) -> HTTPResponse:
+        status_code = 404 if self.failing_id is not None and self.failing_id in unquote(url) else 200
+        # the second chunk's response expires first
+        return line_response(url, status_code, max_age=30 if "line-20," in unquote(url) else 60)
+
+
+class TestChunkIds:
+    """Tests for splitting ids into chunks."""
+
+    def test_chunks(self) -> None:
+        assert chunk_ids(["a", "b", "c", "d", "e"], 2) == ["a,b", "c,d", "e"]
+
+    def test_comma_separated_string(self) -> None:
+        assert chunk_ids("a, b,,c", 20) == ["a,b,c"]
+
+    def test_drops_repeated_ids(self) -> None:
+        assert chunk_ids(["a", "b", "a", "c"], 2) == ["a,b", "c"]
+
+    def test_invalid_batch_size(self) -> None:
+        with pytest.raises(ValueError, match="batch_size"):
+            chunk_ids(["a"], 0)
+
+
+class TestMergeResponses:
+    """Tests for merging the responses to the chunks of a call."""
+
+    @staticmethod
+    def response(ids: list[str], expires: datetime | None, timestamp: datetime) -> ResponseModel:
+        return ResponseModel(
+            content_expires=expires,
+            shared_expires=None,
+            response_timestamp=timestamp,
+            content=LineArray([Line(id=id_) for id_ in ids]),
+        )
+
+    def test_merges_arrays_and_keeps_earliest_expiry(self) -> None:
+        early, late = datetime(2026, 10, 14, 10, tzinfo=UTC), datetime(2026, 10, 14, 11, tzinfo=UTC)
+
+        merged = merge_responses([self.response(["a"], late, early), self.response(["b", "c"], early, late)])
+
+        assert isinstance(merged, ResponseModel)
+        assert isinstance(merged.content, LineArray)
+        assert [line.id for line in merged.content.root] == ["a", "b", "c"]
+        assert merged.content_expires == early
+        assert merged.shared_expires is None
+        assert merged.response_timestamp == early
+
+    def test_returns_first_error(self) -> None:
+        now = datetime.now(UTC)
+        error = ApiError(
+            timestamp_utc=now,
+            exception_type="x",
+            http_status_code=404,
+            http_status="Not Found",
+            relative_uri="/Line/b/Status",
+            message="not found",
+        )
+        assert merge_responses([self.response(["a"], now, now), error]) is error
+
+    def test_raw_content(self) -> None:
+        responses = [
+            ResponseModel[Any].model_construct(
+                content_expires=None, shared_expires=None, response_timestamp=None, content=c
+            )
+            for c in ([{"id": "a"}], [{"id": "b"}])
+        ]
+        merged = merge_responses(responses)
+        assert isinstance(merged, ResponseModel)
+        assert merged.content == [{"id": "a"}, {"id": "b"}]
+
+    def test_content_without_array(self) -> None:
+        now = datetime.now(UTC)
+        response: ResponseModel[Line] = ResponseModel(
+            content_expires=now, shared_expires=None, response_timestamp=now, content=Line(id="a")
+        )
+        with pytest.raises(ValueError, match="cannot be merged"):
+            merge_responses([response, response])
+
+
+class TestClientCallBatched:
+    """Tests for Client.call_batched."""
+
+    def test_chunks_and_merges(self) -> None:
+        http_client = LineStatusHTTPClient()
+        client = LineClient(http_client=http_client)
+
+        result = client.call_batched(client.StatusByIdsByPathIdsQueryDetail, LINE_IDS, detail=True)
+
+        assert isinstance(result, ResponseModel)
+        assert [line.id for line in result.content.root] == LINE_IDS
+        assert len(http_client.urls) == 3
+        assert all("detail=True" in url for url in http_client.urls)
+        assert sorted(len(unquote(urlparse(url).path).split(",")) for url in http_client.urls) == [5, 20, 20]
+        assert result.content_expires == datetime(2026, 10, 14, 10, 0, 30, tzinfo=UTC)
+
+    def test_chunks_run_concurrently(self) -> None:
+        http_client = LineStatusHTTPClient(delay=0.05)
+        client = LineClient(http_client=http_client)
+
+        client.call_batched(client.StatusByIdsByPathIdsQueryDetail, LINE_IDS, batch_size=5)
+        assert http_client.max_in_flight > 1
+
+        http_client.max_in_flight = 0
+        client.call_batched(client.StatusByIdsByPathIdsQueryDetail, LINE_IDS, batch_size=5, max_concurrency=1)
+        assert http_client.max_in_flight == 1
+
+    @pytest.mark.parametrize("max_concurrency", [0, -1])
+    @pytest.mark.parametrize("ids", [LINE_IDS, ["victoria"]])
+    def test_invalid_max_concurrency(self, ids: list[str], max_concurrency: int) -> None:
+        client = LineClient(http_client=LineStatusHTTPClient())
+        with pytest.raises(ValueError, match="concurrency must be at least 1"):
+            client.call_batched(client.StatusByIdsByPathIdsQueryDetail, ids, max_concurrency=max_concurrency)
+
+    def test_single_chunk(self) -> None:
+        http_client = LineStatusHTTPClient()
+        client = LineClient(http_client=http_client)
+
+        result = client.call_batched(client.StatusByIdsByPathIdsQueryDetail, "victoria,circle")
+
+        assert isinstance(result, ResponseModel)
+        assert [line.id for line in result.content.root] == ["victoria", "circle"]
+        assert len(http_client.urls) == 1
+
+    def test_overrides_apply_to_every_chunk(self) -> None:
+        http_client = LineStatusHTTPClient()
+        client = LineClient(http_client=http_client)
+
+        with override_timeout(Timeout(3)), override_validation("raw"):
+            result = client.call_batched(client.StatusByIdsByPathIdsQueryDetail, LINE_IDS)
+
+        assert http_client.timeouts == [Timeout(3)] * 3
+        assert isinstance(result, ResponseModel)
+        assert [line["id"] for line in result.content] == LINE_IDS
+
+    def test_error_in_any_chunk(self) -> None:
+        client = LineClient(http_client=LineStatusHTTPClient(failing_id="line-30"), retry_policy=None)
+
+        result = client.call_batched(client.StatusByIdsByPathIdsQueryDetail, LINE_IDS)
+
+        assert isinstance(result, ApiError)
+        assert result.http_status_code == 404
+
+    def test_no_ids(self) -> None:
+        client = LineClient(http_client=LineStatusHTTPClient())
+        with pytest.raises(ValueError, match="at least one id"):
+            client.call_batched(client.StatusByIdsByPathIdsQueryDetail, [])
+
+
+class AsyncLineStatusHTTPClient(AsyncFakeHTTPClient):
+    """Async HTTP client answering /Line/{ids}/Status with one Line per id, tracking concurrent requests."""
+
+    def __init__(self) -> None:
+        super().__init__(respond=line_response, delay=0.01)
+
+
+class FailingAsyncLineStatusHTTPClient(AsyncLineStatusHTTPClient):
+    """Async HTTP client failing the request for the first chunk at once and holding the others."""
+
+    async def wait(self, number: int, url: str) -> None:
+        if "line-0," in unquote(url):
+            raise ConnectionError("connection reset")
+        await asyncio.sleep(1)
+
+
+class TestAsyncClientCallBatched:
+    """Tests for AsyncClient.call_batched."""
+
+    @pytest.mark.asyncio
+    async def test_chunks_and_merges(self) -> None:
+        http_client = AsyncLineStatusHTTPClient()
+        client = AsyncLineClient(http_client=http_client)
+
+        result = await client.call_batched(client.StatusByIdsByPathIdsQueryDetail, LINE_IDS, batch_size=10)
+
+        assert isinstance(result, ResponseModel)
+        assert [line.id for line in result.content.root] == LINE_IDS
+        assert len(http_client.urls) == 5
+        assert http_client.max_in_flight == 5
+
+    @pytest.mark.asyncio
+    async def test_max_concurrency(self) -> None:
+        http_client = AsyncLineStatusHTTPClient()
+        client = AsyncLineClient(http_client=http_client)
+
+        await client.call_batched(client.StatusByIdsByPathIdsQueryDetail, LINE_IDS, batch_size=10, max_concurrency=2)
+
+        assert http_client.max_in_flight == 2
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("max_concurrency", [0, -1])
+    async def test_invalid_max_concurrency(self, max_concurrency: int) -> None:
+        client = AsyncLineClient(http_client=AsyncLineStatusHTTPClient())
+        with pytest.raises(ValueError, match="concurrency must be at least 1"):
+            await client.call_batched(client.StatusByIdsByPathIdsQueryDetail, LINE_IDS, max_concurrency=max_concurrency)
+
+    @pytest.mark.asyncio
+    async def test_failing_chunk_cancels_the_others(self) -> None:
+        http_client = FailingAsyncLineStatusHTTPClient()
+        client = AsyncLineClient(http_client=http_client, retry_policy=None)
+
+        with pytest.raises(ConnectionError):
+            await client.call_batched(client.StatusByIdsByPathIdsQueryDetail, LINE_IDS, batch_size=10)
+        await asyncio.sleep(0.05)
+
+        assert len(http_client.urls) == 5
+        assert http_client.cancelled == 4
+        assert http_client.in_flight == 0
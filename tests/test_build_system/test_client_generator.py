@@ -8,7 +8,7 @@ from typing import Any
 
 import pytest
 
-from scripts.build_system.client_generator import ClientGenerator
+from scripts.build_system.client_generator import OPERATION_TIMEOUTS, ClientGenerator
 
 
 class TestClientGenerator:
@@ -314,6 +314,19 @@ class TestClientGenerator:
         assert "uri': '/v1/test/users'" in content  # Full path from server URL
         assert "model': 'UserArray'" in content
 
+    def test_create_config_writes_operation_timeouts(
+        self, client_generator: Any, temp_dir: Any, sample_spec: Any, monkeypatch: Any
+    ) -> None:
+        """Test that configured per-operation timeouts are written into the endpoint entries."""
+        monkeypatch.setitem(OPERATION_TIMEOUTS, "getUsers", {"read": 120.0})
+
+        client_generator.create_config(sample_spec, str(temp_dir), "https://api.example.com")
+
+        namespace: dict[str, Any] = {}
+        exec((temp_dir / "TestClient_config.py").read_text(), namespace)
+        assert namespace["endpoints"]["getUsers"]["timeout"] == {"read": 120.0}
+        assert "timeout" not in namespace["endpoints"]["getUserById"]
+
     def test_create_class(self, client_generator: Any, temp_dir: Any, sample_spec: Any) -> None:
         """Test creating API client class file."""
         client_generator.create_class(sample_spec, str(temp_dir))
@@ -407,6 +420,12 @@ class TestClientGenerator:
         assert "TfLEndpoint = Literal[" in endpoints_content
         assert "AsyncTfLEndpoint = Literal[" in endpoints_content
 
+        # Clients are imported on first access
+        assert '"AsyncUserClient": ".UserClient",' in endpoints_content
+        assert "__getattr__, __dir__ = lazy_exports(__name__, _CLIENT_MODULES)" in endpoints_content
+        assert '"UserClient": ".endpoints",' in content
+        assert "__getattr__, __dir__ = lazy_exports(__name__, _CLIENT_MODULES)" in content
+
         # Check individual client files
         assert (endpoints_dir / "UserClient.py").exists()
         assert (endpoints_dir / "OrderClient.py").exists()
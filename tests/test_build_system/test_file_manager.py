@@ -115,7 +115,7 @@ class TestFileManager:
         assert "id: str = Field(...)" in content
         assert "name: str = Field(...)" in content
         assert "age: int | None = Field(None)" in content
-        assert "model_config = ConfigDict(from_attributes=True)" in content
+        assert "model_config = ConfigDict(from_attributes=True, defer_build=True)" in content
 
     def test_save_root_model_file_content(
         self, file_manager: Any, temp_dir: Any, sample_models: Any, sample_dependency_graph: Any
@@ -139,7 +139,7 @@ class TestFileManager:
         assert "from pydantic import ConfigDict, RootModel" in content
         assert "from .User import User" in content
         assert "class UserArray(RootModel[list[User]]):" in content
-        assert "model_config = ConfigDict(from_attributes=True)" in content
+        assert "model_config = ConfigDict(from_attributes=True, defer_build=True)" in content
 
     def test_save_enum_file_content(
         self, file_manager: Any, temp_dir: Any, sample_models: Any, sample_dependency_graph: Any
@@ -168,7 +168,7 @@ class TestFileManager:
     def test_save_models_with_circular_dependencies(
         self, file_manager: Any, temp_dir: Any, sample_models: Any, sample_dependency_graph: Any
     ) -> None:
-        """Test that models with circular dependencies have model_rebuild() calls."""
+        """Test that models with circular dependencies do not rebuild at import time."""
         circular_models = {"User"}  # Simulate User having circular dependency
         sorted_models = ["User", "Profile"]
 
@@ -183,8 +183,9 @@ class TestFileManager:
         user_file = temp_dir / "models" / "User.py"
         content = user_file.read_text()
 
-        # Should have model_rebuild() call for circular dependency
-        assert "User.model_rebuild()" in content
+        # defer_build resolves the circular reference on first use instead of at import
+        assert "defer_build=True" in content
+        assert "User.model_rebuild()" not in content
 
     def test_init_file_content(
         self, file_manager: Any, temp_dir: Any, sample_models: Any, sample_dependency_graph: Any
@@ -208,12 +209,37 @@ class TestFileManager:
         assert "from ..core.package_models import GenericResponseModel" in content
 
         # Check for Literal type
-        assert "from typing import Literal" in content
+        assert "from typing import TYPE_CHECKING, Literal" in content
         assert "ResponseModelName = Literal[" in content
 
         # Check for __all__
         assert "__all__ = [" in content
 
+        # Models are imported lazily: the imports above are for type checkers only
+        assert "if TYPE_CHECKING:\n    from .User import User" in content
+        assert "__getattr__, __dir__ = lazy_exports(__name__, MODEL_MODULES)" in content
+
+    def test_model_registry_content(
+        self, file_manager: Any, temp_dir: Any, sample_models: Any, sample_dependency_graph: Any
+    ) -> None:
+        """Test that _registry.py maps every model name to its module."""
+        circular_models: set[str] = set()
+        sorted_models = ["User", "Profile", "UserArray", "StatusEnum"]
+
+        file_manager.save_models(sample_models, str(temp_dir), sample_dependency_graph, circular_models, sorted_models)
+
+        namespace: dict[str, Any] = {}
+        exec((temp_dir / "models" / "_registry.py").read_text(), namespace)
+
+        assert namespace["MODEL_MODULES"] == {
+            "Profile": ".Profile",
+            "StatusEnum": ".StatusEnum",
+            "User": ".User",
+            "UserArray": ".UserArray",
+            "GenericResponseModel": "..core.package_models",
+        }
+        assert str(temp_dir / "models" / "_registry.py") in file_manager.get_generated_files()
+
     def test_get_pydantic_imports_base_model(self, file_manager: Any) -> None:
         """Test getting imports for BaseModel."""
         imports = file_manager.get_pydantic_imports("User", is_root_model=False)
@@ -233,7 +259,7 @@ class TestFileManager:
     def test_get_model_config(self, file_manager: Any) -> None:
         """Test getting model configuration."""
         config = file_manager.get_model_config("User")
-        assert "model_config = ConfigDict(from_attributes=True)" in config
+        assert "model_config = ConfigDict(from_attributes=True, defer_build=True)" in config
 
     def test_write_import_statements_dependency_order(self, file_manager: Any, temp_dir: Any) -> None:
         """Test that import statements are written in dependency-aware order."""
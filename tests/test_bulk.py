@@ -0,0 +1,242 @@
+"""Tests for running an endpoint method over many arguments with bounded concurrency."""
+
+import asyncio
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import aclosing
+from unittest.mock import Mock, patch
+from urllib.parse import unquote, urlparse
+
+import pytest
+
+from pydantic_tfl_api import AsyncStopPointClient, LineClient, StopPointClient
+from pydantic_tfl_api.core import (
+    ApiError,
+    HTTPResponse,
+    RateLimiter,
+    ResponseModel,
+    Timeout,
+    override_timeout,
+)
+from pydantic_tfl_api.core.bulk import acall_as_completed, acall_in_order
+
+from .conftest import AsyncFakeHTTPClient, FakeHTTPClient, make_http_response
+
+STOP_IDS = [f"stop-{number}" for number in range(12)]
+
+
+def arrivals_response(url: str) -> Mock:
+    return make_http_response([{"naptanId": urlparse(url).path.split("/")[2], "lineName": "N29"}], url=url)
+
+
+class ArrivalsHTTPClient(AsyncFakeHTTPClient):
+    """Async HTTP client answering /StopPoint/{id}/Arrivals, slower for lower-numbered stops and slowest for stop-0."""
+
+    def __init__(self, failing_id: str | None = None) -> None:
+        super().__init__(respond=arrivals_response)
+        self.failing_id = failing_id
+
+    async def wait(self, number: int, url: str) -> None:
+        stop_number = int(urlparse(url).path.split("/")[2].rsplit("-", 1)[1])
+        await asyncio.sleep(0.005 * (len(STOP_IDS) - stop_number) + (0.05 if stop_number == 0 else 0))
+
+    def respond(self, number: int, url: str) -> HTTPResponse:
+        stop_id = urlparse(url).path.split("/")[2]
+        if stop_id == self.failing_id:
+            raise ConnectionError(f"connection to {stop_id} reset")
+        return super().respond(number, url)
+
+
+def stop_of(result: ResponseModel | ApiError) -> str:
+    assert isinstance(result, ResponseModel)
+    return result.content.root[0].naptanId
+
+
+class TestBulkCalls:
+    """Tests for the bulk call helpers."""
+
+    @pytest.mark.asyncio
+    async def test_as_completed_yields_in_completion_order(self) -> None:
+        async def delayed(value: int, delay: float) -> int:
+            await asyncio.sleep(delay)
+            return value
+
+        results = [item async for item in acall_as_completed(delayed, [(1, 0.03), (2, 0.01), (3, 0.02)])]
+
+        assert results == [(1, (2, 0.01), 2), (2, (3, 0.02), 3), (0, (1, 0.03), 1)]
+
+    @pytest.mark.asyncio
+    async def test_in_order(self) -> None:
+        async def delayed(value: int, delay: float) -> int:
+            await asyncio.sleep(delay)
+            return value
+
+        results = [item async for item in acall_in_order(delayed, [(1, 0.03), (2, 0.01), (3, 0.02)])]
+
+        assert results == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_arguments_are_read_lazily(self) -> None:
+        read: list[int] = []
+
+        def arguments() -> Iterator[tuple[int]]:
+            for number in range(100):
+                read.append(number)
+                yield (number,)
+
+        async def identity(value: int) -> int:
+            await asyncio.sleep(0)
+            return value
+
+        async with aclosing(acall_as_completed(identity, arguments(), concurrency=3)) as calls:
+            await anext(calls)
+            assert len(read) == 3
+
+    @pytest.mark.asyncio
+    async def test_rate_limiter_paces_calls(self) -> None:
+        limiter = RateLimiter(rate=1000, capacity=1)
+
+        async def identity(value: int) -> int:
+            return value
+
+        with patch.object(limiter, "acquire_async", wraps=limiter.acquire_async) as acquire_async:
+            assert [item async for item in acall_in_order(identity, [(1,), (2,)], rate_limiter=limiter)] == [1, 2]
+        assert acquire_async.call_count == 2
+
+
+class TestAsyncClientMap:
+    """Tests for AsyncClient.map and AsyncClient.as_completed."""
+
+    @pytest.mark.asyncio
+    async def test_map_preserves_input_order(self) -> None:
+        http_client = ArrivalsHTTPClient()
+        client = AsyncStopPointClient(http_client=http_client)
+
+        results = [result async for result in client.map(client.ArrivalsByPathId, STOP_IDS, concurrency=4)]
+
+        assert [stop_of(result) for result in results] == STOP_IDS
+        assert http_client.max_in_flight == 4
+
+    @pytest.mark.asyncio
+    async def test_as_completed_correlates_results_with_arguments(self) -> None:
+        client = AsyncStopPointClient(http_client=ArrivalsHTTPClient())
+
+        pairs = [pair async for pair in client.as_completed(client.ArrivalsByPathId, STOP_IDS, concurrency=12)]
+
+        assert all(stop_of(result) == stop_id for (stop_id,), result in pairs)
+        # the first stop responds slowest, so it finishes last
+        assert sorted(stop_id for (stop_id,), _ in pairs) == sorted(STOP_IDS)
+        assert pairs[-1][0] == ("stop-0",)
+
+    @pytest.mark.asyncio
+    async def test_exception_cancels_calls_in_flight(self) -> None:
+        http_client = ArrivalsHTTPClient(failing_id="stop-2")
+        # coalesced requests are shielded from cancellation so that other callers still receive them
+        client = AsyncStopPointClient(http_client=http_client, retry_policy=None, coalesce_requests=False)
+
+        with pytest.raises(ConnectionError):
+            async for _ in client.as_completed(client.ArrivalsByPathId, STOP_IDS, concurrency=3):
+                pass
+        await asyncio.sleep(0.05)
+
+        assert http_client.in_flight == 0
+        assert len(http_client.urls) == 3
+
+    @pytest.mark.asyncio
+    async def test_shared_rate_limiter_is_not_taken_twice(self) -> None:
+        client = AsyncStopPointClient(api_token="key", http_client=ArrivalsHTTPClient(), rate_limiter=True)
+        assert client._bulk_rate_limiter(True) is None
+        assert client._bulk_rate_limiter(None) is None
+
+        other = AsyncStopPointClient(api_token="key", http_client=ArrivalsHTTPClient())
+        assert other._bulk_rate_limiter(True) is client.client.rate_limiter
+
+    def test_invalid_concurrency(self) -> None:
+        client = AsyncStopPointClient(http_client=ArrivalsHTTPClient())
+        with pytest.raises(ValueError, match="concurrency"):
+            client.map(client.ArrivalsByPathId, STOP_IDS, concurrency=0)
+
+
+class SyncArrivalsHTTPClient(FakeHTTPClient):
+    """HTTP client answering /StopPoint/{id}/Arrivals and /Line/{ids}/Status, tracking concurrent requests."""
+
+    def __init__(self, delay: float = 0.01) -> None:
+        super().__init__(delay=delay)
+
+    def respond(self, number: int, url: str) -> HTTPResponse:
+        if url.startswith("https://api.tfl.gov.uk/Line/"):
+            ids = unquote(urlparse(url).path.split("/")[2]).split(",")
+            return make_http_response([{"id": id_} for id_ in ids], url=url)
+        return arrivals_response(url)
+
+
+class TestClientMap:
+    """Tests for Client.map and Client.as_completed."""
+
+    def test_map_preserves_input_order(self) -> None:
+        http_client = SyncArrivalsHTTPClient()
+        with StopPointClient(http_client=http_client) as client:
+            results = list(client.map(client.ArrivalsByPathId, STOP_IDS, concurrency=4))
+
+        assert [stop_of(result) for result in results] == STOP_IDS
+        assert http_client.max_in_flight == 4
+
+    def test_as_completed_correlates_results_with_arguments(self) -> None:
+        with StopPointClient(http_client=SyncArrivalsHTTPClient()) as client:
+            pairs = list(client.as_completed(client.ArrivalsByPathId, STOP_IDS))
+
+        assert sorted(stop_id for (stop_id,), _ in pairs) == sorted(STOP_IDS)
+        assert all(stop_of(result) == stop_id for (stop_id,), result in pairs)
+
+    def test_overrides_apply_to_every_call(self) -> None:
+        http_client = SyncArrivalsHTTPClient(delay=0)
+        with StopPointClient(http_client=http_client) as client, override_timeout(Timeout(2)):
+            list(client.map(client.ArrivalsByPathId, STOP_IDS))
+
+        assert http_client.timeouts == [Timeout(2)] * len(STOP_IDS)
+
+    def test_nested_concurrent_calls_do_not_deadlock(self) -> None:
+        http_client = SyncArrivalsHTTPClient(delay=0)
+        client = LineClient(http_client=http_client, executor=ThreadPoolExecutor(max_workers=1))
+        line_ids = [[f"line-{group}-{number}" for number in range(30)] for group in range(3)]
+
+        results = list(
+            client.map(lambda ids: client.call_batched(client.StatusByIdsByPathIdsQueryDetail, ids), line_ids)
+        )
+
+        assert len(results) == len(line_ids)
+        for result, ids in zip(results, line_ids, strict=True):
+            assert isinstance(result, ResponseModel)
+            assert [line.id for line in result.content.root] == ids
+
+    def test_close_shuts_down_own_executor_only(self) -> None:
+        client = StopPointClient(http_client=SyncArrivalsHTTPClient(delay=0))
+        list(client.map(client.ArrivalsByPathId, STOP_IDS[:2]))
+        own_executor = client._get_executor()
+        client.close()
+        with pytest.raises(RuntimeError, match="shutdown"):
+            own_executor.submit(print)
+
+        executor = ThreadPoolExecutor(max_workers=2)
+        client = StopPointClient(http_client=SyncArrivalsHTTPClient(delay=0), executor=executor)
+        list(client.map(client.ArrivalsByPathId, STOP_IDS[:2]))
+        client.close()
+        assert executor.submit(lambda: 1).result() == 1
+        executor.shutdown()
+
+    def test_client_shared_between_threads(self) -> None:
+        client = StopPointClient(http_client=SyncArrivalsHTTPClient(delay=0.001))
+        results: dict[str, str] = {}
+
+        def worker(stop_id: str) -> None:
+            for _ in range(5):
+                results[stop_id] = stop_of(client.ArrivalsByPathId(stop_id))
+
+        threads = [threading.Thread(target=worker, args=(stop_id,)) for stop_id in STOP_IDS]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == {stop_id: stop_id for stop_id in STOP_IDS}
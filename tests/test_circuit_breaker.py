@@ -0,0 +1,193 @@
+"""Tests for the per-API circuit breakers."""
+
+from collections.abc import Iterator
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
+import pytest
+
+from pydantic_tfl_api import AsyncJourneyClient, AsyncLineClient, JourneyClient, LineClient
+from pydantic_tfl_api.core import (
+    ApiError,
+    AsyncHTTPClientBase,
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    CircuitState,
+    HTTPClientBase,
+    ResponseModel,
+    get_shared_circuit_breakers,
+)
+from pydantic_tfl_api.core.circuit_breaker import circuit_key
+
+from .conftest import FakeClock, make_http_response
+
+MODES_JSON = [{"isTflService": True, "isFarePaying": True, "isScheduledService": True, "modeName": "tube"}]
+
+
+@pytest.fixture
+def clock() -> Iterator[FakeClock]:
+    fake = FakeClock()
+    with patch("pydantic_tfl_api.core.circuit_breaker.time.monotonic", fake.monotonic):
+        yield fake
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker state transitions."""
+
+    def test_opens_after_consecutive_failures(self, clock: FakeClock) -> None:
+        breaker = CircuitBreaker(failure_threshold=3)
+        for _ in range(2):
+            breaker.record_failure()
+        assert breaker.state is CircuitState.CLOSED
+        breaker.record_failure()
+        assert breaker.state is CircuitState.OPEN
+        assert not breaker.allow_request()
+
+    def test_success_resets_failure_count(self, clock: FakeClock) -> None:
+        breaker = CircuitBreaker(failure_threshold=2)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_half_open_after_recovery_timeout_allows_one_probe(self, clock: FakeClock) -> None:
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10)
+        breaker.record_failure()
+        assert breaker.retry_after() == 10
+        clock.now += 10
+        assert breaker.state is CircuitState.HALF_OPEN
+        assert breaker.allow_request()
+        assert not breaker.allow_request()
+
+    def test_successful_probe_closes(self, clock: FakeClock) -> None:
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10)
+        breaker.record_failure()
+        clock.now += 10
+        assert breaker.allow_request()
+        breaker.record_success()
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_failed_probe_reopens(self, clock: FakeClock) -> None:
+        breaker = CircuitBreaker(failure_threshold=5, recovery_timeout=10)
+        for _ in range(5):
+            breaker.record_failure()
+        clock.now += 10
+        assert breaker.allow_request()
+        breaker.record_failure()
+        assert breaker.state is CircuitState.OPEN
+        assert breaker.retry_after() == 10
+
+    def test_lost_probe_is_replaced_after_recovery_timeout(self, clock: FakeClock) -> None:
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10)
+        breaker.record_failure()
+        clock.now += 10
+        assert breaker.allow_request()
+        clock.now += 10
+        assert breaker.allow_request()
+
+    @pytest.mark.parametrize(
+        "status_code, expected",
+        [(200, CircuitState.CLOSED), (404, CircuitState.CLOSED), (429, CircuitState.CLOSED), (503, CircuitState.OPEN)],
+    )
+    def test_record_status(self, clock: FakeClock, status_code: int, expected: CircuitState) -> None:
+        breaker = CircuitBreaker(failure_threshold=1)
+        breaker.record_status(status_code)
+        assert breaker.state is expected
+
+    def test_only_transport_exceptions_count(self, clock: FakeClock) -> None:
+        breaker = CircuitBreaker(failure_threshold=1)
+        breaker.record_exception(ValueError())
+        assert breaker.state is CircuitState.CLOSED
+        breaker.record_exception(httpx.ReadTimeout("slow"))
+        assert breaker.state is CircuitState.OPEN
+
+
+class TestCircuitBreakerRegistry:
+    """Tests for keying circuit breakers by API."""
+
+    @pytest.mark.parametrize(
+        "uri, expected",
+        [
+            ("/Journey/JourneyResults/{0}/to/{1}", "https://api.tfl.gov.uk/Journey"),
+            ("/Journey/Meta/Modes", "https://api.tfl.gov.uk/Journey"),
+            ("/Line/Meta/Modes", "https://api.tfl.gov.uk/Line"),
+        ],
+    )
+    def test_circuit_key(self, uri: str, expected: str) -> None:
+        assert circuit_key("https://api.tfl.gov.uk", uri) == expected
+
+    def test_one_breaker_per_key(self) -> None:
+        registry = CircuitBreakerRegistry(failure_threshold=2)
+        assert registry.get("a") is registry.get("a")
+        assert registry.get("a") is not registry.get("b")
+        assert registry.get("a").failure_threshold == 2
+
+    def test_shared_registry(self) -> None:
+        client = LineClient(http_client=Mock(spec=HTTPClientBase), circuit_breakers=True)
+        assert client.circuit_breakers is get_shared_circuit_breakers()
+
+    def test_disabled_by_default(self) -> None:
+        assert LineClient(http_client=Mock(spec=HTTPClientBase)).circuit_breakers is None
+
+
+class TestClientCircuitBreaking:
+    """Tests that clients fail fast while a circuit is open."""
+
+    def test_fails_fast_once_open(self) -> None:
+        http_client = Mock(spec=HTTPClientBase)
+        http_client.get.return_value = make_http_response(status_code=503)
+        client = LineClient(
+            http_client=http_client,
+            retry_policy=None,
+            circuit_breakers=CircuitBreakerRegistry(failure_threshold=2),
+        )
+
+        client.MetaModes()
+        client.MetaModes()
+        result = client.MetaModes()
+
+        assert http_client.get.call_count == 2
+        assert isinstance(result, ApiError)
+        assert result.error_category == "circuit_open"
+        assert result.http_status_code == 503
+
+    def test_open_circuit_only_affects_its_api(self) -> None:
+        http_client = Mock(spec=HTTPClientBase)
+        registry = CircuitBreakerRegistry(failure_threshold=1)
+        http_client.get.return_value = make_http_response(status_code=503)
+        JourneyClient(http_client=http_client, retry_policy=None, circuit_breakers=registry).Meta()
+
+        http_client.get.return_value = make_http_response(MODES_JSON)
+        assert isinstance(LineClient(http_client=http_client, circuit_breakers=registry).MetaModes(), ResponseModel)
+
+    def test_exceptions_are_recorded_and_raised(self) -> None:
+        http_client = Mock(spec=HTTPClientBase)
+        http_client.get.side_effect = httpx.ConnectError("refused")
+        client = LineClient(
+            http_client=http_client,
+            retry_policy=None,
+            circuit_breakers=CircuitBreakerRegistry(failure_threshold=1),
+        )
+
+        with pytest.raises(httpx.ConnectError):
+            client.MetaModes()
+        assert isinstance(client.MetaModes(), ApiError)
+        assert http_client.get.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_async_fails_fast_once_open(self) -> None:
+        http_client = Mock(spec=AsyncHTTPClientBase)
+        http_client.get = AsyncMock(return_value=make_http_response(status_code=503))
+        registry = CircuitBreakerRegistry(failure_threshold=1)
+        client = AsyncJourneyClient(http_client=http_client, retry_policy=None, circuit_breakers=registry)
+
+        await client.Meta()
+        result = await client.Meta()
+
+        assert http_client.get.await_count == 1
+        assert isinstance(result, ApiError)
+        assert result.error_category == "circuit_open"
+
+        http_client.get = AsyncMock(return_value=make_http_response(MODES_JSON))
+        other = AsyncLineClient(http_client=http_client, circuit_breakers=registry)
+        assert isinstance(await other.MetaModes(), ResponseModel)
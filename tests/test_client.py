@@ -1,4 +1,5 @@
 import json
+from collections.abc import Mapping
 from datetime import UTC, datetime, timedelta
 from email.utils import format_datetime, parsedate_to_datetime
 from typing import Any
@@ -8,11 +9,13 @@ import pytest
 
 # from importlib import import_module
 # import pkgutil
-from pydantic import BaseModel, ConfigDict, ValidationError
+from pydantic import BaseModel, ConfigDict, RootModel, ValidationError
 
 from pydantic_tfl_api import models
 from pydantic_tfl_api.core import ApiError, Client, ResponseModel, RestClient
+from pydantic_tfl_api.core.deserializer import compile_deserializer
 from pydantic_tfl_api.core.http_client import HTTPResponse
+from pydantic_tfl_api.core.retry import DEFAULT_RETRY_POLICY
 
 
 def create_mock_http_response(
@@ -34,10 +37,7 @@ def create_mock_http_response(
     mock.text = text
     mock.url = url
     mock.reason = reason
-
-    # Handle content for _content attribute compatibility
-    if content is not None:
-        mock._content = content
+    mock.content = text.encode() if content is None else content
 
     # Handle json() method
     if text:
@@ -137,12 +137,12 @@ def test_create_model_instance(
 ) -> None:
     # Act
     client = Client()
-    response_json_parsed = json.loads(json.dumps(response_json))
+    response_content = json.dumps(response_json).encode()
     response_date_time = datetime(2023, 12, 31, 1, 2, 3, tzinfo=UTC)
 
     # Create model instance
     instance = client._create_model_instance(
-        Model, response_json_parsed, result_expiry, shared_expiry, response_date_time
+        compile_deserializer(Model), response_content, result_expiry, shared_expiry, response_date_time
     )
 
     # Assertions
@@ -194,11 +194,46 @@ def test_create_model_instance_validation_errors(
 ) -> None:
     # Act & Assert
     client = Client()
-    response_json_parsed = json.loads(json.dumps(response_json))
+    response_content = json.dumps(response_json).encode()
     response_date_time = datetime(2023, 12, 31, 1, 2, 3, tzinfo=UTC)
 
     with pytest.raises(ValidationError):
-        client._create_model_instance(Model, response_json_parsed, result_expiry, shared_expiry, response_date_time)
+        client._create_model_instance(
+            compile_deserializer(Model), response_content, result_expiry, shared_expiry, response_date_time
+        )
+
+
+class PydanticTestModelArray(RootModel[list[PydanticTestModel]]):
+    pass
+
+
+@pytest.mark.parametrize(
+    "response_content",
+    [
+        b'[{"name": "Alice", "age": 30}]',
+        b' \n[{"name": "Alice", "age": 30}]',
+        b'{"name": "Alice", "age": 30}',
+    ],
+    ids=["array", "array_with_leading_whitespace", "single_object_is_wrapped"],
+)
+def test_create_model_instance_root_model_from_bytes(response_content: bytes) -> None:
+    instance = Client()._create_model_instance(
+        compile_deserializer(PydanticTestModelArray), response_content, None, None, None
+    )
+
+    assert isinstance(instance.content, PydanticTestModelArray)
+    assert instance.content.root == [PydanticTestModel(name="Alice", age=30)]
+
+
+def test_deserialize_validates_raw_bytes_without_json() -> None:
+    response = create_mock_http_response(text='{"name": "Alice", "age": 30}')
+
+    test_client = Client()
+    with patch.object(test_client, "_get_model", return_value=PydanticTestModel):
+        result = test_client._deserialize("PydanticTestModel", response)
+
+    assert result.content == PydanticTestModel(name="Alice", age=30)
+    response.json.assert_not_called()
 
 
 @pytest.mark.parametrize(
@@ -214,8 +249,7 @@ def test_client_initialization(api_token: str | None, expected_client_type: type
     with (
         patch("pydantic_tfl_api.core.client.RestClient") as MockRestClient,
         patch(
-            # f"{test_target}.client.Client._load_models", return_value=expected_models
-            "pydantic_tfl_api.core.client.Client._load_models",
+            "pydantic_tfl_api.core.client.get_model_registry",
             return_value=expected_models,
         ) as MockLoadModels,
     ):
@@ -228,7 +262,15 @@ def test_client_initialization(api_token: str | None, expected_client_type: type
         assert isinstance(test_client.client, expected_client_type)
         assert test_client.models == expected_models
         # RestClient now accepts optional http_client parameter (defaults to None)
-        MockRestClient.assert_called_once_with(api_token, None)
+        MockRestClient.assert_called_once_with(
+            api_token,
+            None,
+            rate_limiter=None,
+            retry_policy=DEFAULT_RETRY_POLICY,
+            timeout=None,
+            accept_encoding=None,
+            hedge_policy=None,
+        )
         MockLoadModels.assert_called_once()
 
 
@@ -256,14 +298,14 @@ def test_load_models_contains_expected_models(model_name: str, expected_type: ty
     assert issubclass(model_class, expected_type), f"Model {model_name} should be a BaseModel subclass"
 
 
-def test_load_models_returns_non_empty_dict() -> None:
-    """Test that _load_models returns a non-empty dictionary of models."""
+def test_load_models_returns_non_empty_mapping() -> None:
+    """Test that the model registry is a non-empty mapping of models."""
     # Act
     test_client = Client()
     result = test_client.models
 
     # Assert
-    assert isinstance(result, dict), "Models should be returned as a dictionary"
+    assert isinstance(result, Mapping), "Models should be returned as a mapping"
     assert len(result) > 10, f"Expected many models to be loaded, got {len(result)}"
 
     # Verify all values are BaseModel subclasses
@@ -401,7 +443,6 @@ def test_deserialize(
     Response_Object = create_mock_http_response(
         headers={"Date": response_date_time_string}, text=json.dumps(response_content)
     )
-    Response_Object.json.return_value = response_content
 
     # Act
 
@@ -424,7 +465,12 @@ def test_deserialize(
     assert result == expected_result
     mock_get_model.assert_called_with(model_name)
     mock_create_model_instance.assert_called_with(
-        MockModel, Response_Object.json.return_value, return_datetime, return_datetime_2, response_date_time
+        compile_deserializer(MockModel),
+        Response_Object.content,
+        return_datetime,
+        return_datetime_2,
+        response_date_time,
+        "full",
     )
 
 
@@ -700,6 +746,8 @@ datetime_object_with_time_and_tz_utc = datetime(2023, 12, 31, 1, 2, 3, tzinfo=UT
                 http_status_code=404,
                 http_status="Not Found",
                 relative_uri="/uri",
+                retry_count=0,
+                error_category="client_error",
                 message='{"timestampUtc": "Date", "exceptionType": "type", "httpStatusCode": 404, "httpStatus": "Not Found", "relativeUri": "/uri", "message": "message"}',
             ),
         ),
@@ -712,6 +760,8 @@ datetime_object_with_time_and_tz_utc = datetime(2023, 12, 31, 1, 2, 3, tzinfo=UT
                 http_status_code=404,
                 http_status="Not Found",
                 relative_uri="/uri",
+                retry_count=0,
+                error_category="client_error",
                 message='"Error message"',
             ),
         ),
@@ -935,10 +985,10 @@ class TestApiErrorRegistration:
         }
         mock_http_response.json.return_value = error_json
 
-        # Mock at the RestClient.send_request level to return UnifiedResponse
+        # Mock at the RestClient.send level to return UnifiedResponse
         mock_unified_response = UnifiedResponse(mock_http_response)
 
-        with patch.object(test_client.client, "send_request", return_value=mock_unified_response):
+        with patch.object(test_client.client, "send", return_value=mock_unified_response):
             result = test_client.Line_test_endpoint("invalid")
 
         # Should return ApiError with raw text (no JSON parsing after issue #158)
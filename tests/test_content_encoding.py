@@ -0,0 +1,81 @@
+"""Tests for Accept-Encoding negotiation and decoding compressed responses."""
+
+import gzip
+import json
+from unittest.mock import Mock, patch
+
+import httpx
+
+from pydantic_tfl_api import LineClient
+from pydantic_tfl_api.core import HttpxClient, ResponseModel, RestClient, UnifiedResponse
+from pydantic_tfl_api.core.http_client import HTTPClientBase, HTTPResponse, get_default_accept_encoding
+
+MODES_JSON = [{"isTflService": True, "isFarePaying": True, "isScheduledService": True, "modeName": "tube"}]
+
+
+def gzip_transport(seen_headers: list[httpx.Headers]) -> httpx.MockTransport:
+    """A transport that answers every request with a gzip-compressed JSON body."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_headers.append(request.headers)
+        return httpx.Response(
+            200,
+            headers={"Content-Encoding": "gzip", "Content-Type": "application/json"},
+            content=gzip.compress(json.dumps(MODES_JSON).encode()),
+        )
+
+    return httpx.MockTransport(handler)
+
+
+class TestAcceptEncoding:
+    """Tests for the Accept-Encoding request header."""
+
+    def test_default_without_brotli(self) -> None:
+        with patch("pydantic_tfl_api.core.http_client.importlib.util.find_spec", return_value=None):
+            assert get_default_accept_encoding() == "gzip, deflate"
+
+    def test_default_with_brotli(self) -> None:
+        with patch("pydantic_tfl_api.core.http_client.importlib.util.find_spec", return_value=Mock()):
+            assert get_default_accept_encoding() == "gzip, deflate, br"
+
+    def test_rest_client_sends_accept_encoding(self) -> None:
+        http_client = Mock(spec=HTTPClientBase)
+        http_client.get.return_value = Mock(status_code=200)
+        RestClient(http_client=http_client).send("https://api.tfl.gov.uk/Line/Meta/Modes")
+        assert http_client.get.call_args.kwargs["headers"]["Accept-Encoding"] == get_default_accept_encoding()
+
+    def test_accept_encoding_is_configurable(self) -> None:
+        http_client = Mock(spec=HTTPClientBase)
+        http_client.get.return_value = Mock(status_code=200)
+        LineClient(http_client=http_client, accept_encoding="identity").client.send("https://api.tfl.gov.uk/")
+        assert http_client.get.call_args.kwargs["headers"]["Accept-Encoding"] == "identity"
+
+
+class TestCompressedResponses:
+    """Tests that compressed responses are decoded from bytes."""
+
+    def test_httpx_client_decodes_gzip(self) -> None:
+        seen_headers: list[httpx.Headers] = []
+        http_client = HttpxClient()
+        http_client._client = httpx.Client(transport=gzip_transport(seen_headers))
+        client = LineClient(http_client=http_client, accept_encoding="gzip")
+
+        result = client.MetaModes()
+
+        assert isinstance(result, ResponseModel)
+        assert result.content.root[0].modeName == "tube"
+        assert seen_headers[0]["Accept-Encoding"] == "gzip"
+
+    def test_unified_response_content_bytes(self) -> None:
+        seen_headers: list[httpx.Headers] = []
+        http_client = HttpxClient()
+        http_client._client = httpx.Client(transport=gzip_transport(seen_headers))
+
+        response = UnifiedResponse(http_client.get("https://api.tfl.gov.uk/Line/Meta/Modes"))
+
+        assert response.content == json.dumps(MODES_JSON).encode()
+
+    def test_unified_response_content_falls_back_to_text(self) -> None:
+        mock = Mock(spec=HTTPResponse)
+        mock.text = "[]"
+        assert UnifiedResponse(mock).content == b"[]"
@@ -0,0 +1,249 @@
+"""Tests for compiled response deserializers."""
+
+import json
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from pydantic import BaseModel, ConfigDict, Field, RootModel, ValidationError
+
+from pydantic_tfl_api import AsyncLineClient, LineClient
+from pydantic_tfl_api.core import (
+    ApiError,
+    AsyncHTTPClientBase,
+    HTTPClientBase,
+    LRUResponseCache,
+    ResponseModel,
+    override_validation,
+)
+from pydantic_tfl_api.core.deserializer import Deserializer, compile_deserializer, construct_model
+from pydantic_tfl_api.core.model_registry import get_model_registry
+from pydantic_tfl_api.models import AccidentDetail, Casualty, LineArray, ModeArray, Place
+
+from .config_for_tests import response_to_request_mapping
+from .conftest import make_http_response
+
+RESPONSES_DIR = Path(__file__).parent / "tfl_responses"
+
+
+class Stop(BaseModel):
+    id: str
+    model_config = ConfigDict(defer_build=True)
+
+
+class StopArray(RootModel[list[Stop]]):
+    model_config = ConfigDict(defer_build=True)
+
+
+class TestCompileDeserializer:
+    """Tests for compiling a model into a Deserializer."""
+
+    def test_compiled_once(self) -> None:
+        assert compile_deserializer(Stop) is compile_deserializer(Stop)
+
+    def test_builds_deferred_validator(self) -> None:
+        deserializer = compile_deserializer(StopArray)
+        assert StopArray.__pydantic_complete__
+        assert deserializer.wrap_single
+        assert not compile_deserializer(Stop).wrap_single
+
+    @pytest.mark.parametrize(
+        "content",
+        [b'[{"id": "a"}]', b'\n [{"id": "a"}]', b'{"id": "a"}'],
+        ids=["array", "array_with_leading_whitespace", "single_object_is_wrapped"],
+    )
+    def test_root_model(self, content: bytes) -> None:
+        assert compile_deserializer(StopArray)(content) == StopArray([Stop(id="a")])
+
+    def test_model(self) -> None:
+        assert compile_deserializer(Stop)(b'{"id": "a"}') == Stop(id="a")
+        with pytest.raises(ValidationError):
+            compile_deserializer(Stop)(b'[{"id": "a"}]')
+
+    def test_matches_model_validate_json(self) -> None:
+        content = json.dumps([{"id": "victoria", "name": "Victoria", "modeName": "tube"}]).encode()
+        assert compile_deserializer(LineArray)(content) == LineArray.model_validate_json(content)
+
+
+class TestClientDeserializers:
+    """Tests that clients compile each response model once."""
+
+    def test_deserializer_cached_per_model_name(self) -> None:
+        client = LineClient()
+        with patch("pydantic_tfl_api.core.client.compile_deserializer", wraps=compile_deserializer) as compile_mock:
+            first = client._get_deserializer("LineArray")
+            second = client._get_deserializer("LineArray")
+
+        assert isinstance(first, Deserializer)
+        assert first is second
+        compile_mock.assert_called_once_with(LineArray)
+
+    def test_unknown_model(self) -> None:
+        with pytest.raises(ValueError):
+            LineClient()._get_deserializer("NotAModel")
+
+
+def load_fixture_content(name: str) -> bytes:
+    with open(RESPONSES_DIR / f"{name}.json") as f:
+        content: str = json.load(f)["content"]
+    return content.encode()
+
+
+def assert_same_models(expected: Any, actual: Any) -> None:
+    """Assert that ``actual`` has a model of the same class wherever ``expected`` has one."""
+    if isinstance(expected, RootModel):
+        assert type(actual) is type(expected)
+        assert_same_models(expected.root, actual.root)
+    elif isinstance(expected, BaseModel):
+        assert type(actual) is type(expected)
+        for name in type(expected).model_fields:
+            assert_same_models(getattr(expected, name), getattr(actual, name))
+    elif isinstance(expected, list):
+        assert isinstance(actual, list)
+        assert len(actual) == len(expected)
+        for expected_item, actual_item in zip(expected, actual, strict=True):
+            assert_same_models(expected_item, actual_item)
+
+
+class TestValidationModes:
+    """Tests for deserializing without validation."""
+
+    def test_raw_returns_parsed_json(self) -> None:
+        assert compile_deserializer(StopArray)(b'{"id": "a"}', "raw") == {"id": "a"}
+
+    def test_raw_skips_validation(self) -> None:
+        assert compile_deserializer(StopArray)(b'[{"id": 1}]', "raw") == [{"id": 1}]
+
+    def test_construct_skips_validation(self) -> None:
+        result = compile_deserializer(StopArray)(b'[{"id": 1}]', "construct")
+        assert isinstance(result, StopArray)
+        assert isinstance(result.root[0], Stop)
+        assert result.root[0].id == 1
+
+    def test_construct_wraps_single_object(self) -> None:
+        result = compile_deserializer(StopArray)(b'{"id": "a"}', "construct")
+        assert isinstance(result, StopArray)
+        assert result.root[0].id == "a"
+
+    def test_construct_uses_field_aliases(self) -> None:
+        content = json.dumps({"id": 1, "casualties": [{"age": 30, "class": "Driver"}]}).encode()
+        accident = compile_deserializer(AccidentDetail)(content, "construct")
+        assert isinstance(accident, AccidentDetail)
+        assert accident.casualties is not None
+        assert isinstance(accident.casualties[0], Casualty)
+        assert accident.casualties[0].class_field == "Driver"
+
+    def test_construct_recursive_model(self) -> None:
+        content = json.dumps({"id": "1", "children": [{"id": "2", "children": [{"id": "3"}]}]}).encode()
+        place = compile_deserializer(Place)(content, "construct")
+        assert isinstance(place, Place)
+        assert place.children is not None
+        assert place.children[0].children is not None
+        assert isinstance(place.children[0].children[0], Place)
+        assert place.children[0].children[0].id == "3"
+
+    def test_construct_falls_back_to_model_construct(self) -> None:
+        class Tagged(BaseModel):
+            id: str
+            tags: list[str] = Field(default_factory=list)
+
+        first = construct_model(Tagged, {"id": "a", "$type": "Tagged"})
+        second = construct_model(Tagged, {"id": "b"})
+        assert first.tags == []
+        assert first.tags is not second.tags
+        assert first.model_fields_set == {"id"}
+        assert first.model_dump() == {"id": "a", "tags": []}
+
+    def test_construct_ignores_unknown_keys(self) -> None:
+        stop = construct_model(Stop, {"$type": "Tfl.Stop", "id": "a"})
+        assert stop.model_fields_set == {"id"}
+        assert stop.model_dump() == {"id": "a"}
+
+    def test_construct_leaves_non_model_values(self) -> None:
+        assert construct_model(Stop, "not an object") == "not an object"
+
+    @pytest.mark.parametrize("name", sorted(response_to_request_mapping))
+    def test_construct_matches_validated_models(self, name: str) -> None:
+        content = load_fixture_content(name)
+        deserializer = compile_deserializer(get_model_registry()[str(response_to_request_mapping[name]["model"])])
+        assert_same_models(deserializer(content), deserializer(content, "construct"))
+
+    def test_from_data(self) -> None:
+        deserializer = compile_deserializer(StopArray)
+        assert deserializer.from_data({"id": "a"}) == StopArray([Stop(id="a")])
+        assert deserializer.from_data({"id": "a"}, "construct") == StopArray.model_construct(
+            [Stop.model_construct(id="a")]
+        )
+        assert deserializer.from_data({"id": "a"}, "raw") == {"id": "a"}
+
+
+def content_of(result: ResponseModel[Any] | ApiError) -> Any:
+    assert isinstance(result, ResponseModel)
+    return result.content
+
+
+class TestClientValidation:
+    """Tests for choosing the validation mode per client and per call."""
+
+    MODES = b'[{"isTflService": true, "isFarePaying": true, "isScheduledService": true, "modeName": "tube"}]'
+
+    def make_client(self, **kwargs: Any) -> tuple[LineClient, Mock]:
+        http_client = Mock(spec=HTTPClientBase)
+        http_client.get.return_value = make_http_response(self.MODES, headers={"Cache-Control": "public, max-age=60"})
+        return LineClient(http_client=http_client, **kwargs), http_client
+
+    def test_full_by_default(self) -> None:
+        client, _ = self.make_client()
+        assert client.validation == "full"
+        assert isinstance(content_of(client.MetaModes()).root[0].isTflService, bool)
+
+    def test_client_validation(self) -> None:
+        client, _ = self.make_client(validation="raw")
+        assert content_of(client.MetaModes())[0]["modeName"] == "tube"
+
+    def test_override_validation(self) -> None:
+        client, _ = self.make_client()
+        with override_validation("raw"):
+            result = content_of(client.MetaModes())
+        assert result[0]["modeName"] == "tube"
+        assert isinstance(content_of(client.MetaModes()), ModeArray)
+
+    def test_construct_validation(self) -> None:
+        client, _ = self.make_client(validation="construct")
+        result = content_of(client.MetaModes())
+        assert isinstance(result, ModeArray)
+        assert result.root[0].modeName == "tube"
+
+    def test_invalid_validation(self) -> None:
+        with pytest.raises(ValueError, match="validation must be one of"):
+            LineClient(validation="fast")
+        with pytest.raises(ValueError), override_validation("fast"):
+            pass
+
+    def test_modes_cached_separately(self) -> None:
+        client, http_client = self.make_client(cache=LRUResponseCache())
+
+        validated = client.MetaModes()
+        with override_validation("raw"):
+            raw = client.MetaModes()
+            assert client.MetaModes() is raw
+
+        assert client.MetaModes() is validated
+        assert isinstance(content_of(raw), list)
+        assert http_client.get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_async_client_validation(self) -> None:
+        http_client = Mock(spec=AsyncHTTPClientBase)
+        http_client.get = AsyncMock(
+            return_value=make_http_response(self.MODES, headers={"Cache-Control": "public, max-age=60"})
+        )
+        client = AsyncLineClient(http_client=http_client, validation="raw")
+
+        raw = await client.MetaModes()
+        with override_validation("full"):
+            validated = await client.MetaModes()
+
+        assert content_of(raw)[0]["modeName"] == "tube"
+        assert content_of(validated).root[0].modeName == "tube"
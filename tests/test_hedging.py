@@ -0,0 +1,249 @@
+"""Tests for hedging slow requests with a duplicate request."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import wait
+from typing import Any
+
+import pytest
+
+from pydantic_tfl_api import AsyncStopPointClient, StopPointClient
+from pydantic_tfl_api.core import HedgePolicy, HTTPResponse, ResponseModel
+from pydantic_tfl_api.core.hedging import hedge_endpoint
+from pydantic_tfl_api.core.rest_client import HEDGE_MAX_WORKERS
+
+from .conftest import AsyncFakeHTTPClient, FakeHTTPClient, make_http_response
+
+ARRIVALS = "/StopPoint/{0}/Arrivals"
+
+
+ARRIVALS_JSON = [{"naptanId": "940GZZLUOXC", "lineName": "Central"}]
+
+
+class StallingHTTPClient(FakeHTTPClient):
+    """HTTP client whose first ``stalls`` requests take ``stall`` seconds and later requests ``delay`` seconds."""
+
+    def __init__(self, stall: float = 1.0, delay: float = 0.0, stalls: int = 1, failing: int = 0) -> None:
+        super().__init__(respond=lambda url: make_http_response(ARRIVALS_JSON, url=url), delay=delay)
+        self.stall = stall
+        self.stalls = stalls
+        self.failing = failing
+
+    def wait(self, number: int, url: str) -> None:
+        time.sleep(self.stall if number < self.stalls else self.delay)
+
+    def respond(self, number: int, url: str) -> HTTPResponse:
+        if number < self.failing:
+            raise ConnectionError("connection reset")
+        return super().respond(number, url)
+
+
+class AsyncStallingHTTPClient(AsyncFakeHTTPClient):
+    """Async variant of StallingHTTPClient."""
+
+    def __init__(self, stall: float = 1.0, delay: float = 0.0, stalls: int = 1) -> None:
+        super().__init__(respond=lambda url: make_http_response(ARRIVALS_JSON, url=url), delay=delay)
+        self.stall = stall
+        self.stalls = stalls
+
+    async def wait(self, number: int, url: str) -> None:
+        await asyncio.sleep(self.stall if number < self.stalls else self.delay)
+
+
+def fast_policy(**kwargs: Any) -> HedgePolicy:
+    return HedgePolicy(**{"initial_delay": 0.05, "min_delay": 0.01, "max_ratio": 1.0, **kwargs})
+
+
+class TestHedgePolicy:
+    """Tests for HedgePolicy."""
+
+    def test_initial_delay_until_enough_samples(self) -> None:
+        policy = HedgePolicy(initial_delay=0.5, min_samples=3)
+        for seconds in (0.1, 0.2):
+            policy.record(ARRIVALS, seconds)
+        assert policy.delay(ARRIVALS) == 0.5
+
+        policy.record(ARRIVALS, 0.3)
+        assert policy.delay(ARRIVALS) == 0.3
+
+    def test_percentile_of_recent_latencies(self) -> None:
+        policy = HedgePolicy(percentile=90, min_samples=1, window=100, min_delay=0)
+        for number in range(1, 201):
+            policy.record(ARRIVALS, number / 1000)
+
+        # only the last 100 latencies (0.101s to 0.200s) are kept
+        assert policy.delay(ARRIVALS) == pytest.approx(0.190)
+        assert policy.delay("/Line/{0}/Status") == policy.initial_delay
+
+    def test_min_delay(self) -> None:
+        policy = HedgePolicy(min_samples=1, min_delay=0.05)
+        policy.record(ARRIVALS, 0.001)
+        assert policy.delay(ARRIVALS) == 0.05
+
+    def test_share_of_hedges_is_capped(self) -> None:
+        policy = HedgePolicy(max_ratio=0.1, burst=2)
+        hedges = 0
+        for _ in range(1000):
+            policy.delay(ARRIVALS)
+            hedges += policy.try_hedge()
+
+        assert hedges <= 0.1 * 1000 + 2
+        assert hedges >= 0.1 * 1000 - 1
+        assert (policy.requests, policy.hedges) == (1000, hedges)
+
+    def test_endpoints(self) -> None:
+        assert HedgePolicy().applies_to(ARRIVALS)
+        policy = HedgePolicy(endpoints=[ARRIVALS])
+        assert policy.applies_to(ARRIVALS)
+        assert not policy.applies_to("/Line/{0}/Status")
+
+    @pytest.mark.parametrize(
+        "kwargs", [{"percentile": 100}, {"percentile": 0}, {"max_ratio": 0}, {"max_ratio": 1.5}, {"window": 0}]
+    )
+    def test_invalid_arguments(self, kwargs: dict[str, Any]) -> None:
+        with pytest.raises(ValueError):
+            HedgePolicy(**kwargs)
+
+    def test_hedge_endpoint(self) -> None:
+        assert hedge_endpoint("https://api.tfl.gov.uk/StopPoint/1/Arrivals", ARRIVALS) == ARRIVALS
+        assert hedge_endpoint("https://api.tfl.gov.uk/StopPoint/1/Arrivals?x=1", None) == "/StopPoint/1/Arrivals"
+
+
+class TestClientHedging:
+    """Tests for hedged requests of the sync Client."""
+
+    def test_slow_request_is_hedged(self) -> None:
+        http_client = StallingHTTPClient(stall=1.0)
+        policy = fast_policy()
+        client = StopPointClient(http_client=http_client, hedge_policy=policy, coalesce_requests=False)
+
+        started = time.monotonic()
+        result = client.ArrivalsByPathId("940GZZLUOXC")
+        elapsed = time.monotonic() - started
+        client.close()
+
+        assert isinstance(result, ResponseModel)
+        assert elapsed < 0.5
+        assert len(http_client.urls) == 2
+        assert policy.hedges == 1
+
+    def test_fast_request_is_not_hedged(self) -> None:
+        http_client = StallingHTTPClient(stalls=0)
+        policy = fast_policy()
+        with StopPointClient(http_client=http_client, hedge_policy=policy) as client:
+            assert isinstance(client.ArrivalsByPathId("940GZZLUOXC"), ResponseModel)
+
+        assert len(http_client.urls) == 1
+        assert (policy.requests, policy.hedges) == (1, 0)
+
+    def test_only_selected_endpoints_are_hedged(self) -> None:
+        http_client = StallingHTTPClient(stall=0.2)
+        policy = fast_policy(endpoints=["/StopPoint/{0}/Disruption"])
+        with StopPointClient(http_client=http_client, hedge_policy=policy) as client:
+            client.ArrivalsByPathId("940GZZLUOXC")
+
+        assert len(http_client.urls) == 1
+        assert policy.requests == 0
+
+    def test_hedge_not_sent_without_budget(self) -> None:
+        http_client = StallingHTTPClient(stall=0.2)
+        policy = fast_policy(max_ratio=0.01)
+        policy.try_hedge()  # use up the initial budget
+        with StopPointClient(http_client=http_client, hedge_policy=policy) as client:
+            client.ArrivalsByPathId("940GZZLUOXC")
+
+        assert len(http_client.urls) == 1
+        assert policy.hedges == 1
+
+    def test_failed_request_falls_back_to_hedge(self) -> None:
+        http_client = StallingHTTPClient(stall=0.1, failing=1)
+        policy = fast_policy()
+        with StopPointClient(http_client=http_client, hedge_policy=policy, retry_policy=None) as client:
+            assert isinstance(client.ArrivalsByPathId("940GZZLUOXC"), ResponseModel)
+
+    def test_both_requests_failing_raises(self) -> None:
+        http_client = StallingHTTPClient(stall=0.1, stalls=2, failing=2)
+        with (
+            StopPointClient(http_client=http_client, hedge_policy=fast_policy(), retry_policy=None) as client,
+            pytest.raises(ConnectionError),
+        ):
+            client.client.send("https://api.tfl.gov.uk/StopPoint/1/Arrivals")
+
+    def test_latencies_are_recorded_by_endpoint(self) -> None:
+        policy = fast_policy(min_samples=2)
+        with StopPointClient(http_client=StallingHTTPClient(stalls=0), hedge_policy=policy) as client:
+            client.ArrivalsByPathId("a")
+            client.ArrivalsByPathId("b")
+
+        assert policy.delay(ARRIVALS) == policy.min_delay
+
+    def test_request_is_not_queued_behind_hedges(self) -> None:
+        http_client = StallingHTTPClient(stall=0.5)
+        policy = fast_policy()
+        with StopPointClient(http_client=http_client, hedge_policy=policy, coalesce_requests=False) as client:
+            # saturate the pool sending hedges for 1.5 seconds
+            release = threading.Event()
+            executor = client.client._get_hedge_executor()
+            blockers = [executor.submit(release.wait, 1.5) for _ in range(HEDGE_MAX_WORKERS)]
+            try:
+                started = time.monotonic()
+                client.client.send("https://api.tfl.gov.uk/StopPoint/1/Arrivals", endpoint=ARRIVALS)
+                elapsed = time.monotonic() - started
+            finally:
+                release.set()
+            wait(blockers)
+
+        # the hedge was still queued when the request itself answered
+        assert 0.5 <= elapsed < 1.0
+        assert policy.hedges == 1
+
+    def test_latency_of_request_is_recorded_when_its_hedge_wins(self) -> None:
+        http_client = StallingHTTPClient(stall=0.3)
+        policy = fast_policy(min_samples=1)
+        with StopPointClient(http_client=http_client, hedge_policy=policy, coalesce_requests=False) as client:
+            client.ArrivalsByPathId("940GZZLUOXC")
+            assert policy.hedges == 1
+            time.sleep(0.4)
+
+        assert policy.delay(ARRIVALS) >= 0.3
+
+
+class TestAsyncClientHedging:
+    """Tests for hedged requests of the AsyncClient."""
+
+    @pytest.mark.asyncio
+    async def test_slow_request_is_hedged_and_cancelled(self) -> None:
+        http_client = AsyncStallingHTTPClient(stall=1.0)
+        policy = fast_policy()
+        client = AsyncStopPointClient(http_client=http_client, hedge_policy=policy)
+
+        started = time.monotonic()
+        result = await client.ArrivalsByPathId("940GZZLUOXC")
+        elapsed = time.monotonic() - started
+
+        assert isinstance(result, ResponseModel)
+        assert elapsed < 0.5
+        assert len(http_client.urls) == 2
+        assert http_client.cancelled == 1
+        assert policy.hedges == 1
+
+    @pytest.mark.asyncio
+    async def test_fast_request_is_not_hedged(self) -> None:
+        http_client = AsyncStallingHTTPClient(stalls=0)
+        client = AsyncStopPointClient(http_client=http_client, hedge_policy=fast_policy())
+
+        assert isinstance(await client.ArrivalsByPathId("940GZZLUOXC"), ResponseModel)
+        assert len(http_client.urls) == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelling_the_call_cancels_both_requests(self) -> None:
+        http_client = AsyncStallingHTTPClient(stall=1.0, delay=1.0)
+        client = AsyncStopPointClient(http_client=http_client, hedge_policy=fast_policy(), coalesce_requests=False)
+
+        with pytest.raises(TimeoutError):
+            await asyncio.wait_for(client.ArrivalsByPathId("940GZZLUOXC"), timeout=0.1)
+        await asyncio.sleep(0)
+
+        assert len(http_client.urls) == 2
+        assert http_client.cancelled == 2
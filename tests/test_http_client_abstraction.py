@@ -9,7 +9,7 @@ from unittest.mock import Mock
 
 import pytest
 
-from pydantic_tfl_api.core import Client, HTTPClientBase, HTTPResponse, RestClient, UnifiedResponse
+from pydantic_tfl_api.core import Client, HTTPClientBase, HTTPResponse, RestClient, Timeout, UnifiedResponse
 from pydantic_tfl_api.core.http_backends.httpx_client import HttpxClient
 
 
@@ -155,7 +155,7 @@ class TestRestClientWithHTTPClientAbstraction:
                 self,
                 url: str,
                 headers: dict[str, str] | None = None,
-                timeout: int | None = None,
+                timeout: float | Timeout | None = None,
             ) -> HTTPResponse:
                 mock = Mock()
                 mock.status_code = 200
@@ -220,7 +220,7 @@ class TestClientWithHTTPClientAbstraction:
                 self,
                 url: str,
                 headers: dict[str, str] | None = None,
-                timeout: int | None = None,
+                timeout: float | Timeout | None = None,
             ) -> HTTPResponse:
                 mock = Mock()
                 mock.status_code = 200
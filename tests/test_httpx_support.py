@@ -1,5 +1,7 @@
 """Tests for httpx support and async client functionality (Phase 2)."""
 
+import asyncio
+import threading
 from collections.abc import Mapping
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -10,6 +12,9 @@ from pydantic_tfl_api.core import (
     AsyncClient,
     AsyncHTTPClientBase,
     AsyncRestClient,
+    Client,
+    RestClient,
+    Timeout,
     get_default_async_http_client,
     get_default_http_client,
 )
@@ -110,27 +115,109 @@ class TestHttpxClient:
     """Tests for the HttpxClient implementation."""
 
     def test_get_makes_request(self) -> None:
-        """Test that get method makes a GET request."""
-        with patch("pydantic_tfl_api.core.http_backends.httpx_client.httpx.get") as mock_get:
+        """Test that get method makes a GET request through the pooled client."""
+        with patch("pydantic_tfl_api.core.http_backends.httpx_client.httpx.Client") as mock_client_class:
             mock_response = Mock(spec=httpx.Response)
-            mock_get.return_value = mock_response
+            mock_client_class.return_value.get.return_value = mock_response
 
             client = HttpxClient()
             result = client.get("http://test.com", headers={"Accept": "application/json"}, timeout=60)
 
-            mock_get.assert_called_once_with("http://test.com", headers={"Accept": "application/json"}, timeout=60)
+            mock_client_class.return_value.get.assert_called_once_with(
+                "http://test.com", headers={"Accept": "application/json"}, timeout=60
+            )
             assert isinstance(result, HttpxResponse)
 
     def test_get_default_timeout(self) -> None:
         """Test that get method uses default timeout of 30 seconds."""
-        with patch("pydantic_tfl_api.core.http_backends.httpx_client.httpx.get") as mock_get:
-            mock_response = Mock(spec=httpx.Response)
-            mock_get.return_value = mock_response
+        with patch("pydantic_tfl_api.core.http_backends.httpx_client.httpx.Client") as mock_client_class:
+            client = HttpxClient()
+            client.get("http://test.com")
+
+            mock_client_class.return_value.get.assert_called_once_with("http://test.com", headers=None, timeout=30)
 
+    def test_pooled_client_is_reused(self) -> None:
+        """Test that a single httpx.Client is created and reused across requests."""
+        with patch("pydantic_tfl_api.core.http_backends.httpx_client.httpx.Client") as mock_client_class:
+            client = HttpxClient()
+            client.get("http://test.com/a")
+            client.get("http://test.com/b")
+
+            mock_client_class.assert_called_once_with(limits=client.limits, http2=False)
+            assert mock_client_class.return_value.get.call_count == 2
+
+    @pytest.mark.parametrize("status_code", [200, 404])
+    def test_stream_reads_body_as_it_arrives(self, status_code: int) -> None:
+        """Test that stream yields an unread response whose body can be iterated or read."""
+        transport = httpx.MockTransport(lambda request: httpx.Response(status_code, content=b"[1, 2]"))
+        real_client = httpx.Client
+        with (
+            patch(
+                "pydantic_tfl_api.core.http_backends.httpx_client.httpx.Client",
+                side_effect=lambda **kwargs: real_client(transport=transport, **kwargs),
+            ),
+            HttpxClient().stream("http://test.com", timeout=60) as response,
+        ):
+            assert isinstance(response, HttpxResponse)
+            assert response.status_code == status_code
+            if status_code == 200:
+                assert b"".join(response.iter_bytes()) == b"[1, 2]"
+            else:
+                response.read()
+                assert response.json() == [1, 2]
+
+    def test_pool_limits_are_configurable(self) -> None:
+        """Test that pool limits are passed through to httpx.Limits."""
+        client = HttpxClient(max_connections=5, max_keepalive_connections=2, keepalive_expiry=1.5)
+        assert client.limits == httpx.Limits(max_connections=5, max_keepalive_connections=2, keepalive_expiry=1.5)
+
+    def test_http2_requires_h2(self) -> None:
+        """Test that enabling HTTP/2 without h2 installed raises a helpful ImportError."""
+        with (
+            patch("pydantic_tfl_api.core.http_backends.httpx_client.importlib.util.find_spec", return_value=None),
+            pytest.raises(ImportError, match=r"pip install httpx\[http2\]"),
+        ):
+            HttpxClient(http2=True)
+
+    def test_close_closes_pooled_client(self) -> None:
+        """Test that close() closes the pooled client and a later request opens a new one."""
+        with patch("pydantic_tfl_api.core.http_backends.httpx_client.httpx.Client") as mock_client_class:
             client = HttpxClient()
             client.get("http://test.com")
+            client.close()
+
+            mock_client_class.return_value.close.assert_called_once()
+
+            client.get("http://test.com")
+            assert mock_client_class.call_count == 2
+
+    def test_close_without_requests_is_noop(self) -> None:
+        """Test that closing an unused client does not create a pool."""
+        with patch("pydantic_tfl_api.core.http_backends.httpx_client.httpx.Client") as mock_client_class:
+            HttpxClient().close()
+            mock_client_class.assert_not_called()
+
+    def test_context_manager_closes_client(self) -> None:
+        """Test that HttpxClient closes its pool when used as a context manager."""
+        with patch("pydantic_tfl_api.core.http_backends.httpx_client.httpx.Client") as mock_client_class:
+            with HttpxClient() as client:
+                client.get("http://test.com")
+
+            mock_client_class.return_value.close.assert_called_once()
+
+    def test_rest_client_and_client_propagate_close(self) -> None:
+        """Test that closing a Client closes the RestClient's HTTP backend."""
+        http_client = Mock(spec=HttpxClient)
 
-            mock_get.assert_called_once_with("http://test.com", headers=None, timeout=30)
+        with Client(http_client=http_client) as client:
+            assert client.client.http_client is http_client
+
+        http_client.close.assert_called_once()
+
+        with RestClient(http_client=http_client):
+            pass
+
+        assert http_client.close.call_count == 2
 
 
 class TestAsyncHttpxResponse:
@@ -205,6 +292,30 @@ class TestAsyncHttpxResponse:
 class TestAsyncHttpxClient:
     """Tests for the AsyncHttpxClient implementation."""
 
+    @staticmethod
+    def _mock_async_client(mock_async_client_class: Mock, response: Mock | None = None) -> AsyncMock:
+        """Configure the patched httpx.AsyncClient class to return an open mock pool."""
+        mock_client_instance = AsyncMock()
+        mock_client_instance.is_closed = False
+        mock_client_instance.get.return_value = response or Mock(spec=httpx.Response, status_code=200)
+        mock_async_client_class.return_value = mock_client_instance
+        return mock_client_instance
+
+    @pytest.mark.asyncio
+    async def test_stream_reads_body_as_it_arrives(self) -> None:
+        """Test that stream yields an unread response whose body is iterated as it arrives."""
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, content=b"[1, 2]"))
+        real_client = httpx.AsyncClient
+        with patch(
+            "pydantic_tfl_api.core.http_backends.async_httpx_client.httpx.AsyncClient",
+            side_effect=lambda **kwargs: real_client(transport=transport, **kwargs),
+        ):
+            client = AsyncHttpxClient()
+            async with client.stream("http://test.com", timeout=60) as response:
+                assert isinstance(response, AsyncHttpxResponse)
+                assert b"".join([chunk async for chunk in response.aiter_bytes()]) == b"[1, 2]"
+            await client.aclose()
+
     @pytest.mark.asyncio
     async def test_get_makes_async_request(self) -> None:
         """Test that get method makes an async GET request."""
@@ -216,9 +327,7 @@ class TestAsyncHttpxClient:
         mock_response.reason_phrase = "OK"
 
         with patch("pydantic_tfl_api.core.http_backends.async_httpx_client.httpx.AsyncClient") as mock_async_client:
-            mock_client_instance = AsyncMock()
-            mock_client_instance.get.return_value = mock_response
-            mock_async_client.return_value.__aenter__.return_value = mock_client_instance
+            mock_client_instance = self._mock_async_client(mock_async_client, mock_response)
 
             client = AsyncHttpxClient()
             result = await client.get("http://test.com", headers={"Accept": "application/json"}, timeout=60)
@@ -231,18 +340,150 @@ class TestAsyncHttpxClient:
     @pytest.mark.asyncio
     async def test_get_default_timeout(self) -> None:
         """Test that get method uses default timeout of 30 seconds."""
-        mock_response = Mock(spec=httpx.Response)
-
         with patch("pydantic_tfl_api.core.http_backends.async_httpx_client.httpx.AsyncClient") as mock_async_client:
-            mock_client_instance = AsyncMock()
-            mock_client_instance.get.return_value = mock_response
-            mock_async_client.return_value.__aenter__.return_value = mock_client_instance
+            mock_client_instance = self._mock_async_client(mock_async_client)
 
             client = AsyncHttpxClient()
             await client.get("http://test.com")
 
             mock_client_instance.get.assert_called_once_with("http://test.com", headers=None, timeout=30)
 
+    @pytest.mark.asyncio
+    async def test_pool_is_shared_across_concurrent_requests(self) -> None:
+        """Test that concurrent requests share a single httpx.AsyncClient."""
+        with patch("pydantic_tfl_api.core.http_backends.async_httpx_client.httpx.AsyncClient") as mock_async_client:
+            mock_client_instance = self._mock_async_client(mock_async_client)
+
+            client = AsyncHttpxClient(max_connections=10, http2=False)
+            await asyncio.gather(*(client.get(f"http://test.com/{i}") for i in range(20)))
+
+            mock_async_client.assert_called_once_with(limits=client.limits, http2=False)
+            assert mock_client_instance.get.await_count == 20
+
+    def test_pool_limits_are_configurable(self) -> None:
+        """Test that pool limits are passed through to httpx.Limits."""
+        client = AsyncHttpxClient(max_connections=5, max_keepalive_connections=2, keepalive_expiry=1.5)
+        assert client.limits == httpx.Limits(max_connections=5, max_keepalive_connections=2, keepalive_expiry=1.5)
+
+    def test_http2_requires_h2(self) -> None:
+        """Test that enabling HTTP/2 without h2 installed raises a helpful ImportError."""
+        with (
+            patch("pydantic_tfl_api.core.http_backends.httpx_client.importlib.util.find_spec", return_value=None),
+            pytest.raises(ImportError, match=r"pip install httpx\[http2\]"),
+        ):
+            AsyncHttpxClient(http2=True)
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_pool_and_reopens_on_demand(self) -> None:
+        """Test that aclose() closes the pool and the next request opens a new one."""
+        with patch("pydantic_tfl_api.core.http_backends.async_httpx_client.httpx.AsyncClient") as mock_async_client:
+            mock_client_instance = self._mock_async_client(mock_async_client)
+
+            client = AsyncHttpxClient()
+            await client.get("http://test.com")
+            await client.aclose()
+            mock_client_instance.aclose.assert_awaited_once()
+
+            await client.get("http://test.com")
+            assert mock_async_client.call_count == 2
+
+    def test_new_pool_per_event_loop(self) -> None:
+        """Test that a pool created in one event loop is not reused in another."""
+        with patch("pydantic_tfl_api.core.http_backends.async_httpx_client.httpx.AsyncClient") as mock_async_client:
+            self._mock_async_client(mock_async_client)
+
+            client = AsyncHttpxClient()
+            asyncio.run(client.get("http://test.com"))
+            asyncio.run(client.get("http://test.com"))
+
+            assert mock_async_client.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_nested_context_managers_close_pool_once(self) -> None:
+        """Test that the pool is only closed when the outermost async with block exits."""
+        with patch("pydantic_tfl_api.core.http_backends.async_httpx_client.httpx.AsyncClient") as mock_async_client:
+            mock_client_instance = self._mock_async_client(mock_async_client)
+
+            shared = AsyncHttpxClient()
+            async with AsyncClient(http_client=shared) as first, AsyncClient(http_client=shared) as second:
+                await first.client.send_request("http://test.com/", "a")
+                async with second:
+                    await second.client.send_request("http://test.com/", "b")
+                mock_client_instance.aclose.assert_not_awaited()
+
+            mock_client_instance.aclose.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_async_rest_client_aclose_propagates(self) -> None:
+        """Test that AsyncClient.aclose() closes the HTTP backend."""
+        http_client = AsyncMock(spec=AsyncHttpxClient)
+        client = AsyncClient(http_client=http_client)
+        await client.aclose()
+        http_client.aclose.assert_awaited_once()
+
+    def test_default_client_is_shared(self) -> None:
+        """Test that async API clients share one default AsyncHttpxClient."""
+        assert AsyncClient().client.http_client is AsyncRestClient().http_client
+
+    @pytest.mark.asyncio
+    async def test_exiting_one_client_keeps_shared_pool_open_for_others(self) -> None:
+        """Test that a client leaving its async with block does not close the default pool under another client."""
+        started, release = asyncio.Event(), asyncio.Event()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/slow":
+                started.set()
+                await release.wait()
+            return httpx.Response(200, json=[])
+
+        transport = httpx.MockTransport(handler)
+        real_client = httpx.AsyncClient
+        with (
+            patch("pydantic_tfl_api.core.http_backends.async_httpx_client._shared_client", None),
+            patch(
+                "pydantic_tfl_api.core.http_backends.async_httpx_client.httpx.AsyncClient",
+                side_effect=lambda **kwargs: real_client(transport=transport, **kwargs),
+            ),
+        ):
+            async with AsyncClient() as first, AsyncClient() as second:
+                in_flight = asyncio.create_task(second.client.send_request("http://test.com/", "slow"))
+                await started.wait()
+                pool = get_default_async_http_client()
+                assert isinstance(pool, AsyncHttpxClient)
+                connections = pool.client
+
+                await first.__aexit__(None, None, None)
+                await first.aclose()
+                assert not connections.is_closed
+                release.set()
+                response = await in_flight
+
+                assert response.status_code == 200
+            assert not connections.is_closed
+            assert pool.client is connections
+            await pool.aclose()
+
+    def test_pool_of_running_loop_in_other_thread_is_closed_on_loop_change(self) -> None:
+        """Test that switching event loops closes the old pool on its own loop when that loop is still running."""
+        with patch("pydantic_tfl_api.core.http_backends.async_httpx_client.httpx.AsyncClient") as mock_async_client:
+            old_pool = self._mock_async_client(mock_async_client)
+            client = AsyncHttpxClient()
+            other_loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=other_loop.run_forever)
+            thread.start()
+            try:
+                asyncio.run_coroutine_threadsafe(client.get("http://test.com"), other_loop).result(5)
+                new_pool = self._mock_async_client(mock_async_client)
+                asyncio.run(client.get("http://test.com"))
+                asyncio.run_coroutine_threadsafe(asyncio.sleep(0), other_loop).result(5)
+            finally:
+                other_loop.call_soon_threadsafe(other_loop.stop)
+                thread.join()
+                other_loop.close()
+
+            old_pool.aclose.assert_awaited_once()
+            new_pool.aclose.assert_not_awaited()
+
 
 class TestGetDefaultHttpClient:
     """Tests for the get_default_http_client factory function."""
@@ -300,7 +541,7 @@ class TestAsyncRestClient:
                 self,
                 url: str,
                 headers: dict[str, str] | None = None,
-                timeout: int | None = None,
+                timeout: float | Timeout | None = None,
             ) -> HTTPResponse:
                 mock = Mock()
                 mock.status_code = 200
@@ -388,7 +629,7 @@ class TestAsyncClient:
                 self,
                 url: str,
                 headers: dict[str, str] | None = None,
-                timeout: int | None = None,
+                timeout: float | Timeout | None = None,
             ) -> HTTPResponse:
                 mock = Mock()
                 mock.status_code = 200
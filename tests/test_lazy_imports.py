@@ -0,0 +1,61 @@
+"""Tests for lazily importing clients and models on first access."""
+
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+import pydantic_tfl_api
+from pydantic_tfl_api import endpoints, models
+
+
+def run_isolated(code: str) -> str:
+    """Run ``code`` in a fresh interpreter, so nothing has been imported yet."""
+    result = subprocess.run([sys.executable, "-c", textwrap.dedent(code)], capture_output=True, text=True, check=True)
+    return result.stdout.strip()
+
+
+class TestLazyImports:
+    """Tests for the PEP 562 __getattr__ on the generated packages."""
+
+    def test_import_does_not_load_clients_or_models(self) -> None:
+        output = run_isolated(
+            """
+            import sys
+            import pydantic_tfl_api
+            print(sorted(m for m in sys.modules if m.startswith(("pydantic_tfl_api.endpoints.", "pydantic_tfl_api.models."))))
+            """
+        )
+        assert output == "['pydantic_tfl_api.models._registry']"
+
+    def test_client_loads_only_its_models(self) -> None:
+        output = run_isolated(
+            """
+            import sys
+            from pydantic_tfl_api import LineClient
+            loaded = {m.rpartition(".")[2] for m in sys.modules if m.startswith("pydantic_tfl_api.")}
+            print("LineClient" in loaded, "StopPointClient" in loaded, "Line" in loaded, "RoadDisruption" in loaded)
+            """
+        )
+        assert output == "True False True False"
+
+    def test_exports_resolve_to_classes(self) -> None:
+        assert pydantic_tfl_api.LineClient is endpoints.LineClient
+        assert endpoints.AsyncLineClient.__name__ == "AsyncLineClient"
+        assert isinstance(models.Line, type)
+        assert isinstance(models.GenericResponseModel, type)
+
+    def test_submodule_does_not_shadow_class(self) -> None:
+        # importing models/LineStatus.py must not rebind models.LineStatus to the module
+        import pydantic_tfl_api.models.LineStatus  # noqa: F401
+
+        assert isinstance(models.LineStatus, type)
+
+    def test_dir_lists_exports(self) -> None:
+        assert set(models.__all__) <= set(dir(models))
+        assert set(endpoints.__all__) <= set(dir(endpoints))
+
+    def test_unknown_attribute(self) -> None:
+        with pytest.raises(AttributeError):
+            models.NotAModel  # noqa: B018
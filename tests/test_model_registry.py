@@ -0,0 +1,88 @@
+"""Tests for the lazily imported model registry and model warm-up."""
+
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from pydantic_tfl_api import models
+from pydantic_tfl_api.core import (
+    ApiError,
+    AsyncClient,
+    Client,
+    GenericResponseModel,
+    ModelRegistry,
+    get_model_registry,
+    warmup,
+)
+from pydantic_tfl_api.models import _registry
+
+
+class TestModelRegistry:
+    """Tests for resolving model names to classes."""
+
+    def test_generated_table_matches_models_package(self) -> None:
+        assert set(_registry.MODEL_MODULES) == set(models.__all__)
+
+    def test_resolves_models(self) -> None:
+        registry = get_model_registry()
+        assert registry["Line"] is models.Line
+        assert registry["GenericResponseModel"] is GenericResponseModel
+        assert registry["ApiError"] is ApiError
+
+    def test_unknown_model(self) -> None:
+        registry = get_model_registry()
+        assert "NotAModel" not in registry
+        assert registry.get("NotAModel") is None
+        with pytest.raises(KeyError):
+            registry["NotAModel"]
+
+    def test_imports_on_first_lookup_only(self) -> None:
+        registry = ModelRegistry({"Line": ".Line"}, "pydantic_tfl_api.models")
+        with patch(
+            "pydantic_tfl_api.core.model_registry.import_module", return_value=sys.modules[models.Line.__module__]
+        ) as import_module:
+            assert "Line" in registry
+            import_module.assert_not_called()
+            assert registry["Line"] is models.Line
+            assert registry["Line"] is models.Line
+        import_module.assert_called_once_with(".Line", "pydantic_tfl_api.models")
+
+    def test_iterates_generated_and_extra_names(self) -> None:
+        registry = ModelRegistry({"Line": ".Line"}, "pydantic_tfl_api.models", {"ApiError": ApiError})
+        assert list(registry) == ["Line", "ApiError"]
+        assert len(registry) == 2
+
+
+class TestClientModels:
+    """Tests that clients share the process-wide registry."""
+
+    def test_clients_share_registry(self) -> None:
+        assert Client().models is get_model_registry()
+        assert AsyncClient().models is get_model_registry()
+
+
+class TestWarmup:
+    """Tests for building deferred model validators ahead of time."""
+
+    def test_models_defer_building_validators(self) -> None:
+        assert models.Place.model_config.get("defer_build") is True
+
+    def test_warmup_builds_named_models(self) -> None:
+        with (
+            patch.object(models.Place, "model_rebuild") as rebuild_place,
+            patch.object(models.Line, "model_rebuild") as rebuild_line,
+        ):
+            warmup(["Place", models.Line])
+        rebuild_place.assert_called_once_with()
+        rebuild_line.assert_called_once_with()
+
+    def test_warmup_completes_circular_model(self) -> None:
+        warmup(["Place"])
+        assert models.Place.__pydantic_complete__
+        place = models.Place.model_validate({"id": "a", "children": [{"id": "b"}]})
+        assert place.children is not None and place.children[0].id == "b"
+
+    def test_warmup_all_models(self) -> None:
+        warmup()
+        assert all(model.__pydantic_complete__ for model in get_model_registry().values())
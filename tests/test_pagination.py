@@ -0,0 +1,224 @@
+"""Tests for iterating over the items of every page of a paginated endpoint."""
+
+import asyncio
+import time
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from pydantic_tfl_api import AsyncStopPointClient, StopPointClient
+from pydantic_tfl_api.core import (
+    ApiError,
+    AsyncItemStream,
+    HTTPResponse,
+    ItemStream,
+    PageError,
+    override_validation,
+)
+from pydantic_tfl_api.core.pagination import page_items, response_model
+from pydantic_tfl_api.models import StopPoint, StopPointArray, StopPointsResponse
+
+from .conftest import AsyncFakeHTTPClient, FakeHTTPClient, make_http_response
+
+PAGE_SIZE = 3
+
+
+def stop_ids(count: int) -> list[str]:
+    return [f"stop-{number}" for number in range(count)]
+
+
+def page_content(url: str, total: int, with_total: bool = True) -> Any:
+    """The content of /StopPoint/Mode/{modes}?page=N (with_total) or /StopPoint/Type/{types}/page/N."""
+    parsed = urlparse(url)
+    page = int(parse_qs(parsed.query)["page"][0] if with_total else parsed.path.rsplit("/", 1)[1])
+    ids = stop_ids(total)[(page - 1) * PAGE_SIZE : page * PAGE_SIZE]
+    stop_points = [{"naptanId": id_, "commonName": id_.title()} for id_ in ids]
+    if not with_total:
+        return stop_points
+    return {"stopPoints": stop_points, "pageSize": PAGE_SIZE, "total": total, "page": page}
+
+
+class PagesHTTPClient(FakeHTTPClient):
+    """HTTP client serving ``total`` stop points in pages of PAGE_SIZE, tracking concurrent requests."""
+
+    def __init__(
+        self, total: int, with_total: bool = True, delay: float = 0.0, failing_page: int | None = None
+    ) -> None:
+        super().__init__(delay=delay)
+        self.total = total
+        self.with_total = with_total
+        self.failing_page = failing_page
+
+    def respond(self, number: int, url: str) -> HTTPResponse:
+        if self.failing_page is not None and url.endswith(f"page={self.failing_page}"):
+            return make_http_response({"message": "boom"}, 500, url=url)
+        return make_http_response(page_content(url, self.total, self.with_total), url=url)
+
+
+class TestPageItems:
+    """Tests for reading the items and size of a page."""
+
+    def test_paged_response(self) -> None:
+        content = StopPointsResponse(stopPoints=[StopPoint(naptanId="a")], pageSize=1000, total=5000, page=1)
+        items, total, page_size = page_items(content)
+        assert [item.naptanId for item in items] == ["a"]
+        assert (total, page_size) == (5000, 1000)
+
+    def test_array(self) -> None:
+        items, total, page_size = page_items(StopPointArray([StopPoint(naptanId="a")]))
+        assert len(items) == 1
+        assert (total, page_size) == (None, None)
+
+    def test_raw(self) -> None:
+        items, total, page_size = page_items({"centrePoint": [1.0, 2.0], "stopPoints": [{"naptanId": "a"}], "total": 1})
+        assert items == [{"naptanId": "a"}]
+        assert (total, page_size) == (1, None)
+
+    def test_raw_empty_page(self) -> None:
+        content = {"centrePoint": [1.0, 2.0], "stopPoints": [], "pageSize": 1000, "total": 0, "page": 1}
+        assert page_items(content, StopPointsResponse) == ([], 0, 1000)
+        assert page_items(content) == ([], 0, 1000)
+
+    def test_response_model(self) -> None:
+        client = StopPointClient()
+        assert response_model(client.GetByModeByPathModesQueryPage) is StopPointsResponse
+        assert response_model(lambda page: None) is None
+
+    def test_not_a_page(self) -> None:
+        with pytest.raises(ValueError, match="not pages"):
+            page_items("text")
+
+
+class TestClientIterAllPages:
+    """Tests for Client.iter_all_pages."""
+
+    @pytest.mark.parametrize("total", [0, 2, 3, 10])
+    def test_yields_items_of_every_page_in_order(self, total: int) -> None:
+        http_client = PagesHTTPClient(total)
+        client = StopPointClient(http_client=http_client)
+
+        stream = client.iter_all_pages(client.GetByModeByPathModesQueryPage, "bus")
+
+        assert isinstance(stream, ItemStream)
+        assert [stop.naptanId for stop in stream] == stop_ids(total)
+        assert len(http_client.urls) == max(1, -(-total // PAGE_SIZE))
+
+    def test_prefetches_pages_concurrently(self) -> None:
+        http_client = PagesHTTPClient(30, delay=0.05)
+        client = StopPointClient(http_client=http_client)
+
+        assert len(list(client.iter_all_pages(client.GetByModeByPathModesQueryPage, "bus", prefetch=4))) == 30
+        assert http_client.max_in_flight == 4
+
+        http_client.max_in_flight = 0
+        assert len(list(client.iter_all_pages(client.GetByModeByPathModesQueryPage, "bus", prefetch=1))) == 30
+        assert http_client.max_in_flight == 1
+
+    def test_pages_without_total(self) -> None:
+        http_client = PagesHTTPClient(7, with_total=False)
+        client = StopPointClient(http_client=http_client)
+
+        stream = client.iter_all_pages(client.GetByTypeWithPaginationByPathTypesPathPage, "NaptanMetroStation")
+
+        assert isinstance(stream, ItemStream)
+        assert [stop.naptanId for stop in stream] == stop_ids(7)
+
+    def test_validation_mode(self) -> None:
+        client = StopPointClient(http_client=PagesHTTPClient(5))
+        with override_validation("raw"):
+            stream = client.iter_all_pages(client.GetByModeByPathModesQueryPage, "bus")
+            assert isinstance(stream, ItemStream)
+            assert [stop["naptanId"] for stop in stream] == stop_ids(5)
+
+    def test_validation_mode_empty_page(self) -> None:
+        http_client = PagesHTTPClient(0)
+        client = StopPointClient(http_client=http_client)
+        with override_validation("raw"):
+            stream = client.iter_all_pages(client.GetByModeByPathModesQueryPage, "bus")
+            assert isinstance(stream, ItemStream)
+            assert list(stream) == []
+        assert len(http_client.urls) == 1
+
+    def test_first_page_error(self) -> None:
+        client = StopPointClient(http_client=PagesHTTPClient(10, failing_page=1), retry_policy=None)
+
+        result = client.iter_all_pages(client.GetByModeByPathModesQueryPage, "bus")
+
+        assert isinstance(result, ApiError)
+        assert result.http_status_code == 500
+
+    def test_later_page_error(self) -> None:
+        client = StopPointClient(http_client=PagesHTTPClient(10, failing_page=3), retry_policy=None)
+        stream = client.iter_all_pages(client.GetByModeByPathModesQueryPage, "bus")
+
+        with pytest.raises(PageError, match="page 3") as exc_info:
+            list(stream)
+        assert exc_info.value.error.http_status_code == 500
+
+    def test_close_early_stops_fetching(self) -> None:
+        http_client = PagesHTTPClient(300, delay=0.01)
+        client = StopPointClient(http_client=http_client)
+
+        stream = client.iter_all_pages(client.GetByModeByPathModesQueryPage, "bus", prefetch=2)
+        assert isinstance(stream, ItemStream)
+        with stream:
+            next(stream)
+        time.sleep(0.05)
+
+        assert len(http_client.urls) <= 4
+        assert list(stream) == []
+
+    def test_invalid_prefetch(self) -> None:
+        client = StopPointClient(http_client=PagesHTTPClient(1))
+        with pytest.raises(ValueError, match="prefetch"):
+            client.iter_all_pages(client.GetByModeByPathModesQueryPage, "bus", prefetch=0)
+
+
+class AsyncPagesHTTPClient(AsyncFakeHTTPClient):
+    """Async HTTP client serving ``total`` stop points in pages of PAGE_SIZE, tracking concurrent requests."""
+
+    def __init__(self, total: int) -> None:
+        super().__init__(respond=lambda url: make_http_response(page_content(url, total), url=url), delay=0.01)
+        self.total = total
+
+
+class TestAsyncClientIterAllPages:
+    """Tests for AsyncClient.aiter_all_pages."""
+
+    @pytest.mark.asyncio
+    async def test_yields_items_of_every_page_in_order(self) -> None:
+        http_client = AsyncPagesHTTPClient(20)
+        client = AsyncStopPointClient(http_client=http_client)
+
+        stream = await client.aiter_all_pages(client.GetByModeByPathModesQueryPage, "bus", prefetch=3)
+
+        assert isinstance(stream, AsyncItemStream)
+        assert [stop.naptanId async for stop in stream] == stop_ids(20)
+        assert len(http_client.urls) == 7
+        assert http_client.max_in_flight == 3
+
+    @pytest.mark.asyncio
+    async def test_close_early_cancels_prefetched_pages(self) -> None:
+        http_client = AsyncPagesHTTPClient(300)
+        client = AsyncStopPointClient(http_client=http_client)
+
+        stream = await client.aiter_all_pages(client.GetByModeByPathModesQueryPage, "bus", prefetch=2)
+        assert isinstance(stream, AsyncItemStream)
+        async with stream:
+            await anext(stream)
+            await anext(stream)
+            await anext(stream)
+            await anext(stream)  # the first item of page 2 starts fetching pages 2 and 3
+        await asyncio.sleep(0.05)
+
+        assert len(http_client.urls) == 3
+        assert [stop async for stop in stream] == []
+
+    @pytest.mark.asyncio
+    async def test_validation_mode_empty_page(self) -> None:
+        client = AsyncStopPointClient(http_client=AsyncPagesHTTPClient(0))
+        with override_validation("raw"):
+            stream = await client.aiter_all_pages(client.GetByModeByPathModesQueryPage, "bus")
+            assert isinstance(stream, AsyncItemStream)
+            assert [stop async for stop in stream] == []
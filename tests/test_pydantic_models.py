@@ -35,6 +35,7 @@ def create_response_from_json(json_file: str) -> Mock:
     mock.status_code = serialised_response["status_code"]
     mock.url = serialised_response["url"]
     mock.text = content_str
+    mock.content = content_str.encode()
     mock.reason = "OK"
     mock.json.return_value = content_data
 
@@ -0,0 +1,133 @@
+"""Tests for the client-side token bucket rate limiter."""
+
+import asyncio
+from collections.abc import Iterator
+from unittest.mock import Mock, patch
+
+import pytest
+
+from pydantic_tfl_api import AsyncLineClient, LineClient
+from pydantic_tfl_api.core import (
+    AsyncHTTPClientBase,
+    AsyncRestClient,
+    HTTPClientBase,
+    RateLimiter,
+    RestClient,
+    get_shared_rate_limiter,
+)
+from pydantic_tfl_api.core.rate_limit import APP_KEY_REQUESTS_PER_SECOND
+
+from .conftest import FakeClock
+
+
+@pytest.fixture
+def clock() -> Iterator[FakeClock]:
+    fake = FakeClock()
+    with (
+        patch("pydantic_tfl_api.core.rate_limit.time.monotonic", fake.monotonic),
+        patch("pydantic_tfl_api.core.rate_limit.time.sleep", fake.sleep),
+    ):
+        yield fake
+
+
+class TestRateLimiter:
+    """Tests for RateLimiter token accounting."""
+
+    def test_burst_up_to_capacity_without_waiting(self, clock: FakeClock) -> None:
+        limiter = RateLimiter(rate=1, capacity=3)
+        assert [limiter.reserve() for _ in range(3)] == [0, 0, 0]
+
+    def test_waits_are_queued_in_arrival_order(self, clock: FakeClock) -> None:
+        limiter = RateLimiter(rate=2, capacity=1)
+        assert limiter.reserve() == 0
+        assert limiter.reserve() == pytest.approx(0.5)
+        assert limiter.reserve() == pytest.approx(1.0)
+
+    def test_tokens_refill_over_time_up_to_capacity(self, clock: FakeClock) -> None:
+        limiter = RateLimiter(rate=1, capacity=2)
+        limiter.reserve()
+        limiter.reserve()
+        clock.now += 10
+        assert [limiter.reserve() for _ in range(2)] == [0, 0]
+        assert limiter.reserve() == pytest.approx(1.0)
+
+    def test_acquire_sleeps_until_token_is_due(self, clock: FakeClock) -> None:
+        limiter = RateLimiter(rate=4, capacity=1)
+        for _ in range(3):
+            limiter.acquire()
+        assert clock.sleeps == [pytest.approx(0.25), pytest.approx(0.25)]
+
+    @pytest.mark.asyncio
+    async def test_acquire_async_uses_asyncio_sleep(self) -> None:
+        limiter = RateLimiter(rate=4, capacity=1)
+        with patch("pydantic_tfl_api.core.rate_limit.asyncio.sleep") as mock_sleep:
+            await limiter.acquire_async()
+            mock_sleep.assert_not_called()
+            await limiter.acquire_async()
+            mock_sleep.assert_awaited_once()
+            assert mock_sleep.await_args.args[0] == pytest.approx(0.25, abs=0.01)  # type: ignore[union-attr]
+
+    def test_per_minute(self) -> None:
+        limiter = RateLimiter.per_minute(120)
+        assert limiter.rate == 2
+        assert limiter.capacity == 2
+
+    def test_default_capacity_is_at_least_one(self) -> None:
+        assert RateLimiter(rate=0.5).capacity == 1
+
+    @pytest.mark.parametrize("rate, capacity", [(0, None), (-1, None), (1, 0.5)])
+    def test_invalid_arguments(self, rate: float, capacity: float | None) -> None:
+        with pytest.raises(ValueError):
+            RateLimiter(rate, capacity)
+
+
+class TestSharedRateLimiter:
+    """Tests for the per app_key limiter registry."""
+
+    def test_same_key_shares_limiter(self) -> None:
+        assert get_shared_rate_limiter("key-a") is get_shared_rate_limiter("key-a")
+        assert get_shared_rate_limiter("key-a") is not get_shared_rate_limiter("key-b")
+
+    def test_default_rates(self) -> None:
+        assert get_shared_rate_limiter(None).rate == 1
+        assert get_shared_rate_limiter("key-a").rate == APP_KEY_REQUESTS_PER_SECOND
+
+    def test_clients_with_same_key_share_limiter(self) -> None:
+        http_client = Mock(spec=HTTPClientBase)
+        sync_client = LineClient("key-c", http_client=http_client, rate_limiter=True)
+        async_client = AsyncLineClient("key-c", http_client=Mock(spec=AsyncHTTPClientBase), rate_limiter=True)
+
+        assert sync_client.client.rate_limiter is get_shared_rate_limiter("key-c")
+        assert async_client.client.rate_limiter is get_shared_rate_limiter("key-c")
+
+    @pytest.mark.parametrize("rate_limiter", [None, False])
+    def test_disabled_by_default(self, rate_limiter: bool | None) -> None:
+        assert RestClient(http_client=Mock(spec=HTTPClientBase), rate_limiter=rate_limiter).rate_limiter is None
+
+
+class TestRestClientRateLimiting:
+    """Tests that the REST clients take a token before every request."""
+
+    def test_rest_client_acquires_before_each_request(self) -> None:
+        limiter = Mock(spec=RateLimiter)
+        http_client = Mock(spec=HTTPClientBase)
+        http_client.get.return_value = Mock(status_code=200)
+        client = RestClient(http_client=http_client, rate_limiter=limiter)
+
+        client.send_request("https://api.tfl.gov.uk", "/Line/Meta/Modes")
+        client.send_request("https://api.tfl.gov.uk", "/Line/Meta/Modes")
+
+        assert limiter.acquire.call_count == 2
+        assert http_client.get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_async_rest_client_acquires_before_each_request(self) -> None:
+        limiter = Mock(spec=RateLimiter)
+        http_client = Mock(spec=AsyncHTTPClientBase)
+        http_client.get.return_value = Mock(status_code=200)
+        client = AsyncRestClient(http_client=http_client, rate_limiter=limiter)
+
+        await asyncio.gather(*(client.send_request("https://api.tfl.gov.uk", "/Line/Meta/Modes") for _ in range(3)))
+
+        assert limiter.acquire_async.await_count == 3
+        limiter.acquire.assert_not_called()
@@ -0,0 +1,209 @@
+"""Tests for coalescing identical in-flight requests (single-flight)."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+
+from pydantic_tfl_api import AsyncLineClient, LineClient
+from pydantic_tfl_api.core import HTTPResponse, ResponseModel
+from pydantic_tfl_api.models import ModeArray
+
+from .conftest import AsyncFakeHTTPClient, FakeHTTPClient, make_http_response
+
+MODES_JSON = [{"isTflService": True, "isFarePaying": True, "isScheduledService": True, "modeName": "tube"}]
+
+
+def make_response() -> Mock:
+    return make_http_response(MODES_JSON, headers={"Cache-Control": "public, max-age=60"})
+
+
+class GatedHTTPClient(FakeHTTPClient):
+    """HTTP client whose requests block until ``release`` is set."""
+
+    def __init__(self, response: Mock | None = None, error: Exception | None = None) -> None:
+        super().__init__(response or make_response())
+        self.error = error
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def wait(self, number: int, url: str) -> None:
+        self.started.set()
+        assert self.release.wait(5)
+
+    def respond(self, number: int, url: str) -> HTTPResponse:
+        if self.error is not None:
+            raise self.error
+        return super().respond(number, url)
+
+
+class GatedAsyncHTTPClient(AsyncFakeHTTPClient):
+    """Async HTTP client whose requests wait until ``release`` is set."""
+
+    def __init__(self, response: Mock | None = None, error: Exception | None = None) -> None:
+        super().__init__(response or make_response())
+        self.error = error
+        self.release = asyncio.Event()
+
+    async def wait(self, number: int, url: str) -> None:
+        await self.release.wait()
+
+    def respond(self, number: int, url: str) -> HTTPResponse:
+        if self.error is not None:
+            raise self.error
+        return super().respond(number, url)
+
+
+def run_concurrently(client: LineClient, http_client: GatedHTTPClient, count: int) -> list[object]:
+    """Call MetaModes from ``count`` threads while the first request is held open."""
+    with ThreadPoolExecutor(max_workers=count) as executor:
+        futures = [executor.submit(client.MetaModes) for _ in range(count)]
+        assert http_client.started.wait(5)
+        # give the other threads time to join the in-flight request
+        time.sleep(0.1)
+        http_client.release.set()
+        return [future.result(timeout=5) for future in futures]
+
+
+class TestClientCoalescing:
+    """Tests for single-flight requests in the sync Client."""
+
+    def test_concurrent_identical_requests_share_one_fetch(self) -> None:
+        http_client = GatedHTTPClient()
+        client = LineClient(http_client=http_client)
+
+        results = run_concurrently(client, http_client, 5)
+
+        assert http_client.urls == ["https://api.tfl.gov.uk/Line/Meta/Modes"]
+        assert isinstance(results[0], ResponseModel)
+        assert isinstance(results[0].content, ModeArray)
+        assert [mode.modeName for mode in results[0].content.root] == ["tube"]
+        assert all(result is results[0] for result in results)
+        assert client._in_flight == {}
+
+    def test_disabled_coalescing_sends_every_request(self) -> None:
+        http_client = GatedHTTPClient()
+        http_client.release.set()
+        client = LineClient(http_client=http_client, coalesce_requests=False)
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            list(executor.map(lambda _: client.MetaModes(), range(3)))
+
+        assert len(http_client.urls) == 3
+
+    def test_different_urls_are_not_coalesced(self) -> None:
+        http_client = GatedHTTPClient()
+        http_client.release.set()
+        client = LineClient(http_client=http_client)
+
+        client.StatusByIdsByPathIdsQueryDetail("victoria", detail=True)
+        client.StatusByIdsByPathIdsQueryDetail("central", detail=True)
+
+        assert len(http_client.urls) == 2
+
+    def test_exception_propagates_to_every_waiter(self) -> None:
+        http_client = GatedHTTPClient(error=ConnectionError("boom"))
+        client = LineClient(http_client=http_client, retry_policy=None)
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [executor.submit(client.MetaModes) for _ in range(3)]
+            assert http_client.started.wait(5)
+            time.sleep(0.1)
+            http_client.release.set()
+            for future in futures:
+                with pytest.raises(ConnectionError, match="boom"):
+                    future.result(timeout=5)
+
+        assert len(http_client.urls) == 1
+        assert client._in_flight == {}
+
+    def test_sequential_requests_are_not_coalesced(self) -> None:
+        http_client = GatedHTTPClient()
+        http_client.release.set()
+        client = LineClient(http_client=http_client)
+
+        client.MetaModes()
+        client.MetaModes()
+
+        assert len(http_client.urls) == 2
+
+
+class TestAsyncClientCoalescing:
+    """Tests for single-flight requests in the AsyncClient."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_requests_share_one_fetch(self) -> None:
+        http_client = GatedAsyncHTTPClient()
+        client = AsyncLineClient(http_client=http_client)
+
+        pending = asyncio.gather(*(client.MetaModes() for _ in range(10)))
+        await asyncio.sleep(0)
+        http_client.release.set()
+        results = await pending
+
+        assert len(http_client.urls) == 1
+        assert isinstance(results[0], ResponseModel)
+        assert isinstance(results[0].content, ModeArray)
+        assert [mode.modeName for mode in results[0].content.root] == ["tube"]
+        assert all(result is results[0] for result in results)
+        assert client._in_flight == {}
+
+    @pytest.mark.asyncio
+    async def test_disabled_coalescing_sends_every_request(self) -> None:
+        http_client = GatedAsyncHTTPClient()
+        http_client.release.set()
+        client = AsyncLineClient(http_client=http_client, coalesce_requests=False)
+
+        await asyncio.gather(*(client.MetaModes() for _ in range(3)))
+
+        assert len(http_client.urls) == 3
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_shared_request(self) -> None:
+        http_client = GatedAsyncHTTPClient()
+        client = AsyncLineClient(http_client=http_client)
+
+        first = asyncio.create_task(client.MetaModes())
+        second = asyncio.create_task(client.MetaModes())
+        await asyncio.sleep(0)
+        first.cancel()
+        http_client.release.set()
+
+        result = await second
+        assert isinstance(result, ResponseModel)
+        assert isinstance(result.content, ModeArray)
+        assert first.cancelled()
+        assert len(http_client.urls) == 1
+
+    @pytest.mark.asyncio
+    async def test_shared_request_cancelled_with_its_last_waiter(self) -> None:
+        http_client = GatedAsyncHTTPClient()
+        client = AsyncLineClient(http_client=http_client)
+
+        waiters = [asyncio.create_task(client.MetaModes()) for _ in range(2)]
+        await asyncio.sleep(0)
+        for waiter in waiters:
+            waiter.cancel()
+        await asyncio.gather(*waiters, return_exceptions=True)
+        await asyncio.sleep(0)
+
+        assert len(http_client.urls) == 1
+        assert http_client.cancelled == 1
+        assert client._in_flight == {}
+
+    @pytest.mark.asyncio
+    async def test_exception_propagates_to_every_waiter(self) -> None:
+        http_client = GatedAsyncHTTPClient(error=ConnectionError("boom"))
+        client = AsyncLineClient(http_client=http_client, retry_policy=None)
+
+        pending = asyncio.gather(*(client.MetaModes() for _ in range(3)), return_exceptions=True)
+        await asyncio.sleep(0)
+        http_client.release.set()
+        results = await pending
+
+        assert all(isinstance(result, ConnectionError) for result in results)
+        assert len(http_client.urls) == 1
+        assert client._in_flight == {}
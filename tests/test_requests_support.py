@@ -4,7 +4,10 @@ These tests are specific to the requests library backend and will be
 skipped if requests is not installed.
 """
 
-from unittest.mock import Mock, patch
+import gc
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, PropertyMock, patch
 
 import pytest
 
@@ -12,7 +15,11 @@ import pytest
 requests = pytest.importorskip("requests")
 
 from pydantic_tfl_api.core import HTTPResponse  # noqa: E402
-from pydantic_tfl_api.core.http_backends.requests_client import RequestsClient, RequestsResponse  # noqa: E402
+from pydantic_tfl_api.core.http_backends.requests_client import (  # noqa: E402
+    STREAM_CHUNK_SIZE,
+    RequestsClient,
+    RequestsResponse,
+)
 
 
 class TestRequestsResponseConformsToProtocol:
@@ -42,6 +49,7 @@ class TestRequestsResponse:
         mock.status_code = 200
         mock.headers = {"Content-Type": "application/json", "Date": "Mon, 01 Jan 2024 00:00:00 GMT"}
         mock.text = '{"message": "success"}'
+        mock.content = b'{"message": "success"}'
         mock.url = "http://api.tfl.gov.uk/Line/victoria"
         mock.reason = "OK"
         mock.json.return_value = {"message": "success"}
@@ -87,6 +95,13 @@ class TestRequestsResponse:
         data = response.json()
         assert data == {"message": "success"}
 
+    def test_json_parses_content_bytes(self, mock_requests_response: Mock) -> None:
+        """Test json parses the decompressed bytes without decoding them to text."""
+        mock_requests_response.content = '{"name": "King\'s Cross St. Pancras \u2713"}'.encode()
+        type(mock_requests_response).text = PropertyMock(side_effect=AssertionError("text should not be used"))
+        response = RequestsResponse(mock_requests_response)
+        assert response.json() == {"name": "King's Cross St. Pancras \u2713"}
+
     def test_raise_for_status(self, mock_requests_response: Mock) -> None:
         """Test raise_for_status delegates to underlying response."""
         response = RequestsResponse(mock_requests_response)
@@ -98,8 +113,8 @@ class TestRequestsClient:
     """Tests for the RequestsClient implementation."""
 
     def test_get_makes_request(self) -> None:
-        """Test that get method makes a GET request."""
-        with patch("pydantic_tfl_api.core.http_backends.requests_client.requests.get") as mock_get:
+        """Test that get method makes a GET request through the session."""
+        with patch("pydantic_tfl_api.core.http_backends.requests_client.requests.Session.get") as mock_get:
             mock_response = Mock(spec=requests.Response)
             mock_get.return_value = mock_response
 
@@ -111,7 +126,7 @@ class TestRequestsClient:
 
     def test_get_default_timeout(self) -> None:
         """Test that get method uses default timeout of 30 seconds."""
-        with patch("pydantic_tfl_api.core.http_backends.requests_client.requests.get") as mock_get:
+        with patch("pydantic_tfl_api.core.http_backends.requests_client.requests.Session.get") as mock_get:
             mock_response = Mock(spec=requests.Response)
             mock_get.return_value = mock_response
 
@@ -120,6 +135,78 @@ class TestRequestsClient:
 
             mock_get.assert_called_once_with("http://test.com", headers=None, timeout=30)
 
+    def test_stream_reads_body_as_it_arrives(self) -> None:
+        """Test that stream requests an unread body, iterates it in chunks and closes the response."""
+        with patch("pydantic_tfl_api.core.http_backends.requests_client.requests.Session.get") as mock_get:
+            mock_response = Mock(spec=requests.Response)
+            mock_response.iter_content.return_value = iter([b"[1,", b" 2]"])
+            mock_get.return_value = mock_response
+
+            with RequestsClient().stream("http://test.com", timeout=60) as response:
+                assert isinstance(response, RequestsResponse)
+                assert list(response.iter_bytes()) == [b"[1,", b" 2]"]
+                mock_response.close.assert_not_called()
+
+            mock_get.assert_called_once_with("http://test.com", headers=None, timeout=60, stream=True)
+            mock_response.iter_content.assert_called_once_with(STREAM_CHUNK_SIZE)
+            mock_response.close.assert_called_once()
+
+    def test_adapter_pool_is_configurable(self) -> None:
+        """Test that pool settings are passed to the HTTPAdapter and mounted on the session."""
+        client = RequestsClient(pool_connections=4, pool_maxsize=32, pool_block=True)
+
+        pool_kw = client.adapter.poolmanager.connection_pool_kw
+        assert pool_kw["maxsize"] == 32
+        assert pool_kw["block"] is True
+        assert client.session.get_adapter("https://api.tfl.gov.uk/Line") is client.adapter
+
+    def test_session_is_reused_within_a_thread(self) -> None:
+        """Test that the same session is used for every request from one thread."""
+        client = RequestsClient()
+        assert client.session is client.session
+
+    def test_each_thread_gets_its_own_session_sharing_one_adapter(self) -> None:
+        """Test that threads get separate sessions backed by the same connection pool."""
+        client = RequestsClient()
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            sessions = list(executor.map(lambda _: client.session, range(4)))
+        sessions.append(client.session)
+
+        assert len({id(session) for session in sessions}) >= 2
+        assert all(session.get_adapter("https://api.tfl.gov.uk") is client.adapter for session in sessions)
+
+    def test_session_released_when_thread_ends(self) -> None:
+        """Test that a thread's session is not kept alive by the client after the thread ends."""
+        client = RequestsClient()
+        for _ in range(5):
+            thread = threading.Thread(target=lambda: client.session)
+            thread.start()
+            thread.join()
+        gc.collect()
+
+        assert len(client._sessions) == 0
+
+    def test_close_closes_sessions_and_adapter(self) -> None:
+        """Test that close() closes sessions and the adapter, and later requests get a new session."""
+        client = RequestsClient()
+        session = client.session
+
+        with (
+            patch.object(session, "close") as mock_session_close,
+            patch.object(client.adapter, "close") as mock_adapter_close,
+        ):
+            client.close()
+
+        mock_session_close.assert_called_once()
+        mock_adapter_close.assert_called_once()
+        assert client.session is not session
+
+    def test_context_manager_closes_client(self) -> None:
+        """Test that RequestsClient closes its sessions when used as a context manager."""
+        with patch.object(RequestsClient, "close") as mock_close, RequestsClient():
+            pass
+        mock_close.assert_called_once()
+
 
 class TestRequestsClientImports:
     """Tests for requests client imports."""
@@ -0,0 +1,522 @@
+"""Tests for the Cache-Control aware response cache."""
+
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+from unittest.mock import Mock
+
+import pytest
+
+from pydantic_tfl_api import AsyncLineClient, LineClient
+from pydantic_tfl_api.core import (
+    ApiError,
+    CacheEntry,
+    CachePolicy,
+    CacheState,
+    GenericResponseModel,
+    LRUResponseCache,
+    ResponseModel,
+)
+from pydantic_tfl_api.core.cache import build_cache_entry, cache_control_directives
+
+from .conftest import AsyncFakeHTTPClient, FakeHTTPClient, make_http_response
+
+MODES_JSON = [{"isTflService": True, "isFarePaying": True, "isScheduledService": True, "modeName": "tube"}]
+
+
+def make_response(
+    status_code: int = 200,
+    cache_control: str | None = "public, must-revalidate, max-age=43200, s-maxage=86400",
+    date: datetime | None = None,
+    json_data: object = None,
+    etag: str | None = None,
+    last_modified: str | None = None,
+) -> Mock:
+    """Create an HTTPResponse mock with TfL-style caching headers."""
+    headers = {"Date": format_datetime(date or datetime.now(UTC), usegmt=True)}
+    if cache_control is not None:
+        headers["Cache-Control"] = cache_control
+    if etag is not None:
+        headers["ETag"] = etag
+    if last_modified is not None:
+        headers["Last-Modified"] = last_modified
+    if status_code == 304:
+        content: object = None
+    elif status_code == 200:
+        content = MODES_JSON if json_data is None else json_data
+    else:
+        content = b"error"
+    return make_http_response(content, status_code, headers)
+
+
+def make_entry(size: int = 0, expires: datetime | None = None, hits: int = 0) -> CacheEntry:
+    content = GenericResponseModel([])
+    response: ResponseModel[GenericResponseModel] = ResponseModel(
+        content_expires=expires, shared_expires=None, response_timestamp=None, content=content
+    )
+    return CacheEntry(response=response, expires=expires, size=size, hits=hits)
+
+
+class TestCacheEntry:
+    """Tests for CacheEntry freshness."""
+
+    def test_fresh_before_expiry(self) -> None:
+        assert make_entry(expires=datetime.now(UTC) + timedelta(seconds=60)).is_fresh()
+
+    def test_stale_after_expiry(self) -> None:
+        assert not make_entry(expires=datetime.now(UTC) - timedelta(seconds=1)).is_fresh()
+
+    def test_no_expiry_is_never_fresh(self) -> None:
+        assert not make_entry(expires=None).is_fresh()
+
+    def test_naive_expiry_is_treated_as_utc(self) -> None:
+        expires = datetime(2024, 1, 1, 12, 0, 0)
+        entry = make_entry(expires=expires)
+        assert entry.is_fresh(now=datetime(2024, 1, 1, 11, 59, 59, tzinfo=UTC))
+        assert not entry.is_fresh(now=datetime(2024, 1, 1, 12, 0, 0, tzinfo=UTC))
+
+
+NOW = datetime(2024, 1, 1, 12, 0, 0, tzinfo=UTC)
+
+
+@pytest.mark.parametrize(
+    "expires_in, hits, policy, expected",
+    [
+        (60, 0, CachePolicy(), CacheState.FRESH),
+        (-1, 0, CachePolicy(), CacheState.EXPIRED),
+        (-10, 0, CachePolicy(stale_while_revalidate=30), CacheState.STALE),
+        (-60, 0, CachePolicy(stale_while_revalidate=30), CacheState.EXPIRED),
+        (10, 5, CachePolicy(refresh_ahead=30), CacheState.REFRESH_AHEAD),
+        (10, 1, CachePolicy(refresh_ahead=30, hot_threshold=2), CacheState.FRESH),
+        (60, 5, CachePolicy(refresh_ahead=30), CacheState.FRESH),
+    ],
+    ids=[
+        "fresh",
+        "expired_without_swr",
+        "stale_within_swr_window",
+        "expired_beyond_swr_window",
+        "hot_entry_near_expiry",
+        "cold_entry_near_expiry",
+        "hot_entry_not_near_expiry",
+    ],
+)
+def test_cache_entry_state(expires_in: int, hits: int, policy: CachePolicy, expected: CacheState) -> None:
+    entry = make_entry(expires=NOW + timedelta(seconds=expires_in), hits=hits)
+    assert entry.state(policy, now=NOW) is expected
+
+
+class TestLRUResponseCache:
+    """Tests for the LRU cache implementation."""
+
+    def test_get_missing_returns_none(self) -> None:
+        assert LRUResponseCache().get("missing") is None
+
+    def test_evicts_least_recently_used_entry(self) -> None:
+        cache = LRUResponseCache(max_entries=2)
+        cache.set("a", make_entry())
+        cache.set("b", make_entry())
+        cache.get("a")
+        cache.set("c", make_entry())
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert "c" in cache
+        assert len(cache) == 2
+
+    def test_evicts_by_total_size(self) -> None:
+        cache = LRUResponseCache(max_entries=None, max_size=100)
+        cache.set("a", make_entry(size=60))
+        cache.set("b", make_entry(size=30))
+        cache.set("c", make_entry(size=30))
+
+        assert "a" not in cache
+        assert cache.size == 60
+
+    def test_replacing_entry_updates_size(self) -> None:
+        cache = LRUResponseCache(max_size=100)
+        cache.set("a", make_entry(size=60))
+        cache.set("a", make_entry(size=10))
+        assert cache.size == 10
+
+    def test_oversized_entry_is_not_cached(self) -> None:
+        cache = LRUResponseCache(max_size=10)
+        cache.set("a", make_entry(size=5))
+        cache.set("a", make_entry(size=50))
+        assert "a" not in cache
+        assert cache.size == 0
+
+    def test_delete_and_clear(self) -> None:
+        cache = LRUResponseCache()
+        cache.set("a", make_entry(size=5))
+        cache.set("b", make_entry(size=5))
+        cache.delete("a")
+        cache.delete("missing")
+        assert "a" not in cache
+        assert cache.size == 5
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.size == 0
+
+
+@pytest.mark.parametrize(
+    "cache_control, expected",
+    [
+        (None, set()),
+        ("public, max-age=43200", {"public", "max-age"}),
+        ("private, No-Cache", {"private", "no-cache"}),
+    ],
+    ids=["missing", "public", "case_insensitive"],
+)
+def test_cache_control_directives(cache_control: str | None, expected: set[str]) -> None:
+    assert cache_control_directives(cache_control) == expected
+
+
+@pytest.mark.parametrize(
+    "headers, stored, expires",
+    [
+        ({}, True, True),
+        ({"Cache-Control": "public, max-age=60"}, True, True),
+        ({"Cache-Control": "no-store", "ETag": '"v1"'}, False, False),
+        ({"Cache-Control": "no-cache"}, False, False),
+        ({"Cache-Control": "no-cache", "ETag": '"v1"'}, True, False),
+        ({"Cache-Control": "no-cache", "Last-Modified": "Mon, 01 Jan 2024 12:00:00 GMT"}, True, False),
+    ],
+    ids=["missing", "public", "no_store", "no_cache", "no_cache_with_etag", "no_cache_with_last_modified"],
+)
+def test_build_cache_entry(headers: dict[str, str], stored: bool, expires: bool) -> None:
+    response = make_entry(expires=datetime.now(UTC) + timedelta(seconds=60)).response
+    entry = build_cache_entry(response, headers, size=2, previous=make_entry(hits=3))
+
+    assert (entry is not None) is stored
+    if entry is not None:
+        assert (entry.expires is not None) is expires
+        assert entry.hits == 3
+        assert entry.etag == headers.get("ETag")
+        assert entry.last_modified == headers.get("Last-Modified")
+
+
+def test_build_cache_entry_without_expiry_or_validators() -> None:
+    assert build_cache_entry(make_entry().response, {}, size=2) is None
+
+
+def test_conditional_headers() -> None:
+    entry = make_entry()
+    assert entry.conditional_headers() == {}
+    entry.etag = '"v1"'
+    entry.last_modified = "Mon, 01 Jan 2024 12:00:00 GMT"
+    assert entry.conditional_headers() == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Mon, 01 Jan 2024 12:00:00 GMT",
+    }
+
+
+class TestClientResponseCache:
+    """Tests for response caching in the sync Client."""
+
+    def test_no_cache_by_default(self) -> None:
+        http_client = FakeHTTPClient(make_response())
+        client = LineClient(http_client=http_client)
+        client.MetaModes()
+        client.MetaModes()
+        assert client.cache is None
+        assert len(http_client.urls) == 2
+
+    def test_fresh_response_served_without_request(self) -> None:
+        http_client = FakeHTTPClient(make_response())
+        client = LineClient(http_client=http_client, cache=LRUResponseCache())
+
+        first = client.MetaModes()
+        second = client.MetaModes()
+
+        assert isinstance(first, ResponseModel)
+        assert second is first
+        assert http_client.urls == ["https://api.tfl.gov.uk/Line/Meta/Modes"]
+
+    def test_cache_keyed_on_request_url(self) -> None:
+        http_client = FakeHTTPClient(make_response())
+        cache = LRUResponseCache()
+        client = LineClient(http_client=http_client, cache=cache)
+
+        client.StatusByIdsByPathIdsQueryDetail("victoria", detail=True)
+        client.StatusByIdsByPathIdsQueryDetail("victoria", detail=False)
+        client.StatusByIdsByPathIdsQueryDetail("victoria", detail=True)
+
+        assert len(http_client.urls) == 2
+        assert "https://api.tfl.gov.uk/Line/victoria/Status?detail=True" in cache
+
+    def test_expired_response_is_refetched(self) -> None:
+        stale = make_response(cache_control="public, max-age=60", date=datetime.now(UTC) - timedelta(seconds=120))
+        http_client = FakeHTTPClient(stale, make_response())
+        client = LineClient(http_client=http_client, cache=LRUResponseCache())
+
+        client.MetaModes()
+        client.MetaModes()
+        client.MetaModes()
+
+        assert len(http_client.urls) == 2
+
+    @pytest.mark.parametrize("cache_control", [None, "no-store", "no-cache, max-age=60", "no-store, max-age=60"])
+    def test_uncacheable_responses_not_stored(self, cache_control: str | None) -> None:
+        http_client = FakeHTTPClient(make_response(cache_control=cache_control))
+        cache = LRUResponseCache()
+        client = LineClient(http_client=http_client, cache=cache)
+
+        client.MetaModes()
+        client.MetaModes()
+
+        assert len(cache) == 0
+        assert len(http_client.urls) == 2
+
+    def test_errors_not_cached(self) -> None:
+        http_client = FakeHTTPClient(make_response(status_code=500))
+        cache = LRUResponseCache()
+        client = LineClient(http_client=http_client, cache=cache)
+
+        assert isinstance(client.MetaModes(), ApiError)
+        assert len(cache) == 0
+
+    def test_cache_shared_between_clients(self) -> None:
+        cache = LRUResponseCache()
+        first_http = FakeHTTPClient(make_response())
+        second_http = FakeHTTPClient(make_response())
+
+        LineClient(http_client=first_http, cache=cache).MetaModes()
+        LineClient(http_client=second_http, cache=cache).MetaModes()
+
+        assert len(first_http.urls) == 1
+        assert second_http.urls == []
+
+
+class TestAsyncClientResponseCache:
+    """Tests for response caching in the AsyncClient."""
+
+    @pytest.mark.asyncio
+    async def test_fresh_response_served_without_request(self) -> None:
+        http_client = AsyncFakeHTTPClient(make_response())
+        client = AsyncLineClient(http_client=http_client, cache=LRUResponseCache())
+
+        first = await client.MetaModes()
+        second = await client.MetaModes()
+
+        assert isinstance(first, ResponseModel)
+        assert second is first
+        assert len(http_client.urls) == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_response_is_refetched(self) -> None:
+        stale = make_response(cache_control="public, max-age=60", date=datetime.now(UTC) - timedelta(seconds=120))
+        http_client = AsyncFakeHTTPClient(stale, make_response())
+        client = AsyncLineClient(http_client=http_client, cache=LRUResponseCache())
+
+        await client.MetaModes()
+        await client.MetaModes()
+
+        assert len(http_client.urls) == 2
+
+
+class TestConditionalRequests:
+    """Tests for revalidating cached responses with ETag / Last-Modified."""
+
+    LAST_MODIFIED = "Mon, 01 Jan 2024 12:00:00 GMT"
+
+    def test_expired_entry_revalidated_with_validators(self) -> None:
+        stale = make_response(
+            cache_control="public, max-age=60",
+            date=datetime.now(UTC) - timedelta(seconds=120),
+            etag='"v1"',
+            last_modified=self.LAST_MODIFIED,
+        )
+        http_client = FakeHTTPClient(stale, make_response(status_code=304))
+        cache = LRUResponseCache()
+        client = LineClient(http_client=http_client, cache=cache)
+
+        first = client.MetaModes()
+        second = client.MetaModes()
+
+        assert http_client.request_headers[0].get("If-None-Match") is None
+        assert http_client.request_headers[1]["If-None-Match"] == '"v1"'
+        assert http_client.request_headers[1]["If-Modified-Since"] == self.LAST_MODIFIED
+        assert isinstance(second, ResponseModel)
+        assert second.content is first.content  # type: ignore[union-attr]
+        assert second.content_expires is not None
+        assert second.content_expires > datetime.now(UTC)
+
+        # the 304 refreshed the entry's expiry, so the next call is served from the cache
+        assert client.MetaModes() is second
+        assert len(http_client.urls) == 2
+        entry = cache.get("https://api.tfl.gov.uk/Line/Meta/Modes")
+        assert entry is not None
+        assert entry.etag == '"v1"'
+
+    def test_no_cache_response_revalidated_on_every_call(self) -> None:
+        http_client = FakeHTTPClient(
+            make_response(cache_control="no-cache", etag='"v1"'),
+            make_response(status_code=304, cache_control="no-cache"),
+        )
+        client = LineClient(http_client=http_client, cache=LRUResponseCache())
+
+        first = client.MetaModes()
+        second = client.MetaModes()
+        third = client.MetaModes()
+
+        assert len(http_client.urls) == 3
+        assert all(headers["If-None-Match"] == '"v1"' for headers in http_client.request_headers[1:])
+        assert second.content is first.content  # type: ignore[union-attr]
+        assert third.content is first.content  # type: ignore[union-attr]
+
+    def test_changed_response_replaces_entry(self) -> None:
+        http_client = FakeHTTPClient(
+            make_response(cache_control="no-cache", etag='"v1"'),
+            make_response(cache_control="no-cache", etag='"v2"'),
+        )
+        cache = LRUResponseCache()
+        client = LineClient(http_client=http_client, cache=cache)
+
+        first = client.MetaModes()
+        second = client.MetaModes()
+
+        assert second.content is not first.content  # type: ignore[union-attr]
+        entry = cache.get("https://api.tfl.gov.uk/Line/Meta/Modes")
+        assert entry is not None
+        assert entry.etag == '"v2"'
+
+    @pytest.mark.asyncio
+    async def test_async_expired_entry_revalidated(self) -> None:
+        stale = make_response(
+            cache_control="public, max-age=60", date=datetime.now(UTC) - timedelta(seconds=120), etag='"v1"'
+        )
+        http_client = AsyncFakeHTTPClient(stale, make_response(status_code=304))
+        client = AsyncLineClient(http_client=http_client, cache=LRUResponseCache())
+
+        first = await client.MetaModes()
+        second = await client.MetaModes()
+
+        assert http_client.request_headers[1]["If-None-Match"] == '"v1"'
+        assert second.content is first.content  # type: ignore[union-attr]
+        assert await client.MetaModes() is second
+        assert len(http_client.urls) == 2
+
+
+class BlockingHTTPClient(FakeHTTPClient):
+    """HTTP client whose requests after the first block until released."""
+
+    def __init__(self, *responses: Mock) -> None:
+        super().__init__(*responses)
+        self.release = threading.Event()
+
+    def wait(self, number: int, url: str) -> None:
+        if number > 0:
+            assert self.release.wait(5)
+
+
+def wait_for(condition: Callable[[], bool], timeout: float = 5) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.01)
+
+
+class TestStaleWhileRevalidate:
+    """Tests for stale-while-revalidate and refresh-ahead in the sync Client."""
+
+    def test_stale_entry_served_while_refreshing_in_background(self) -> None:
+        stale = make_response(cache_control="public, max-age=60", date=datetime.now(UTC) - timedelta(seconds=90))
+        http_client = BlockingHTTPClient(stale, make_response())
+        cache = LRUResponseCache()
+        client = LineClient(http_client=http_client, cache=cache, cache_policy=CachePolicy(stale_while_revalidate=60))
+
+        first = client.MetaModes()
+        # the refresh blocks in the background, so the stale response is returned immediately
+        second = client.MetaModes()
+        third = client.MetaModes()
+        assert second is first
+        assert third is first
+
+        http_client.release.set()
+        key = "https://api.tfl.gov.uk/Line/Meta/Modes"
+        wait_for(lambda: cache.get(key) is not None and cache.get(key).response is not first)  # type: ignore[union-attr]
+        wait_for(lambda: not client._refreshing)
+
+        # one initial fetch and a single, de-duplicated background refresh
+        assert len(http_client.urls) == 2
+        assert client.MetaModes() is cache.get(key).response  # type: ignore[union-attr]
+
+    def test_stale_beyond_window_fetched_synchronously(self) -> None:
+        stale = make_response(cache_control="public, max-age=60", date=datetime.now(UTC) - timedelta(seconds=300))
+        http_client = FakeHTTPClient(stale, make_response())
+        client = LineClient(
+            http_client=http_client, cache=LRUResponseCache(), cache_policy=CachePolicy(stale_while_revalidate=60)
+        )
+
+        first = client.MetaModes()
+        second = client.MetaModes()
+
+        assert second is not first
+        assert len(http_client.urls) == 2
+
+    def test_hot_entry_refreshed_ahead_of_expiry(self) -> None:
+        nearly_expired = make_response(
+            cache_control="public, max-age=60", date=datetime.now(UTC) - timedelta(seconds=50)
+        )
+        http_client = FakeHTTPClient(nearly_expired, make_response())
+        cache = LRUResponseCache()
+        client = LineClient(
+            http_client=http_client, cache=cache, cache_policy=CachePolicy(refresh_ahead=30, hot_threshold=2)
+        )
+
+        first = client.MetaModes()
+        assert client.MetaModes() is first  # first hit: not hot yet
+        assert client.MetaModes() is first  # second hit: hot, refresh scheduled
+        wait_for(lambda: len(http_client.urls) == 2 and not client._refreshing)
+
+        refreshed = cache.get("https://api.tfl.gov.uk/Line/Meta/Modes")
+        assert refreshed is not None
+        assert refreshed.response is not first
+        assert refreshed.hits == 2
+
+    def test_failed_refresh_keeps_stale_entry(self) -> None:
+        stale = make_response(cache_control="public, max-age=60", date=datetime.now(UTC) - timedelta(seconds=90))
+        http_client = FakeHTTPClient(stale, make_response(status_code=503))
+        cache = LRUResponseCache()
+        client = LineClient(
+            http_client=http_client,
+            cache=cache,
+            cache_policy=CachePolicy(stale_while_revalidate=60),
+            retry_policy=None,
+        )
+
+        first = client.MetaModes()
+        assert client.MetaModes() is first
+        wait_for(lambda: len(http_client.urls) == 2 and not client._refreshing)
+
+        assert client.MetaModes() is first
+
+
+class TestAsyncStaleWhileRevalidate:
+    """Tests for stale-while-revalidate in the AsyncClient."""
+
+    @pytest.mark.asyncio
+    async def test_stale_entry_served_while_refreshing_in_task(self) -> None:
+        stale = make_response(cache_control="public, max-age=60", date=datetime.now(UTC) - timedelta(seconds=90))
+        http_client = AsyncFakeHTTPClient(stale, make_response())
+        cache = LRUResponseCache()
+        client = AsyncLineClient(
+            http_client=http_client, cache=cache, cache_policy=CachePolicy(stale_while_revalidate=60)
+        )
+
+        first = await client.MetaModes()
+        second = await client.MetaModes()
+        third = await client.MetaModes()
+        assert second is first
+        assert third is first
+        assert len(client._refresh_tasks) == 1
+
+        await asyncio.gather(*client._refresh_tasks.values())
+        refreshed = cache.get("https://api.tfl.gov.uk/Line/Meta/Modes")
+        assert refreshed is not None
+        assert refreshed.response is not first
+        assert len(http_client.urls) == 2
+        assert client._refresh_tasks == {}
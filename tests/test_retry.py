@@ -0,0 +1,286 @@
+"""Tests for retrying transient failures with exponential backoff."""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+from unittest.mock import AsyncMock, Mock, patch
+
+import httpx
+import pytest
+
+from pydantic_tfl_api import AsyncLineClient, LineClient
+from pydantic_tfl_api.core import (
+    ApiError,
+    AsyncHTTPClientBase,
+    AsyncRestClient,
+    HTTPClientBase,
+    ResponseModel,
+    RestClient,
+    RetryPolicy,
+)
+from pydantic_tfl_api.core.retry import categorize_exception, categorize_status, parse_retry_after
+
+from .conftest import make_http_response
+
+MODES_JSON = [{"isTflService": True, "isFarePaying": True, "isScheduledService": True, "modeName": "tube"}]
+
+NO_JITTER = RetryPolicy(jitter=False)
+
+
+@pytest.fixture
+def sleeps() -> Iterator[list[float]]:
+    """Record the delays passed to time.sleep instead of waiting."""
+    recorded: list[float] = []
+    with patch("pydantic_tfl_api.core.rest_client.time.sleep", recorded.append):
+        yield recorded
+
+
+@pytest.fixture
+def async_sleeps() -> Iterator[list[float]]:
+    """Record the delays passed to asyncio.sleep instead of waiting."""
+    recorded: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        recorded.append(delay)
+
+    with patch("pydantic_tfl_api.core.async_rest_client.asyncio.sleep", fake_sleep):
+        yield recorded
+
+
+class TestCategorize:
+    """Tests for mapping failures to ApiError.error_category."""
+
+    @pytest.mark.parametrize(
+        "status_code, expected",
+        [
+            (200, None),
+            (304, None),
+            (401, "authentication"),
+            (403, "authentication"),
+            (404, "client_error"),
+            (408, "timeout"),
+            (429, "rate_limit"),
+            (500, "server_error"),
+            (503, "server_error"),
+            (504, "timeout"),
+        ],
+    )
+    def test_categorize_status(self, status_code: int, expected: str | None) -> None:
+        assert categorize_status(status_code) == expected
+
+    @pytest.mark.parametrize(
+        "exc, expected",
+        [
+            (httpx.ReadTimeout("slow"), "timeout"),
+            (TimeoutError(), "timeout"),
+            (httpx.ConnectError("refused"), "network"),
+            (ConnectionError(), "network"),
+            (ValueError(), "unknown"),
+        ],
+    )
+    def test_categorize_exception(self, exc: Exception, expected: str) -> None:
+        assert categorize_exception(exc) == expected
+
+
+class TestParseRetryAfter:
+    """Tests for parsing the Retry-After header."""
+
+    def test_delay_seconds(self) -> None:
+        assert parse_retry_after("7") == 7.0
+
+    def test_http_date(self) -> None:
+        now = datetime(2024, 1, 15, 12, 0, 0, tzinfo=UTC)
+        assert parse_retry_after(format_datetime(now + timedelta(seconds=5), usegmt=True), now=now) == 5.0
+
+    def test_date_in_the_past_means_no_wait(self) -> None:
+        now = datetime(2024, 1, 15, 12, 0, 0, tzinfo=UTC)
+        assert parse_retry_after(format_datetime(now - timedelta(seconds=5), usegmt=True), now=now) == 0.0
+
+    @pytest.mark.parametrize("value", [None, "", "soon"])
+    def test_missing_or_invalid(self, value: str | None) -> None:
+        assert parse_retry_after(value) is None
+
+
+class TestRetryPolicy:
+    """Tests for RetryPolicy decisions and backoff."""
+
+    def test_backoff_doubles_up_to_max(self) -> None:
+        policy = RetryPolicy(backoff_base=1.0, backoff_max=5.0, jitter=False)
+        assert [policy.backoff(attempt) for attempt in range(4)] == [1.0, 2.0, 4.0, 5.0]
+
+    def test_full_jitter_stays_below_backoff(self) -> None:
+        policy = RetryPolicy(backoff_base=1.0, backoff_max=5.0)
+        assert all(0 <= policy.backoff(2) <= 4.0 for _ in range(50))
+
+    def test_retry_after_overrides_backoff(self) -> None:
+        assert NO_JITTER.backoff(0, retry_after=3.0) == 3.0
+
+    def test_server_errors_retried_up_to_budget(self) -> None:
+        policy = RetryPolicy(server_error=2)
+        assert policy.should_retry_status(503, 0, None)
+        assert policy.should_retry_status(503, 1, None)
+        assert not policy.should_retry_status(503, 2, None)
+
+    @pytest.mark.parametrize("status_code", [400, 401, 404, 500])
+    def test_non_transient_statuses_not_retried(self, status_code: int) -> None:
+        assert not RetryPolicy().should_retry_status(status_code, 0, None)
+
+    def test_429_only_retried_with_retry_after(self) -> None:
+        policy = RetryPolicy()
+        assert not policy.should_retry_status(429, 0, None)
+        assert policy.should_retry_status(429, 0, 1.0)
+
+    def test_retry_after_beyond_max_not_retried(self) -> None:
+        assert not RetryPolicy(max_retry_after=10).should_retry_status(503, 0, 60.0)
+
+    def test_exceptions_use_their_category_budget(self) -> None:
+        policy = RetryPolicy(timeout=1, network=0)
+        assert policy.should_retry_exception(httpx.ReadTimeout("slow"), 0)
+        assert not policy.should_retry_exception(httpx.ReadTimeout("slow"), 1)
+        assert not policy.should_retry_exception(httpx.ConnectError("refused"), 0)
+        assert not policy.should_retry_exception(ValueError(), 0)
+
+
+class TestRestClientRetries:
+    """Tests for the retry loop in RestClient."""
+
+    def test_retries_503_then_succeeds(self, sleeps: list[float]) -> None:
+        http_client = Mock(spec=HTTPClientBase)
+        http_client.get.side_effect = [
+            make_http_response(status_code=503),
+            make_http_response(status_code=503),
+            make_http_response(MODES_JSON),
+        ]
+        client = RestClient(http_client=http_client, retry_policy=NO_JITTER)
+
+        response = client.send_request("https://api.tfl.gov.uk", "/Line/Meta/Modes")
+
+        assert response.status_code == 200
+        assert response.retry_count == 2
+        assert sleeps == [0.5, 1.0]
+
+    def test_returns_last_error_when_retries_exhausted(self, sleeps: list[float]) -> None:
+        http_client = Mock(spec=HTTPClientBase)
+        http_client.get.return_value = make_http_response(status_code=503)
+        client = RestClient(http_client=http_client, retry_policy=RetryPolicy(server_error=2, jitter=False))
+
+        response = client.send_request("https://api.tfl.gov.uk", "/Line/Meta/Modes")
+
+        assert response.status_code == 503
+        assert response.retry_count == 2
+        assert http_client.get.call_count == 3
+
+    def test_waits_for_retry_after(self, sleeps: list[float]) -> None:
+        http_client = Mock(spec=HTTPClientBase)
+        http_client.get.side_effect = [
+            make_http_response(status_code=429, headers={"Retry-After": "4"}),
+            make_http_response(MODES_JSON),
+        ]
+        client = RestClient(http_client=http_client, retry_policy=NO_JITTER)
+
+        assert client.send_request("https://api.tfl.gov.uk", "/Line/Meta/Modes").status_code == 200
+        assert sleeps == [4.0]
+
+    def test_retries_timeout_then_raises(self, sleeps: list[float]) -> None:
+        http_client = Mock(spec=HTTPClientBase)
+        http_client.get.side_effect = httpx.ReadTimeout("slow")
+        client = RestClient(http_client=http_client, retry_policy=RetryPolicy(timeout=1, jitter=False))
+
+        with pytest.raises(httpx.ReadTimeout):
+            client.send_request("https://api.tfl.gov.uk", "/Line/Meta/Modes")
+        assert http_client.get.call_count == 2
+
+    def test_retry_policy_none_sends_once(self, sleeps: list[float]) -> None:
+        http_client = Mock(spec=HTTPClientBase)
+        http_client.get.return_value = make_http_response(status_code=503)
+        client = RestClient(http_client=http_client, retry_policy=None)
+
+        assert client.send_request("https://api.tfl.gov.uk", "/Line/Meta/Modes").retry_count == 0
+        assert http_client.get.call_count == 1
+        assert sleeps == []
+
+    def test_stream_retries_503_then_yields_response(self, sleeps: list[float]) -> None:
+        responses = [make_http_response(status_code=503), make_http_response(MODES_JSON)]
+        closed: list[int] = []
+
+        @contextmanager
+        def stream(url: str, headers: dict[str, str] | None = None, timeout: object = None) -> Iterator[Mock]:
+            response = responses.pop(0)
+            try:
+                yield response
+            finally:
+                closed.append(response.status_code)
+
+        http_client = Mock(spec=HTTPClientBase)
+        http_client.stream = stream
+        client = RestClient(http_client=http_client, retry_policy=NO_JITTER)
+
+        with client.stream("https://api.tfl.gov.uk/Line/Meta/Modes") as response:
+            assert response.status_code == 200
+            assert response.retry_count == 1
+            assert closed == [503]
+
+        assert closed == [503, 200]
+        assert sleeps == [0.5]
+
+
+class TestAsyncRestClientRetries:
+    """Tests for the retry loop in AsyncRestClient."""
+
+    @pytest.mark.asyncio
+    async def test_retries_503_then_succeeds(self, async_sleeps: list[float]) -> None:
+        http_client = Mock(spec=AsyncHTTPClientBase)
+        http_client.get = AsyncMock(side_effect=[make_http_response(status_code=503), make_http_response(MODES_JSON)])
+        client = AsyncRestClient(http_client=http_client, retry_policy=NO_JITTER)
+
+        response = await client.send_request("https://api.tfl.gov.uk", "/Line/Meta/Modes")
+
+        assert response.status_code == 200
+        assert response.retry_count == 1
+        assert async_sleeps == [0.5]
+
+    @pytest.mark.asyncio
+    async def test_retries_connection_error_then_raises(self, async_sleeps: list[float]) -> None:
+        http_client = Mock(spec=AsyncHTTPClientBase)
+        http_client.get = AsyncMock(side_effect=httpx.ConnectError("refused"))
+        client = AsyncRestClient(http_client=http_client, retry_policy=RetryPolicy(network=1, jitter=False))
+
+        with pytest.raises(httpx.ConnectError):
+            await client.send_request("https://api.tfl.gov.uk", "/Line/Meta/Modes")
+        assert http_client.get.await_count == 2
+
+
+class TestApiErrorRetryCount:
+    """Tests that clients report retries on the returned ApiError."""
+
+    def test_client_records_retry_count_and_category(self, sleeps: list[float]) -> None:
+        http_client = Mock(spec=HTTPClientBase)
+        http_client.get.return_value = make_http_response(status_code=503)
+        client = LineClient(http_client=http_client, retry_policy=RetryPolicy(server_error=2, jitter=False))
+
+        result = client.MetaModes()
+
+        assert isinstance(result, ApiError)
+        assert result.retry_count == 2
+        assert result.error_category == "server_error"
+
+    def test_client_returns_model_after_retry(self, sleeps: list[float]) -> None:
+        http_client = Mock(spec=HTTPClientBase)
+        http_client.get.side_effect = [make_http_response(status_code=502), make_http_response(MODES_JSON)]
+        client = LineClient(http_client=http_client, retry_policy=NO_JITTER)
+
+        assert isinstance(client.MetaModes(), ResponseModel)
+
+    @pytest.mark.asyncio
+    async def test_async_client_records_retry_count(self, async_sleeps: list[float]) -> None:
+        http_client = Mock(spec=AsyncHTTPClientBase)
+        http_client.get = AsyncMock(return_value=make_http_response(status_code=429, headers={"Retry-After": "1"}))
+        client = AsyncLineClient(http_client=http_client, retry_policy=RetryPolicy(rate_limit=1, jitter=False))
+
+        result = await client.MetaModes()
+
+        assert isinstance(result, ApiError)
+        assert result.retry_count == 1
+        assert result.error_category == "rate_limit"
+        assert async_sleeps == [1.0]
@@ -0,0 +1,107 @@
+"""Tests for compiled endpoint routes and URL building."""
+
+from typing import Any
+from unittest.mock import Mock
+from urllib.parse import urlencode, urljoin, urlsplit, urlunsplit
+
+import pytest
+
+from pydantic_tfl_api.core import HTTPClientBase, RestClient
+from pydantic_tfl_api.core.routes import Route, build_url, compile_route, encode_query
+from pydantic_tfl_api.endpoints.AccidentStatsClient_config import endpoints as accident_stats_endpoints
+from pydantic_tfl_api.endpoints.LineClient_config import base_url, endpoints
+
+
+def reference_url(base: str, location: str, params: dict[str, Any] | None) -> str:
+    """The URL building used before routes were compiled."""
+    parts = urlsplit(urljoin(base, location))
+    query = urlencode({k: v for k, v in (params or {}).items() if v is not None})
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, query, parts.fragment))
+
+
+class TestEncodeQuery:
+    """Tests that encode_query matches urlencode."""
+
+    @pytest.mark.parametrize(
+        "params",
+        [
+            None,
+            {},
+            {"a": "1", "b": None, "c": "3"},
+            {"detail": True, "severityLevel": "Minor Delays"},
+            {"lat": 51.5, "lon": -0.12, "radius": 200},
+            {"modes": ["tube", "dlr"]},
+            {"query": "King's Cross & St Pancras/=?"},
+            {"raw": b"\xe2\x9c\x93"},
+        ],
+    )
+    def test_matches_urlencode(self, params: dict[str, Any] | None) -> None:
+        expected = urlencode({k: v for k, v in (params or {}).items() if v is not None})
+        assert encode_query(params) == expected
+
+
+class TestRoute:
+    """Tests for compiling endpoint config entries."""
+
+    def test_compiled_once(self) -> None:
+        entry = endpoints["Line_StatusByModeByPathModesQueryDetailQuerySeverityLevel"]
+        assert compile_route(base_url, entry) is compile_route(base_url, dict(entry))
+
+    def test_compiles_operation_timeout(self) -> None:
+        route = compile_route(base_url, accident_stats_endpoints["AccidentStats_Get"])
+        assert route.timeout == {"read": 300.0}
+
+    def test_route_is_immutable(self) -> None:
+        route = compile_route(base_url, endpoints["Line_StatusByModeByPathModesQueryDetailQuerySeverityLevel"])
+        with pytest.raises(AttributeError):
+            route.uri = "/other"  # type: ignore[misc]
+
+    @pytest.mark.parametrize(
+        "params, query",
+        [
+            ((), None),
+            (("tube,dlr",), {"detail": True, "severityLevel": None}),
+            (("a b",), {"q": "x y"}),
+            (("",), None),
+            (("../Meta",), None),
+            (("a?b",), {"q": "1"}),
+            (("a#b",), None),
+            (("//evil.example",), None),
+        ],
+    )
+    def test_url_matches_reference(self, params: tuple[str, ...], query: dict[str, Any] | None) -> None:
+        entry = endpoints["Line_StatusByModeByPathModesQueryDetailQuerySeverityLevel"]
+        route = compile_route(base_url, entry)
+        path = route.path(params) if params else entry["uri"]
+        assert route.url(path, query) == reference_url(base_url, path, query)
+
+    def test_relative_uri_uses_urljoin(self) -> None:
+        route = Route("http://api.tfl.gov.uk/v1/", "Line/{0}", "Model", None, None)
+        assert route.url(route.path(["victoria"])) == "http://api.tfl.gov.uk/v1/Line/victoria"
+
+    def test_build_url_matches_reference(self) -> None:
+        assert build_url("http://api.tfl.gov.uk/", "Line/victoria", {"a": 1}) == reference_url(
+            "http://api.tfl.gov.uk/", "Line/victoria", {"a": 1}
+        )
+
+
+class TestPrebuiltHeaders:
+    """Tests that the prebuilt request headers are not shared between requests."""
+
+    def test_extra_headers_do_not_leak(self) -> None:
+        http_client = Mock(spec=HTTPClientBase)
+        http_client.get.return_value = Mock(status_code=200)
+        client = RestClient("key", http_client=http_client, accept_encoding="gzip")
+
+        client.send("https://api.tfl.gov.uk/Line/Meta/Modes", headers={"If-None-Match": '"abc"'})
+        client.send("https://api.tfl.gov.uk/Line/Meta/Modes")
+
+        first, second = (call.kwargs["headers"] for call in http_client.get.call_args_list)
+        assert first["If-None-Match"] == '"abc"'
+        assert second == {
+            "Content-Type": "application/json",
+            "Accept": "application/json",
+            "Accept-Encoding": "gzip",
+            "app_key": "key",
+        }
+        assert first is not second
@@ -0,0 +1,315 @@
+"""Tests for streaming the items of large array responses."""
+
+import json
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+from pathlib import Path
+from typing import Any
+from unittest.mock import Mock
+
+import pytest
+
+from pydantic_tfl_api import AsyncStopPointClient, LineClient, StopPointClient
+from pydantic_tfl_api.core import (
+    ApiError,
+    AsyncHTTPClientBase,
+    HTTPClientBase,
+    HTTPResponse,
+    Timeout,
+    override_validation,
+)
+from pydantic_tfl_api.core.deserializer import compile_deserializer
+from pydantic_tfl_api.core.model_registry import get_model_registry
+from pydantic_tfl_api.core.streaming import (
+    ArrayItemParser,
+    AsyncItemStream,
+    ItemStream,
+    aiter_array_items,
+    compile_stream_plan,
+    iter_array_items,
+)
+from pydantic_tfl_api.models import Mode, StopPoint, StopPointArray, StopPointsResponse
+
+from .config_for_tests import response_to_request_mapping
+from .conftest import make_http_response
+
+RESPONSES_DIR = Path(__file__).parent / "tfl_responses"
+
+STOP_POINTS: dict[str, Any] = {
+    "centrePoint": [51.5, -0.1],
+    "stopPoints": [
+        {"naptanId": "910GWATFJDC", "commonName": "Watford Junction Rail Station", "lat": 51.66, "lon": -0.39},
+        {"naptanId": "910GBUSHYDP", "commonName": 'Bushey "[Château]" {Rail}', "lat": 51.64, "lon": -0.38},
+    ],
+    "pageSize": 1000,
+    "total": 2,
+    "page": 1,
+}
+
+
+def chunked(content: bytes, size: int) -> Iterator[bytes]:
+    for start in range(0, len(content), size):
+        yield content[start : start + size]
+
+
+def load_fixture_content(name: str) -> bytes:
+    with open(RESPONSES_DIR / f"{name}.json") as f:
+        return json.load(f)["content"].encode()
+
+
+class TestArrayItemParser:
+    """Tests for splitting a JSON document into the items of an array."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 7, 1024])
+    def test_nested_array(self, chunk_size: int) -> None:
+        content = json.dumps(STOP_POINTS, ensure_ascii=False).encode()
+        items = list(iter_array_items(chunked(content, chunk_size), ("stopPoints",)))
+        assert items == STOP_POINTS["stopPoints"]
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 1024])
+    def test_top_level_array(self, chunk_size: int) -> None:
+        content = b' [12, -3.5e2, "a]b", null, {"x": [1, {"y": "}"}]}, [true, false]] '
+        items = list(iter_array_items(chunked(content, chunk_size)))
+        assert items == [12, -350.0, "a]b", None, {"x": [1, {"y": "}"}]}, [True, False]]
+
+    def test_single_object_is_one_item(self) -> None:
+        assert list(iter_array_items(chunked(b'{"id": "a"}', 4))) == [{"id": "a"}]
+
+    @pytest.mark.parametrize("content", [b'{"total": 0}', b'{"stopPoints": null, "total": 0}', b'{"stopPoints": []}'])
+    def test_missing_or_empty_array(self, content: bytes) -> None:
+        assert list(iter_array_items([content], ("stopPoints",))) == []
+
+    def test_truncated_document(self) -> None:
+        with pytest.raises(ValueError, match="incomplete or invalid"):
+            list(iter_array_items([b'[{"id": "a"}, {"id": ']))
+
+    def test_not_an_array(self) -> None:
+        with pytest.raises(ValueError, match="Expected an array"):
+            list(iter_array_items([b'{"stopPoints": 3}'], ("stopPoints",)))
+
+    def test_only_current_items_are_buffered(self) -> None:
+        parser = ArrayItemParser()
+        assert parser.feed(b'[{"id": "a"}, {"id"') == [{"id": "a"}]
+        assert len(parser._buffer) - parser._pos == len(b' {"id"')
+        assert parser.feed(b': "b"}]') == [{"id": "b"}]
+        assert parser.done
+
+    @pytest.mark.asyncio
+    async def test_async(self) -> None:
+        async def chunks() -> AsyncIterator[bytes]:
+            for chunk in chunked(json.dumps(STOP_POINTS).encode(), 5):
+                yield chunk
+
+        items = [item async for item in aiter_array_items(chunks(), ("stopPoints",))]
+        assert items == STOP_POINTS["stopPoints"]
+
+
+class TestCompileStreamPlan:
+    """Tests for finding the array of items in a response model."""
+
+    def test_root_model(self) -> None:
+        plan = compile_stream_plan(StopPointArray)
+        assert plan.path == ()
+        assert plan.item_model is StopPoint
+
+    def test_model_with_array_field(self) -> None:
+        plan = compile_stream_plan(StopPointsResponse)
+        assert plan.path == ("stopPoints",)
+        assert plan.item_model is StopPoint
+
+    def test_model_without_array(self) -> None:
+        with pytest.raises(ValueError, match="cannot be streamed"):
+            compile_stream_plan(Mode)
+
+    @pytest.mark.parametrize("name", sorted(response_to_request_mapping))
+    def test_streamed_items_match_validated_response(self, name: str) -> None:
+        model = get_model_registry()[str(response_to_request_mapping[name]["model"])]
+        try:
+            plan = compile_stream_plan(model)
+        except ValueError:
+            pytest.skip(f"{model.__name__} cannot be streamed")
+        content = load_fixture_content(name)
+        validated = compile_deserializer(model)(content)
+        expected = validated.root if plan.path == () else getattr(validated, plan.path[0]) or []
+        if not isinstance(expected, list):
+            expected = [expected]
+
+        deserializer = compile_deserializer(plan.item_model)
+        items = [deserializer.from_data(item) for item in iter_array_items(chunked(content, 4096), plan.path)]
+
+        assert items == expected
+
+
+class StreamingHTTPClient(HTTPClientBase):
+    """HTTP client streaming a fixed body in small chunks and recording whether it was closed."""
+
+    def __init__(self, content: bytes, status_code: int = 200) -> None:
+        self.content = content
+        self.status_code = status_code
+        self.closed: list[bool] = []
+        self.read = Mock()
+
+    def get(
+        self, url: str, headers: dict[str, str] | None = None, timeout: float | Timeout | None = None
+    ) -> HTTPResponse:
+        raise AssertionError("streamed requests must not read the whole response")
+
+    @contextmanager
+    def stream(
+        self, url: str, headers: dict[str, str] | None = None, timeout: float | Timeout | None = None
+    ) -> Iterator[HTTPResponse]:
+        response = make_http_response(self.content, self.status_code, url=url)
+        response.iter_bytes = lambda: chunked(self.content, 16)
+        response.read = self.read
+        self.closed.append(False)
+        try:
+            yield response
+        finally:
+            self.closed[-1] = True
+
+
+class TestClientStreamItems:
+    """Tests for Client.stream_items."""
+
+    def test_streams_items(self) -> None:
+        http_client = StreamingHTTPClient(json.dumps(STOP_POINTS).encode())
+        client = StopPointClient(http_client=http_client)
+
+        stream = client.stream_items(client.GetByModeByPathModesQueryPage, "overground")
+
+        assert isinstance(stream, ItemStream)
+        assert http_client.closed == [False]
+        stops = list(stream)
+        assert [stop.naptanId for stop in stops] == ["910GWATFJDC", "910GBUSHYDP"]
+        assert all(isinstance(stop, StopPoint) for stop in stops)
+        assert http_client.closed == [True]
+
+    def test_top_level_array(self) -> None:
+        http_client = StreamingHTTPClient(json.dumps(STOP_POINTS["stopPoints"]).encode())
+        client = LineClient(http_client=http_client)
+
+        stream = client.stream_items(
+            client.StopPointsByPathIdQueryTflOperatedNationalRailStationsOnly, "london-overground"
+        )
+
+        assert isinstance(stream, ItemStream)
+        assert [stop.commonName for stop in stream] == [stop["commonName"] for stop in STOP_POINTS["stopPoints"]]
+
+    def test_close_early(self) -> None:
+        http_client = StreamingHTTPClient(json.dumps(STOP_POINTS).encode())
+        client = StopPointClient(http_client=http_client)
+
+        stream = client.stream_items(client.GetByModeByPathModesQueryPage, "overground")
+        assert isinstance(stream, ItemStream)
+        with stream:
+            next(stream)
+
+        assert http_client.closed == [True]
+        assert list(stream) == []
+
+    def test_validation_mode(self) -> None:
+        client = StopPointClient(http_client=StreamingHTTPClient(json.dumps(STOP_POINTS).encode()))
+        with override_validation("raw"):
+            stream = client.stream_items(client.GetByModeByPathModesQueryPage, "overground")
+        assert list(stream) == STOP_POINTS["stopPoints"]
+
+    def test_error_response(self) -> None:
+        http_client = StreamingHTTPClient(b'{"message": "not found"}', status_code=404)
+        client = StopPointClient(http_client=http_client, retry_policy=None)
+
+        result = client.stream_items(client.GetByModeByPathModesQueryPage, "overground")
+
+        assert isinstance(result, ApiError)
+        assert result.http_status_code == 404
+        http_client.read.assert_called_once()
+        assert http_client.closed == [True]
+
+    def test_invalid_item_closes_response(self) -> None:
+        http_client = StreamingHTTPClient(b'[{"naptanId": "a"}, {"naptanId": []}]')
+        client = LineClient(http_client=http_client)
+        stream = client.stream_items(client.StopPointsByPathIdQueryTflOperatedNationalRailStationsOnly, "x")
+
+        assert next(stream).naptanId == "a"
+        with pytest.raises(ValueError):
+            next(stream)
+        assert http_client.closed == [True]
+
+    def test_operation_without_array(self) -> None:
+        client = LineClient(http_client=StreamingHTTPClient(b"[]"))
+        with pytest.raises(ValueError, match="cannot be streamed"):
+            client.stream_items(client.TimetableByPathFromStopPointIdPathId, "940GZZLUASL", "piccadilly")
+
+    def test_backend_without_streaming(self) -> None:
+        response = make_http_response(STOP_POINTS)
+        http_client = Mock(spec=HTTPClientBase)
+        http_client.get.return_value = response
+        http_client.stream = lambda *args, **kwargs: HTTPClientBase.stream(http_client, *args, **kwargs)
+        client = StopPointClient(http_client=http_client)
+
+        stream = client.stream_items(client.GetByModeByPathModesQueryPage, "overground")
+
+        assert len(list(stream)) == 2
+
+    def test_streaming_does_not_affect_other_calls(self) -> None:
+        client = StopPointClient(http_client=StreamingHTTPClient(json.dumps(STOP_POINTS).encode()))
+        client.stream_items(client.GetByModeByPathModesQueryPage, "overground")
+        with pytest.raises(AssertionError, match="must not read the whole response"):
+            client.GetByModeByPathModesQueryPage("overground")
+
+
+class AsyncStreamingHTTPClient(AsyncHTTPClientBase):
+    """Async HTTP client streaming a fixed body in small chunks and recording whether it was closed."""
+
+    def __init__(self, content: bytes) -> None:
+        self.content = content
+        self.closed: list[bool] = []
+
+    async def get(
+        self, url: str, headers: dict[str, str] | None = None, timeout: float | Timeout | None = None
+    ) -> HTTPResponse:
+        raise AssertionError("streamed requests must not read the whole response")
+
+    @asynccontextmanager
+    async def stream(
+        self, url: str, headers: dict[str, str] | None = None, timeout: float | Timeout | None = None
+    ) -> AsyncIterator[HTTPResponse]:
+        async def aiter_bytes() -> AsyncIterator[bytes]:
+            for chunk in chunked(self.content, 16):
+                yield chunk
+
+        response = make_http_response(self.content, url=url)
+        response.aiter_bytes = aiter_bytes
+        self.closed.append(False)
+        try:
+            yield response
+        finally:
+            self.closed[-1] = True
+
+
+class TestAsyncClientStreamItems:
+    """Tests for AsyncClient.stream_items."""
+
+    @pytest.mark.asyncio
+    async def test_streams_items(self) -> None:
+        http_client = AsyncStreamingHTTPClient(json.dumps(STOP_POINTS).encode())
+        client = AsyncStopPointClient(http_client=http_client)
+
+        stream = await client.stream_items(client.GetByModeByPathModesQueryPage, "overground")
+
+        assert isinstance(stream, AsyncItemStream)
+        stops = [stop async for stop in stream]
+        assert [stop.naptanId for stop in stops] == ["910GWATFJDC", "910GBUSHYDP"]
+        assert http_client.closed == [True]
+
+    @pytest.mark.asyncio
+    async def test_close_early(self) -> None:
+        http_client = AsyncStreamingHTTPClient(json.dumps(STOP_POINTS).encode())
+        client = AsyncStopPointClient(http_client=http_client)
+
+        stream = await client.stream_items(client.GetByModeByPathModesQueryPage, "overground")
+        assert isinstance(stream, AsyncItemStream)
+        async with stream:
+            await anext(stream)
+
+        assert http_client.closed == [True]
+        assert [stop async for stop in stream] == []
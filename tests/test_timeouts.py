@@ -0,0 +1,135 @@
+"""Tests for per-call, per-client, per-operation and default timeouts."""
+
+import asyncio
+from collections.abc import Iterator
+from unittest.mock import AsyncMock, Mock
+
+import httpx
+import pytest
+
+from pydantic_tfl_api import AccidentStatsClient, AsyncLineClient, LineClient
+from pydantic_tfl_api.core import (
+    AsyncHTTPClientBase,
+    HTTPClientBase,
+    Timeout,
+    get_default_timeout,
+    override_timeout,
+    set_default_timeout,
+)
+from pydantic_tfl_api.core.http_backends.httpx_client import _httpx_timeout
+from pydantic_tfl_api.core.http_backends.requests_client import _requests_timeout
+from pydantic_tfl_api.core.timeouts import resolve_timeout
+
+from .conftest import make_http_response
+
+
+def sent_timeout(http_client: Mock) -> object:
+    return http_client.get.call_args.kwargs["timeout"]
+
+
+@pytest.fixture
+def default_timeout() -> Iterator[None]:
+    """Restore the process-wide default timeout after the test."""
+    previous = get_default_timeout()
+    yield
+    set_default_timeout(previous)
+
+
+@pytest.fixture
+def http_client() -> Mock:
+    client = Mock(spec=HTTPClientBase)
+    client.get.return_value = make_http_response([])
+    return client
+
+
+class TestTimeout:
+    """Tests for converting and resolving timeouts."""
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            (None, None),
+            (5, Timeout(5, 5, 5, 5)),
+            ({"read": 120.0}, Timeout(read=120.0)),
+            (Timeout(connect=1), Timeout(connect=1)),
+        ],
+    )
+    def test_of(self, value: object, expected: Timeout | None) -> None:
+        assert Timeout.of(value) == expected
+
+    def test_precedence(self, default_timeout: None) -> None:
+        set_default_timeout(10)
+        assert resolve_timeout(None, None) == Timeout(10, 10, 10, 10)
+        assert resolve_timeout(None, {"read": 300.0}) == Timeout(10, 300.0, 10, 10)
+        assert resolve_timeout(Timeout(connect=1, read=5), None) == Timeout(connect=1, read=5)
+        assert resolve_timeout(Timeout(connect=1, read=5), {"read": 300.0}) == Timeout(connect=1, read=300.0)
+        assert resolve_timeout(Timeout(read=5), 60) == Timeout(60, 60, 60, 60)
+        with override_timeout(2):
+            assert resolve_timeout(Timeout(read=5), {"read": 300.0}) == Timeout(2, 2, 2, 2)
+        assert resolve_timeout(None, None) == Timeout(10, 10, 10, 10)
+
+    def test_none_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            set_default_timeout(None)
+
+
+class TestBackendTimeouts:
+    """Tests for passing timeout phases to the HTTP libraries."""
+
+    def test_httpx(self) -> None:
+        assert _httpx_timeout(None) == 30
+        assert _httpx_timeout(5) == 5
+        assert _httpx_timeout(Timeout(connect=1, read=2, write=3, pool=4)) == httpx.Timeout(
+            connect=1, read=2, write=3, pool=4
+        )
+
+    def test_requests_uses_connect_and_read(self) -> None:
+        assert _requests_timeout(None) == 30
+        assert _requests_timeout(Timeout(connect=1, read=2, write=3, pool=4)) == (1, 2)
+
+
+class TestClientTimeouts:
+    """Tests that clients send the resolved timeout with every request."""
+
+    def test_default_timeout(self, http_client: Mock) -> None:
+        LineClient(http_client=http_client).MetaModes()
+        assert sent_timeout(http_client) == Timeout()
+
+    def test_operation_timeout_from_endpoint_config(self, http_client: Mock) -> None:
+        AccidentStatsClient(http_client=http_client).Get(2019)
+        assert sent_timeout(http_client) == Timeout(read=300.0)
+
+    def test_operation_timeout_applies_on_top_of_client_timeout(self, http_client: Mock) -> None:
+        AccidentStatsClient(http_client=http_client, timeout=Timeout(connect=1, read=5)).Get(2019)
+        assert sent_timeout(http_client) == Timeout(connect=1, read=300.0)
+
+    def test_per_call_override_replaces_operation_timeout(self, http_client: Mock) -> None:
+        with override_timeout(Timeout(connect=1, read=60)):
+            AccidentStatsClient(http_client=http_client).Get(2019)
+        assert sent_timeout(http_client) == Timeout(connect=1, read=60)
+
+    def test_global_default(self, http_client: Mock, default_timeout: None) -> None:
+        set_default_timeout(Timeout(connect=1, read=10))
+        LineClient(http_client=http_client).MetaModes()
+        assert sent_timeout(http_client) == Timeout(connect=1, read=10)
+
+    def test_per_call_override(self, http_client: Mock) -> None:
+        client = LineClient(http_client=http_client, timeout=60)
+        with override_timeout(Timeout(connect=0.5, read=2)):
+            client.MetaModes()
+        assert sent_timeout(http_client) == Timeout(connect=0.5, read=2)
+
+    @pytest.mark.asyncio
+    async def test_async_per_call_override_is_scoped_to_task(self) -> None:
+        http_client = Mock(spec=AsyncHTTPClientBase)
+        http_client.get = AsyncMock(return_value=make_http_response([]))
+        client = AsyncLineClient(http_client=http_client, coalesce_requests=False)
+
+        async def call_with_override() -> None:
+            with override_timeout(2):
+                await client.MetaModes()
+
+        await asyncio.gather(call_with_override(), client.MetaModes())
+
+        timeouts = [call.kwargs["timeout"] for call in http_client.get.await_args_list]
+        assert sorted(timeouts, key=lambda timeout: timeout.read) == [Timeout(2, 2, 2, 2), Timeout()]